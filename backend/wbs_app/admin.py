@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, Task, TaskComment
+from .models import User, Task, TaskComment, TaskDependency
 
 
 @admin.register(User)
@@ -68,3 +68,17 @@ class TaskCommentAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         """쿼리셋 최적화"""
         return super().get_queryset(request).select_related('task', 'author')
+
+
+@admin.register(TaskDependency)
+class TaskDependencyAdmin(admin.ModelAdmin):
+    """작업 선후행 관계 관리자 설정"""
+    list_display = ['predecessor', 'successor', 'dependency_type', 'lag', 'created_at']
+    list_filter = ['dependency_type']
+    search_fields = ['predecessor__title', 'successor__title']
+    raw_id_fields = ['predecessor', 'successor']
+    readonly_fields = ['created_at']
+    
+    def get_queryset(self, request):
+        """쿼리셋 최적화"""
+        return super().get_queryset(request).select_related('predecessor', 'successor')
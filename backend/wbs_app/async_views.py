@@ -0,0 +1,133 @@
+"""
+읽기 전용 비동기 API (ASGI)
+
+간트 차트, 타임라인, 대시보드, 작업 목록의 비동기 버전입니다. 응답 본문은 동기 API와 같습니다.
+- 버전/동기화 토큰/페이지 같은 단일 조회는 Django 비동기 ORM으로 실행합니다.
+- 서로 독립적인 조회(작업 트리와 일정, 대시보드 집계 등)는 read_concurrently로
+  각자의 DB 연결에서 동시에 실행합니다.
+
+Django 4.2의 비동기 ORM은 내부적으로 요청별 DB 스레드에서 동기 쿼리를 실행하므로,
+이득은 DB를 기다리는 동안 이벤트 루프가 다른 요청을 처리하는 데서 나옵니다.
+ASGI 서버(uvicorn, daphne 등)에서 실행해야 하며, WSGI에서도 동작하지만 요청마다 이벤트 루프를 만듭니다.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from .cache import aget_dashboard
+from .dashboard import abuild_dashboard
+from .models import Task
+from .pagination import TaskKeysetPagination, astreaming_list_response, wants_stream
+from .renderers import render_json
+from .serializers import GanttChartSerializer, TaskSerializer, TaskSyncSerializer, TaskWindowSerializer
+from .sync import encode_token
+from .timeline import abuild_timeline
+from .tree import build_subtrees, build_task_tree
+from .utils import async_data_version_condition
+
+
+def json_response(data, status=200, headers=None):
+    return HttpResponse(render_json(data), status=status, content_type='application/json', headers=headers)
+
+
+def async_api_view(view):
+    """
+    GET 전용 비동기 함수 뷰 데코레이터입니다.
+    APIView와 같이 DRF 기본 인증 클래스로 인증하고 로그인한 사용자만 허용하며,
+    APIException(검증 오류 등)은 같은 형식의 JSON 응답으로 바꿉니다.
+    뷰에는 DRF Request가 전달됩니다.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        authenticators = [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+        request = Request(request, authenticators=authenticators)
+        try:
+            if request.method != 'GET':
+                raise exceptions.MethodNotAllowed(request.method)
+            if not await sync_to_async(lambda: request.user.is_authenticated)():
+                raise exceptions.NotAuthenticated()
+            return await view(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return exception_response(request, exc, authenticators)
+    return wrapper
+
+
+def exception_response(request, exc, authenticators):
+    """APIView.handle_exception과 같은 상태 코드와 본문"""
+    headers = {}
+    if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        # 첫 번째 인증 클래스가 WWW-Authenticate 헤더를 주지 않으면 (세션 인증) 403입니다.
+        header = authenticators[0].authenticate_header(request) if authenticators else None
+        if header:
+            headers['WWW-Authenticate'] = header
+        else:
+            exc.status_code = 403
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    return json_response(data, status=exc.status_code, headers=headers)
+
+
+async def task_window(request):
+    """?start=&end=&root= 조회 구간 (root 확인에 조회 1회)"""
+    window = TaskWindowSerializer(data=request.query_params)
+    await sync_to_async(window.is_valid)(raise_exception=True)
+    return window.validated_data
+
+
+@async_api_view
+@async_data_version_condition
+async def gantt_chart(request):
+    """간트 차트 데이터 조회 (GET /api/tasks/gantt_chart/ 와 같은 응답)"""
+    context = dict(
+        TaskSerializer.field_options(request.query_params), request=request,
+        task_window=await task_window(request), data_version=request.data_version
+    )
+    serializer = GanttChartSerializer(Task.objects.all(), context=context)
+    return json_response(await serializer.ato_representation(serializer.instance))
+
+
+@async_api_view
+@async_data_version_condition
+async def timeline(request):
+    """프로젝트 타임라인 데이터 조회 (GET /api/timeline/ 와 같은 응답)"""
+    return json_response(await abuild_timeline(**await task_window(request)))
+
+
+@async_api_view
+@async_data_version_condition
+async def dashboard(request):
+    """대시보드 통계 데이터 조회 (GET /api/dashboard/ 와 같은 응답)"""
+    return json_response(await aget_dashboard(abuild_dashboard, request.data_version))
+
+
+@async_api_view
+@async_data_version_condition
+async def task_list(request):
+    """
+    작업 목록 조회 (GET /api/tasks/ 와 같은 응답)
+    - ?page_size=N / ?cursor=... : 키셋 페이지네이션 (각 작업의 하위 작업 트리 포함)
+    - ?stream=1 : 하위 작업/댓글 없이 평면 목록을 스트리밍
+    """
+    # 목록보다 먼저 읽은 데이터 버전이 토큰이어야 조회 중 발생한 변경을 놓치지 않습니다.
+    sync_token = encode_token(request.data_version)
+    tasks = Task.objects.all().order_by('start_date', 'title', 'id')
+    context = dict(TaskSerializer.field_options(request.query_params), request=request)
+
+    if wants_stream(request):
+        tasks = tasks.select_related('parent_task', 'created_by').prefetch_related('assigned_to')
+        response = astreaming_list_response(tasks, TaskSyncSerializer, context)
+        response['X-Sync-Token'] = sync_token
+        return response
+
+    paginator = TaskKeysetPagination()
+    page = await paginator.apaginate_queryset(tasks, request)
+    if page is not None:
+        data = await sync_to_async(build_subtrees)(page, context=context)
+        return json_response(paginator.get_paginated_response(data).data, headers={'X-Sync-Token': sync_token})
+
+    task_ids = [task_id async for task_id in tasks.values_list('id', flat=True)]
+    data = await sync_to_async(build_task_tree)(tasks, root_ids=task_ids, context=context)
+    return json_response(data, headers={'X-Sync-Token': sync_token})
@@ -0,0 +1,178 @@
+"""
+작업 일괄 생성/수정/삭제
+
+모든 작업을 먼저 검증한 뒤 하나의 트랜잭션에서
+bulk_create/bulk_update와 담당자 연결 테이블 일괄 저장으로 반영합니다.
+영향을 받은 상위 작업의 날짜는 커밋 후 롤업 엔진이 작업마다 한 번만 다시 계산합니다.
+"""
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .cache import invalidate_branches
+from .models import Task
+from .serializers import TaskCreateSerializer, TaskUpdateSerializer
+from .rollup import mark_dirty
+from .signals import tasks_bulk_saved
+
+
+def validate_operations(operations):
+    """
+    모든 작업을 검증합니다.
+    하나라도 실패하면 작업 순번별 오류를 담아 ValidationError를 발생시킵니다.
+
+    반환: (생성할 데이터 목록, (작업, 수정할 데이터) 목록, 삭제할 작업 ID 목록)
+    """
+    target_ids = {operation['id'] for operation in operations if operation['op'] != 'create'}
+    instances = Task.objects.in_bulk(target_ids)
+
+    creates, updates, deletes = [], [], []
+    update_indexes = []
+    errors = {}
+    for index, operation in enumerate(operations):
+        op = operation['op']
+        if op != 'create' and operation['id'] not in instances:
+            errors[index] = {'id': ['존재하지 않는 작업입니다.']}
+            continue
+
+        if op == 'delete':
+            deletes.append(operation['id'])
+            continue
+
+        if op == 'create':
+            serializer = TaskCreateSerializer(data=operation.get('data', {}))
+        else:
+            serializer = TaskUpdateSerializer(instances[operation['id']], data=operation.get('data', {}), partial=True)
+
+        if not serializer.is_valid():
+            errors[index] = serializer.errors
+        elif op == 'create':
+            creates.append(serializer.validated_data)
+        else:
+            updates.append((serializer.instance, serializer.validated_data))
+            update_indexes.append(index)
+
+    for index in _parent_cycles(updates, update_indexes):
+        errors[index] = {'parent_task': ['같은 요청의 다른 수정과 함께 상위 작업 관계에 순환이 생깁니다.']}
+
+    if errors:
+        raise serializers.ValidationError({'operations': errors})
+    return creates, updates, deletes
+
+
+def _parent_cycles(updates, indexes):
+    """
+    요청의 모든 상위 작업 변경을 반영한 뒤에 순환이 생기는 수정의 순번 목록
+    개별 수정은 DB 기준으로만 검증되므로, 한 요청 안의 A→B, B→A 같은 순환은 여기서 찾습니다.
+    """
+    new_parents = {task.pk: data['parent_task'] for task, data in updates if 'parent_task' in data}
+
+    def lineage(node):
+        """node와 요청 반영 후의 상위 작업 ID (가까운 순서, 옮겨지는 작업은 새 상위 작업으로 이어짐)"""
+        seen = set()
+        while node is not None:
+            for task_id in [node.pk] + node.ancestor_ids[::-1]:
+                if task_id in seen:
+                    return
+                seen.add(task_id)
+                yield task_id
+                if task_id in new_parents:
+                    node = new_parents[task_id]
+                    break
+            else:
+                return
+
+    return [
+        index for (task, data), index in zip(updates, indexes)
+        if task.pk in new_parents and task.pk in lineage(new_parents[task.pk])
+    ]
+
+
+def _replace_assignees(assignments):
+    """담당자 연결 테이블을 작업별로 통째로 교체합니다. assignments: {작업 ID: 사용자 목록}"""
+    if not assignments:
+        return
+    Through = Task.assigned_to.through
+    Through.objects.filter(task_id__in=assignments.keys()).delete()
+    Through.objects.bulk_create([
+        Through(task_id=task_id, user_id=user.pk)
+        for task_id, users in assignments.items()
+        for user in users
+    ])
+
+
+@transaction.atomic
+def apply_operations(operations, user):
+    """
+    검증을 마친 작업 목록을 하나의 트랜잭션에서 반영합니다.
+    반환: {'created': [...], 'updated': [...], 'deleted': [...]} (작업 ID 목록)
+    """
+    creates, updates, deletes = validate_operations(operations)
+
+    dirty_parents = set()
+
+    # 생성
+    new_tasks, assignments = [], {}
+    for data in creates:
+        data = dict(data)
+        assignees = data.pop('assigned_to', [])
+        task = Task(created_by=user, **data)
+        if not task.parent_task and task.color == '#':
+            task.color = task.generate_random_color()
+        task.apply_leaf_rollups()
+        new_tasks.append((task, assignees))
+    Task.objects.bulk_create([task for task, _ in new_tasks])
+
+    parent_paths = dict(
+        Task.objects.filter(pk__in={task.parent_task_id for task, _ in new_tasks if task.parent_task_id})
+        .values_list('id', 'path')
+    )
+    for task, assignees in new_tasks:
+        task.path = f'{parent_paths.get(task.parent_task_id, "")}{task.pk}/'
+        task.depth = task.path.count('/') - 1
+        assignments[task.pk] = assignees
+        dirty_parents.add(task.parent_task_id)
+    Task.objects.bulk_update([task for task, _ in new_tasks], ['path', 'depth'])
+
+    # 수정
+    now = timezone.now()
+    updated_fields = {'updated_at'}
+    reparented = []
+    for task, data in updates:
+        data = dict(data)
+        if 'assigned_to' in data:
+            assignments[task.pk] = data.pop('assigned_to')
+        if 'parent_task' in data and data['parent_task'] != task.parent_task:
+            dirty_parents.add(task.parent_task_id)
+            reparented.append(task)
+        for field, value in data.items():
+            setattr(task, field, value)
+        if not task.subtask_count:
+            task.apply_leaf_rollups()
+            updated_fields.update(Task.LEAF_ROLLUP_FIELDS)
+        task.updated_at = now
+        updated_fields.update(data)
+        dirty_parents.add(task.parent_task_id)
+    if updates:
+        Task.objects.bulk_update([task for task, _ in updates], list(updated_fields))
+    for task in reparented:
+        # 앞서 옮긴 상위 작업과 함께 경로가 이미 바뀌었을 수 있으므로 DB의 현재 경로에서 옮깁니다.
+        task.path, task.depth = Task.objects.filter(pk=task.pk).values_list('path', 'depth').get()
+        task.refresh_path()
+
+    _replace_assignees(assignments)
+
+    # 삭제 (CASCADE와 삭제 시그널은 그대로 동작합니다)
+    if deletes:
+        Task.objects.filter(pk__in=deletes).delete()
+
+    mark_dirty(*dirty_parents)
+
+    # 하위 작업 응답에 포함된 상위 작업 제목(parent_task_title)도 갱신되도록 합니다.
+    invalidate_branches(renamed=[task.pk for task, data in updates if 'title' in data])
+    tasks_bulk_saved([task for task, _ in new_tasks] + [task for task, _ in updates])
+    return {
+        'created': [task.pk for task, _ in new_tasks],
+        'updated': [task.pk for task, _ in updates],
+        'deleted': deletes,
+    }
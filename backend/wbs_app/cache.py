@@ -0,0 +1,204 @@
+"""
+WBS 캐시 키와 무효화 함수
+
+Django 캐시 프레임워크(기본 LocMem, settings.CACHES)를 사용합니다.
+무효화는 signals.py의 모델 시그널에서 호출됩니다.
+
+간트 차트 조각 캐시
+- 작업마다 그 작업과 하위 작업 전체를 렌더링한 JSON 조각을 (작업 ID, 가지 버전) 키로 저장합니다.
+- 작업/댓글/담당자가 바뀌면 커밋 후 그 작업과 모든 상위 작업(가지)의 버전만 새로 발급하므로,
+  다른 가지의 조각은 그대로 재사용됩니다.
+- 사용자 이름처럼 여러 가지에 걸친 값이 바뀌면 세대(namespace)를 바꿔 전체를 무효화합니다.
+- 버전은 조각의 원본 데이터를 읽기 전에 읽으므로, 변경과 겹친 요청의 조각은 이전 버전 키로만 저장됩니다.
+- 읽기 복제본에서 읽은 경우 복제본이 주 DB를 따라잡았을 때만 저장합니다 (routers.replica_caught_up).
+- 가지 버전은 무효화한 프로세스의 캐시에만 새로 발급되므로, 조각 캐시(WBS_GANTT_FRAGMENT_CACHE)는
+  모든 워커가 공유하는 캐시 백엔드에서만 켤 수 있습니다 (check_fragment_cache).
+"""
+import hashlib
+import os
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.checks import Error, Tags, register
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+
+from .routers import replica_caught_up
+
+DASHBOARD_CACHE_KEY = 'wbs:dashboard'
+GANTT_NAMESPACE_KEY = 'wbs:gantt:namespace'
+# 한 번에 무효화할 작업이 이보다 많으면 가지별로 찾지 않고 조각 전체를 무효화합니다.
+BRANCH_INVALIDATION_LIMIT = 500
+
+# 프로세스마다 따로 있는 캐시 백엔드
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+_state = threading.local()
+
+
+def fragments_enabled():
+    """간트 조각 캐시 사용 여부"""
+    return getattr(settings, 'WBS_GANTT_FRAGMENT_CACHE', False)
+
+
+@register(Tags.caches)
+def check_fragment_cache(app_configs, **kwargs):
+    """조각 캐시를 켰다면 기본 캐시가 프로세스 간에 공유되어야 합니다."""
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if fragments_enabled() and backend in PROCESS_LOCAL_CACHES:
+        return [Error(
+            f'WBS_GANTT_FRAGMENT_CACHE는 프로세스 간에 공유되는 캐시가 필요합니다 (현재 {backend}).',
+            hint='WBS_CACHE_DIR로 파일 캐시를 쓰거나 공유 캐시 백엔드를 설정하세요. '
+                 '다른 워커가 무효화를 보지 못해 오래된 간트 조각을 응답합니다.',
+            id='wbs_app.E001',
+        )]
+    return []
+
+
+def get_dashboard(build, version=None):
+    """
+    캐시된 대시보드 데이터를 반환하고, 없으면 build()로 만들어 저장합니다.
+    version: 요청 시작 시 읽은 데이터 버전 (복제본에서 읽었으면 따라잡았는지 확인에 사용)
+    """
+    data = cache.get(DASHBOARD_CACHE_KEY)
+    if data is None:
+        data = build()
+        if replica_caught_up(version):
+            cache.set(DASHBOARD_CACHE_KEY, data, getattr(settings, 'WBS_DASHBOARD_CACHE_TIMEOUT', 30))
+    return data
+
+
+async def aget_dashboard(build, version=None):
+    """get_dashboard()의 비동기 버전 (build는 코루틴 함수)"""
+    data = await cache.aget(DASHBOARD_CACHE_KEY)
+    if data is None:
+        data = await build()
+        if await sync_to_async(replica_caught_up)(version):
+            await cache.aset(DASHBOARD_CACHE_KEY, data, getattr(settings, 'WBS_DASHBOARD_CACHE_TIMEOUT', 30))
+    return data
+
+
+def invalidate_dashboard():
+    """대시보드 캐시를 비웁니다."""
+    cache.delete(DASHBOARD_CACHE_KEY)
+
+
+def get_schedule(version, build):
+    """
+    데이터 버전별로 캐시된 일정 계산 결과를 반환하고, 없으면 build()로 만들어 저장합니다.
+    버전이 바뀌면 키가 달라지므로 따로 무효화하지 않습니다.
+    """
+    key = f'wbs:schedule:{version}'
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, getattr(settings, 'WBS_SCHEDULE_CACHE_TIMEOUT', 300))
+    return data
+
+
+def _new_version():
+    # 키 검사 비용이 키 길이에 비례하므로 짧게 만듭니다 (48비트).
+    return os.urandom(6).hex()
+
+
+def _get_or_add(key):
+    """키의 값을 반환하고, 없으면 새 버전을 만들어 저장합니다 (동시에 만든 경우 먼저 저장된 값)."""
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def _branch_key(task_id):
+    return f'wbs:b:{task_id}'
+
+
+def branch_versions(task_ids):
+    """작업별 가지 버전 {작업 ID: 버전}, 없으면 새로 발급합니다."""
+    keys = {_branch_key(task_id): task_id for task_id in task_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+    # 새 버전으로 덮어써도 그 뒤에 읽은 데이터로만 조각이 만들어지므로 add 대신 한 번에 저장합니다.
+    missing = {key: _new_version() for key, task_id in keys.items() if task_id not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update((keys[key], version) for key, version in missing.items())
+    return versions
+
+
+def fragment_prefix(fields=None):
+    """간트 조각 키 접두어 (현재 세대와 출력 필드 조합별)"""
+    variant = 'all' if fields is None else hashlib.md5(','.join(sorted(fields)).encode()).hexdigest()[:8]
+    return f'wbs:g:{_get_or_add(GANTT_NAMESPACE_KEY)}:{variant}'
+
+
+def get_fragments(prefix, versions):
+    """캐시된 조각 {작업 ID: JSON 바이트}. versions: {작업 ID: 가지 버전}"""
+    keys = {f'{prefix}:{task_id}:{version}': task_id for task_id, version in versions.items()}
+    return {keys[key]: fragment for key, fragment in cache.get_many(keys).items()}
+
+
+def set_fragments(prefix, versions, fragments):
+    """조각을 읽기 전에 받은 가지 버전 키로 저장합니다."""
+    cache.set_many(
+        {f'{prefix}:{task_id}:{versions[task_id]}': fragment for task_id, fragment in fragments.items()},
+        getattr(settings, 'WBS_GANTT_CACHE_TIMEOUT', 3600)
+    )
+
+
+def invalidate_fragments():
+    """세대를 바꿔 간트 조각 전체를 무효화합니다."""
+    cache.set(GANTT_NAMESPACE_KEY, _new_version(), None)
+
+
+def invalidate_branches(*task_ids, renamed=()):
+    """
+    작업들이 속한 가지(자신과 모든 상위 작업)의 간트 조각을 현재 트랜잭션 커밋 후 무효화합니다.
+    renamed: 제목이 바뀌었을 수 있는 작업 (하위 작업 조각의 parent_task_title도 무효화)
+    """
+    task_ids = {task_id for task_id in task_ids + tuple(renamed) if task_id}
+    if not task_ids or not fragments_enabled():
+        return
+    pending = getattr(_state, 'branches', None)
+    if pending is None:
+        pending = _state.branches = (set(), set())
+    pending[0].update(task_ids)
+    pending[1].update(renamed)
+    # 롤업 엔진(rollup.mark_dirty)과 같이 매번 등록하고, 먼저 실행된 콜백이 모두 처리합니다.
+    transaction.on_commit(lambda: _flush_branches(pending))
+
+
+def _flush_branches(pending):
+    from .models import Task
+
+    if getattr(_state, 'branches', None) is pending:
+        _state.branches = None
+    task_ids, renamed = set(pending[0]), set(pending[1])
+    pending[0].clear()
+    pending[1].clear()
+    if not task_ids:
+        return
+    if len(task_ids) > BRANCH_INVALIDATION_LIMIT:
+        invalidate_fragments()
+        return
+
+    branch_ids = set()
+    if renamed:
+        branch_ids.update(Task.objects.filter(parent_task__in=renamed).values_list('id', flat=True))
+    for path in Task.objects.filter(pk__in=task_ids).values_list('path', flat=True):
+        branch_ids.update(int(task_id) for task_id in path.split('/')[:-1])
+    cache.set_many({_branch_key(task_id): _new_version() for task_id in branch_ids}, None)
+
+
+@receiver(setting_changed)
+def reset_fragments(setting, **kwargs):
+    """휴일 설정이 바뀌면 업무일 수(total_duration)가 달라지므로 조각 전체를 무효화합니다."""
+    if setting in ('WBS_HOLIDAYS', 'WBS_HOLIDAY_SETS'):
+        invalidate_fragments()
@@ -0,0 +1,65 @@
+"""
+대시보드 통계
+
+상태별 작업 수, 사용자별 담당 작업 수, 최근 작업 트리는 서로 독립적인 조회이므로
+비동기 뷰(async_views.py)에서는 동시에 실행합니다.
+"""
+from django.db.models import Count
+
+from .models import Task, User
+from .tree import build_subtrees
+from .utils import read_concurrently
+
+
+def status_counts():
+    """상태별 작업 수 (집계 1회)"""
+    return dict(Task.objects.order_by().values_list('status').annotate(count=Count('id')))
+
+
+def user_task_counts():
+    """사용자별 작업 수 (담당자 연결 테이블 기준, 집계 1회)"""
+    users = User.objects.annotate(task_count=Count('assigned_tasks')).order_by('id')
+    return [
+        {
+            'user_id': user.id,
+            'username': user.username,
+            'name': user.name,
+            'task_count': user.task_count
+        }
+        for user in users
+    ]
+
+
+def recent_tasks():
+    """최근 작업 5개 (하위 작업 트리 포함)"""
+    return build_subtrees(list(Task.objects.order_by('-created_at')[:5]))
+
+
+def assemble_dashboard(counts, user_counts, recent):
+    total_tasks = sum(counts.values())
+    completed_tasks = counts.get('completed', 0)
+
+    # 프로젝트 진행률 계산
+    project_progress = 0
+    if total_tasks > 0:
+        project_progress = (completed_tasks / total_tasks) * 100
+
+    return {
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': counts.get('in_progress', 0),
+        'not_started_tasks': counts.get('not_started', 0),
+        'project_progress': round(project_progress, 1),
+        'user_task_counts': user_counts,
+        'recent_tasks': recent
+    }
+
+
+def build_dashboard():
+    """대시보드 통계 데이터 생성"""
+    return assemble_dashboard(status_counts(), user_task_counts(), recent_tasks())
+
+
+async def abuild_dashboard():
+    """build_dashboard()의 비동기 버전 (세 조회를 동시에 실행)"""
+    return assemble_dashboard(*await read_concurrently(status_counts, user_task_counts, recent_tasks))
@@ -0,0 +1,282 @@
+"""
+실시간 변경 알림 (Server-Sent Events)
+
+모델 시그널에서 발생한 작업/댓글 변경을 구독 중인 클라이언트에 밀어 줍니다.
+- 이벤트 계층은 WBS_EVENT_LAYER 설정으로 교체할 수 있으며,
+  기본값은 Redis 없이 동작하는 프로세스 내 메모리 계층입니다.
+  메모리 계층은 같은 프로세스에서 일어난 변경만 전달하므로, 워커가 여럿이면
+  변경 로그(ChangeLog)를 버전 순서로 폴링하는 ChangeLogEventLayer를 씁니다.
+- 이벤트는 프로젝트(최상위 작업) 단위 그룹으로 전달됩니다.
+- 짧은 시간 안에 몰린 변경은 객체별로 합쳐 한 번에 전송합니다.
+
+ASGI 서버(uvicorn, daphne 등)에서만 제공합니다. WSGI(runserver 포함)는 비동기 스트림을 끝까지 모은 뒤
+보내므로 끝나지 않는 스트림에서 요청이 멈추고 작업자를 계속 점유해, 이 경우 501을 반환합니다.
+"""
+import asyncio
+import json
+import logging
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseForbidden, StreamingHttpResponse
+from django.utils.module_loading import import_string
+
+from .models import DataVersion, Task, TaskComment
+from .sync import read_logs
+
+logger = logging.getLogger(__name__)
+
+ALL_PROJECTS = '*'
+
+
+class Subscription:
+    """구독자 한 명의 이벤트 큐"""
+
+    def __init__(self, layer, group, loop, max_size=1000):
+        self.layer = layer
+        self.group = group
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_size)
+        self.overflowed = False
+
+    def deliver(self, event):
+        """이벤트 루프 스레드에서 호출됩니다."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # 따라잡을 수 없을 만큼 밀리면 전체 재동기화를 요청합니다.
+            self.overflowed = True
+
+    async def collect(self, first, window):
+        """
+        window(초) 동안 추가로 모인 이벤트를 첫 이벤트와 함께 객체별로 합쳐 반환합니다.
+        """
+        await asyncio.sleep(window)
+        batch = {(first['model'], first['id']): first}
+        while not self.queue.empty():
+            event = self.queue.get_nowait()
+            batch[(event['model'], event['id'])] = event
+        return list(batch.values())
+
+    def close(self):
+        self.layer.unsubscribe(self)
+
+
+class InMemoryEventLayer:
+    """프로세스 내 메모리 이벤트 계층 (로컬 개발/테스트용)"""
+
+    def __init__(self):
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, group=ALL_PROJECTS):
+        """현재 이벤트 루프에 구독자를 등록합니다."""
+        subscription = Subscription(self, group, asyncio.get_running_loop())
+        with self._lock:
+            self._groups.setdefault(group, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._groups.get(subscription.group)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._groups[subscription.group]
+
+    def publish(self, group, event):
+        """
+        그룹과 전체 구독자에게 이벤트를 보냅니다.
+        시그널이 실행되는 어느 스레드에서든 호출할 수 있습니다.
+        """
+        with self._lock:
+            targets = set(self._groups.get(group, ())) | set(self._groups.get(ALL_PROJECTS, ()))
+        self._deliver(targets, event)
+
+    def _deliver(self, targets, event):
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자
+                self.unsubscribe(subscription)
+
+
+class ChangeLogEventLayer(InMemoryEventLayer):
+    """
+    변경 로그 폴링 이벤트 계층 (여러 프로세스/서버용)
+
+    작업/댓글 변경은 어느 워커에서 일어났든 변경 로그에 남으므로, 구독자가 있는 동안
+    백그라운드 스레드가 WBS_EVENT_POLL_SECONDS마다 마지막으로 읽은 버전 이후의 로그를 읽어
+    이 프로세스의 구독자에게 보냅니다. 지연은 폴링 간격만큼 늘어납니다.
+    - 삭제된 객체는 프로젝트를 알 수 없어 모든 구독자에게 보냅니다.
+    - 변경 로그가 없는 선후행 관계 이벤트는 같은 프로세스의 구독자에게만 전달됩니다.
+    """
+
+    def __init__(self, interval=None, limit=1000):
+        super().__init__()
+        self.interval = getattr(settings, 'WBS_EVENT_POLL_SECONDS', 1) if interval is None else interval
+        self.limit = limit
+        self.version = None
+        self._thread = None
+
+    def subscribe(self, group=ALL_PROJECTS):
+        subscription = super().subscribe(group)
+        # interval이 0이면 폴링 스레드 없이 poll()을 직접 호출합니다 (테스트용).
+        if self.interval > 0:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='wbs-event-poller', daemon=True)
+                    self._thread.start()
+        return subscription
+
+    def publish(self, group, event):
+        """작업/댓글 변경은 변경 로그에서 읽어 보내므로 여기서는 나머지만 보냅니다."""
+        if event['model'] not in ('task', 'comment'):
+            super().publish(group, event)
+
+    def _run(self):
+        try:
+            while True:
+                with self._lock:
+                    if not self._groups:
+                        # 구독자가 다시 생기면 그 시점부터 읽습니다.
+                        self._thread = None
+                        self.version = None
+                        return
+                try:
+                    self.poll()
+                except DatabaseError:
+                    logger.exception('변경 로그를 읽지 못했습니다.')
+                    connection.close()
+                time.sleep(self.interval)
+        finally:
+            connection.close()
+
+    def poll(self):
+        """
+        마지막으로 읽은 버전 이후의 변경을 구독자에게 보냅니다. 처음 호출하면 현재 버전부터 시작합니다.
+        반환: 보낸 이벤트 수
+        """
+        if self.version is None:
+            self.version = DataVersion.current().version
+            return 0
+        logs, has_more = read_logs(self.version, self.limit)
+        while has_more:
+            more, has_more = read_logs(logs[-1][0], self.limit)
+            logs += more
+        if not logs:
+            return 0
+
+        latest = {}
+        for _, model, object_id, action in logs:
+            latest[(model, object_id)] = action
+        ids = {'task': [], 'comment': []}
+        for (model, object_id), action in latest.items():
+            if action != 'delete':
+                ids[model].append(object_id)
+        paths = {
+            ('task', pk): path
+            for pk, path in Task.objects.filter(pk__in=ids['task']).values_list('pk', 'path')
+        }
+        paths.update(
+            (('comment', pk), path)
+            for pk, path in TaskComment.objects.filter(pk__in=ids['comment']).values_list('pk', 'task__path')
+        )
+
+        for (model, object_id), action in latest.items():
+            key = (model, object_id)
+            if action != 'delete' and key not in paths:
+                # 읽은 범위 이후에 삭제된 객체
+                action = 'delete'
+            project = project_of(paths.get(key))
+            event = {'model': model, 'id': object_id, 'action': action, 'project': int(project) if project else None}
+            if project:
+                super().publish(project, event)
+            else:
+                with self._lock:
+                    targets = set().union(*self._groups.values())
+                self._deliver(targets, event)
+        self.version = logs[-1][0]
+        return len(latest)
+
+
+_layer = None
+_layer_lock = threading.Lock()
+
+
+def get_event_layer():
+    """설정된 이벤트 계층 인스턴스를 반환합니다."""
+    global _layer
+    with _layer_lock:
+        if _layer is None:
+            layer_class = import_string(getattr(settings, 'WBS_EVENT_LAYER', 'wbs_app.events.InMemoryEventLayer'))
+            _layer = layer_class()
+        return _layer
+
+
+def project_of(task_path):
+    """작업 경로에서 프로젝트(최상위 작업) ID를 구합니다."""
+    return task_path.split('/', 1)[0] if task_path else None
+
+
+def publish_change(model, object_id, action, project):
+    """변경 이벤트를 트랜잭션 커밋 후에 발행합니다."""
+    event = {'model': model, 'id': object_id, 'action': action, 'project': int(project) if project else None}
+    layer = get_event_layer()
+    transaction.on_commit(lambda: layer.publish(project or ALL_PROJECTS, event))
+
+
+def format_sse(event_name, data):
+    return f'event: {event_name}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
+
+
+async def event_stream(subscription, window, heartbeat):
+    """SSE 메시지 스트림. 연결이 끊기면 구독을 해제합니다."""
+    try:
+        yield 'retry: 3000\n\n'
+        while True:
+            try:
+                first = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            batch = await subscription.collect(first, window)
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield format_sse('resync', {})
+            yield format_sse('changes', batch)
+    finally:
+        subscription.close()
+
+
+async def task_events(request):
+    """
+    작업/댓글 변경 이벤트 스트림
+    ?project=<최상위 작업 ID>로 특정 프로젝트만 구독할 수 있습니다.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(
+            '실시간 변경 알림은 ASGI 서버(uvicorn, daphne 등)에서만 사용할 수 있습니다.',
+            status=501, content_type='text/plain; charset=utf-8'
+        )
+
+    is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
+    if not is_authenticated:
+        return HttpResponseForbidden()
+
+    subscription = get_event_layer().subscribe(request.GET.get('project') or ALL_PROJECTS)
+    window = getattr(settings, 'WBS_EVENT_COALESCE_SECONDS', 0.2)
+    heartbeat = getattr(settings, 'WBS_EVENT_HEARTBEAT_SECONDS', 15)
+
+    response = StreamingHttpResponse(
+        event_stream(subscription, window, heartbeat),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,313 @@
+"""
+WBS 내보내기 (CSV, XLSX, iCalendar)
+
+간트 차트와 같은 구간/하위 트리 조건(tree.windowed_tasks)으로 작업을 고른 뒤
+계층 경로 순서로 QuerySet.iterator(chunk_size)를 돌며 파일을 조각조각 흘려보냅니다.
+작업 수와 관계없이 메모리에는 한 청크와 현재 작업의 상위 작업 제목만 유지합니다.
+
+- CSV: 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM을 붙입니다.
+- XLSX: 외부 라이브러리 없이 최소 구성의 OOXML을 zipfile 스트림으로 씁니다.
+- 스프레드시트(CSV, XLSX)에서 =, +, -, @, 탭, CR로 시작하는 글자 값은 수식으로 실행되지 않도록
+  CSV는 앞에 '를 붙이고, XLSX는 텍스트 접두(quotePrefix) 서식을 씁니다.
+- ICS: 작업마다 종일 일정(VEVENT) 하나를 만듭니다.
+"""
+import csv
+import re
+import zipfile
+from datetime import date, timedelta
+from xml.sax.saxutils import escape
+
+from django.db import connections
+from django.db.models.functions import Collate
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from .models import Task
+from .tree import windowed_tasks
+from .workdays import get_calendar
+
+EXPORT_COLUMNS = [
+    ('id', 'ID'),
+    ('wbs_path', '계층 경로'),
+    ('depth', '깊이'),
+    ('title', '작업 제목'),
+    ('status', '상태'),
+    ('start_date', '시작일'),
+    ('end_date', '종료일'),
+    ('workdays', '업무일 수'),
+    ('progress', '진행률'),
+    ('rolled_up_progress', '롤업 진행률'),
+    ('assignees', '담당자'),
+    ('parent_task_id', '상위 작업 ID'),
+]
+DATE_COLUMNS = {'start_date', 'end_date'}
+NUMBER_COLUMNS = {'id', 'depth', 'workdays', 'progress', 'rolled_up_progress', 'parent_task_id'}
+# 스프레드시트가 수식으로 해석하는 첫 글자
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+# XML 1.0에서 쓸 수 없는 제어 문자 (탭, 줄바꿈, CR 제외)
+XML_ILLEGAL_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+# 경로를 바이트 순서로 비교하는 콜레이션 (SQLite의 기본 BINARY는 이미 바이트 순서)
+BYTEWISE_COLLATIONS = {'postgresql': 'C'}
+
+
+def path_order(queryset):
+    """
+    계층 경로의 바이트 순서 정렬 식
+    en_US.UTF-8 같은 언어 콜레이션은 '/'를 무시하고 비교해 '1/10/'과 '1/1/0/'이 섞이므로 바이트 순서로 고정합니다.
+    """
+    collation = BYTEWISE_COLLATIONS.get(connections[queryset.db].vendor)
+    return Collate('path', collation) if collation else 'path'
+
+
+def export_rows(queryset=None, start=None, end=None, root=None, chunk_size=1000):
+    """
+    내보낼 작업을 계층 경로 순서(상위 작업 다음에 그 하위 작업)로 하나씩 dict로 만듭니다.
+    경로를 바이트 순서로 정렬하면 '/'가 숫자보다 앞서므로 항상 전위 순회 순서가 됩니다.
+    """
+    tasks, _ = windowed_tasks(queryset, start=start, end=end, root=root)
+    tasks = tasks.order_by(path_order(tasks)).prefetch_related('assigned_to')
+    status_labels = dict(Task.TASK_STATUS_CHOICES)
+    calendar = get_calendar()
+
+    # 현재 작업의 상위 작업들 (경로, 제목), 깊이만큼만 유지합니다.
+    ancestors = []
+    for task in tasks.iterator(chunk_size=chunk_size):
+        while ancestors and not task.path.startswith(ancestors[-1][0]):
+            ancestors.pop()
+        ancestors.append((task.path, task.title))
+        yield {
+            'id': task.id,
+            'wbs_path': ' > '.join(title for _, title in ancestors),
+            'path': task.path,
+            'depth': task.depth,
+            'title': task.title,
+            'status': status_labels.get(task.status, task.status),
+            'start_date': task.start_date,
+            'end_date': task.end_date,
+            'workdays': calendar.count_workdays(task.start_date, task.end_date),
+            'progress': task.progress,
+            'rolled_up_progress': task.rolled_up_progress,
+            'assignees': ', '.join(user.name or user.username for user in task.assigned_to.all()),
+            'parent_task_id': task.parent_task_id,
+        }
+
+
+class _Buffer:
+    """쓰인 내용을 모아 두었다가 꺼내 가는 쓰기 전용 스트림 (csv.writer, zipfile용)"""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = ''.join(self.chunks) if self.chunks and isinstance(self.chunks[0], str) else b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def is_formula(value):
+    """스프레드시트가 수식으로 해석할 글자 값인지"""
+    return isinstance(value, str) and value.startswith(FORMULA_PREFIXES)
+
+
+def _csv_cell(key, value):
+    if value is None:
+        return ''
+    if key in DATE_COLUMNS:
+        return value.isoformat()
+    return f"'{value}" if is_formula(value) else value
+
+
+def stream_csv(rows, chunk_size=1000):
+    buffer = _Buffer()
+    writer = csv.writer(buffer)
+    yield '\ufeff'
+    writer.writerow([label for _, label in EXPORT_COLUMNS])
+    for index, row in enumerate(rows, 1):
+        writer.writerow([_csv_cell(key, row[key]) for key, _ in EXPORT_COLUMNS])
+        if index % chunk_size == 0:
+            yield buffer.drain()
+    yield buffer.drain()
+
+
+XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="WBS" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+    # 스타일 1번: 날짜 서식 (numFmtId 14), 2번: 텍스트 접두 (수식으로 해석하지 않음)
+    'xl/styles.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" quotePrefix="1"/></cellXfs>'
+        '</styleSheet>'
+    ),
+}
+EXCEL_EPOCH = date(1899, 12, 30)
+
+
+def _xlsx_cell(key, value):
+    if value is None or value == '':
+        return '<c/>'
+    if key in DATE_COLUMNS:
+        return f'<c s="1"><v>{(value - EXCEL_EPOCH).days}</v></c>'
+    if key in NUMBER_COLUMNS:
+        return f'<c><v>{value}</v></c>'
+    text = XML_ILLEGAL_CHARS.sub('', str(value))
+    style = ' s="2"' if is_formula(text) else ''
+    return f'<c t="inlineStr"{style}><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+def stream_xlsx(rows, chunk_size=1000):
+    """
+    시트 XML을 zip 항목에 바로 쓰고, 압축된 만큼씩 꺼내 보냅니다.
+    zipfile은 탐색이 안 되는 스트림에도 데이터 디스크립터로 항목을 쓸 수 있습니다.
+    """
+    buffer = _Buffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in XLSX_PARTS.items():
+            archive.writestr(name, content)
+        yield buffer.drain()
+
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            header = ''.join(_xlsx_cell('', label) for _, label in EXPORT_COLUMNS)
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f'<sheetData><row>{header}</row>'
+            ).encode())
+            lines = []
+            for index, row in enumerate(rows, 1):
+                lines.append('<row>' + ''.join(_xlsx_cell(key, row[key]) for key, _ in EXPORT_COLUMNS) + '</row>')
+                if index % chunk_size == 0:
+                    sheet.write(''.join(lines).encode())
+                    lines = []
+                    yield buffer.drain()
+            sheet.write((''.join(lines) + '</sheetData></worksheet>').encode())
+    yield buffer.drain()
+
+
+def _ics_text(value):
+    return (
+        str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _ics_line(line):
+    """75바이트마다 줄을 접습니다 (RFC 5545 3.1), 멀티바이트 문자는 자르지 않습니다."""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode())
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = '', 0
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def stream_ics(rows, host='wbs', chunk_size=1000):
+    stamp = timezone.now().strftime('%Y%m%dT%H%M%SZ')
+    yield 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//WBS//Task Export//KO\r\nCALSCALE:GREGORIAN\r\n'
+    lines = []
+    for index, row in enumerate(rows, 1):
+        description = (
+            f'계층: {row["wbs_path"]}\n상태: {row["status"]}\n업무일: {row["workdays"]}일\n'
+            f'진행률: {row["rolled_up_progress"]}%\n담당자: {row["assignees"] or "-"}'
+        )
+        lines.extend(_ics_line(line) for line in [
+            'BEGIN:VEVENT',
+            f'UID:task-{row["id"]}@{host}',
+            f'DTSTAMP:{stamp}',
+            f'DTSTART;VALUE=DATE:{row["start_date"].strftime("%Y%m%d")}',
+            # 종일 일정의 DTEND는 마지막 날의 다음 날입니다.
+            f'DTEND;VALUE=DATE:{(row["end_date"] + timedelta(days=1)).strftime("%Y%m%d")}',
+            f'SUMMARY:{_ics_text(row["title"])}',
+            f'DESCRIPTION:{_ics_text(description)}',
+            'TRANSP:TRANSPARENT',
+            'END:VEVENT',
+        ])
+        if index % chunk_size == 0:
+            yield ''.join(lines)
+            lines = []
+    lines.append('END:VCALENDAR\r\n')
+    yield ''.join(lines)
+
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', stream_csv),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', stream_xlsx),
+    'ics': ('text/calendar; charset=utf-8', stream_ics),
+}
+
+
+def export_response(file_format, queryset=None, start=None, end=None, root=None, host='wbs', chunk_size=1000):
+    """작업을 file_format(csv/xlsx/ics) 파일로 흘려보내는 응답"""
+    content_type, stream = EXPORT_FORMATS[file_format]
+    rows = export_rows(queryset, start=start, end=end, root=root, chunk_size=chunk_size)
+    if file_format == 'ics':
+        content = stream(rows, host=host, chunk_size=chunk_size)
+    else:
+        content = stream(rows, chunk_size=chunk_size)
+
+    response = StreamingHttpResponse(content, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="wbs-{timezone.localdate():%Y%m%d}.{file_format}"'
+    return response
@@ -0,0 +1,372 @@
+"""
+작업 일괄 가져오기 (CSV, MS Project XML)
+
+파일을 한 행(작업)씩 읽어 가벼운 dict로 모은 뒤, 저장 전에 모든 행을 한 번에 검증합니다.
+- 필드 값은 TaskCreateSerializer(many=True)로 검증하여 화면에서 만들 때와 규칙이 같습니다.
+- 상위 작업 참조는 파일 안의 키(없으면 기존 작업 ID)로, 담당자는 사용자명으로 한 번에 조회합니다.
+- 하나라도 실패하면 행 번호별 오류를 담아 ValidationError를 발생시키고 아무것도 저장하지 않습니다.
+
+저장은 깊이별 bulk_create로 하며, 롤업 값은 저장 전에 메모리에서 계산하고
+계층 경로는 깊이별 UPDATE 한 번씩으로 채웁니다. 기존 상위 작업은 커밋 후 롤업 엔진이 다시 계산합니다.
+"""
+import codecs
+import csv
+import io
+import xml.etree.ElementTree as ET
+
+from django.db import transaction
+from django.db.models import CharField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Concat
+from rest_framework import serializers
+
+from .models import Task, User
+from .rollup import mark_dirty, summarize_unsaved
+from .serializers import TaskCreateSerializer
+from .signals import tasks_bulk_saved
+
+CSV_COLUMNS = ['key', 'parent', 'title', 'description', 'start_date', 'end_date', 'status', 'progress', 'assignees']
+MSPROJECT_NAMESPACE = '{http://schemas.microsoft.com/project}'
+# UPDATE ... WHERE id IN (...) 한 번에 넘길 ID 수 (SQLite 변수 수 제한 안쪽)
+UPDATE_BATCH_SIZE = 500
+
+
+def detect_encoding(file, chunk_size=64 * 1024):
+    """
+    파일 전체가 UTF-8로 읽히면 'utf-8-sig', 아니면 한국어 Excel의 기본 저장 형식인 'cp949'를 반환합니다.
+    조금씩 읽어 확인한 뒤 파일을 처음으로 되돌립니다.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+        return 'utf-8-sig'
+    except UnicodeDecodeError:
+        return 'cp949'
+    finally:
+        file.seek(0)
+
+
+def decode_lines(file, encoding):
+    """바이트 줄을 디코딩합니다. 실패하면 줄 번호와 바이트 위치를 담은 ValidationError를 발생시킵니다."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    offset = 0
+    for number, line in enumerate(file, 1):
+        try:
+            yield decoder.decode(line)
+        except UnicodeDecodeError as exc:
+            raise serializers.ValidationError({'file': [
+                f'{number}번째 줄(바이트 위치 {offset + exc.start})을 {encoding} 인코딩으로 읽을 수 없습니다. '
+                'encoding을 지정하세요.'
+            ]})
+        offset += len(line)
+
+
+def read_csv(file, encoding=None):
+    """
+    CSV 파일을 한 행씩 읽습니다.
+    열: key, parent, title, description, start_date, end_date, status, progress, assignees
+    (key가 비어 있으면 행 번호, assignees는 쉼표로 구분한 사용자명, status는 코드나 한글 이름)
+    encoding이 없으면 UTF-8(BOM 허용)로 읽히는지 확인하고, 아니면 CP949로 읽습니다.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        file = io.BytesIO(file)
+    status_codes = {label: code for code, label in Task.TASK_STATUS_CHOICES}
+
+    reader = csv.DictReader(decode_lines(file, encoding or detect_encoding(file)))
+    missing = {'title', 'start_date', 'end_date'} - set(reader.fieldnames or [])
+    if missing:
+        raise serializers.ValidationError({'file': [f'필수 열이 없습니다: {", ".join(sorted(missing))}']})
+
+    for line, row in enumerate(reader, 2):
+        row = {column: (row.get(column) or '').strip() for column in CSV_COLUMNS}
+        data = {
+            'title': row['title'],
+            'description': row['description'],
+            'start_date': row['start_date'],
+            'end_date': row['end_date'],
+        }
+        if row['status']:
+            data['status'] = status_codes.get(row['status'], row['status'])
+        if row['progress']:
+            data['progress'] = row['progress']
+        yield {
+            'line': line,
+            'key': row['key'] or str(line),
+            'parent': row['parent'] or None,
+            'assignees': [name.strip() for name in row['assignees'].split(',') if name.strip()],
+            'data': data,
+        }
+
+
+def read_msproject(file, chunk_size=64 * 1024):
+    """
+    MS Project XML을 XMLPullParser로 조금씩 읽어 작업마다 한 행을 만듭니다.
+    계층은 OutlineLevel로, 담당자는 Resources/Assignments의 리소스 이름(사용자명)으로 정합니다.
+    외부 엔티티/엔티티 확장 공격을 막기 위해 DOCTYPE 선언이 있는 문서는 거부합니다.
+    """
+    if isinstance(file, (bytes, bytearray)):
+        file = io.BytesIO(file)
+    parser = ET.XMLPullParser(events=('end',))
+    rows, outline, resources, assignments = [], [], {}, []
+
+    def text(element, name):
+        child = element.find(MSPROJECT_NAMESPACE + name)
+        return (child.text or '').strip() if child is not None else ''
+
+    tail = b''
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if b'<!DOCTYPE' in tail + chunk:
+            raise serializers.ValidationError({'file': ['DOCTYPE이 포함된 XML은 가져올 수 없습니다.']})
+        tail = chunk[-8:]
+        try:
+            parser.feed(chunk)
+        except ET.ParseError as exc:
+            raise serializers.ValidationError({'file': [f'XML 형식 오류: {exc}']})
+
+        for _, element in parser.read_events():
+            tag = element.tag.replace(MSPROJECT_NAMESPACE, '')
+            if tag == 'Task':
+                # 숫자가 아닌 값은 행 오류로 모아 두었다가 검증 단계에서 함께 보고합니다.
+                row_errors = []
+                try:
+                    level = int(text(element, 'OutlineLevel') or 1)
+                except ValueError:
+                    row_errors.append(('parent', f'OutlineLevel은 정수여야 합니다: {text(element, "OutlineLevel")}'))
+                    level = len(outline) + 1
+                # OutlineLevel 0은 프로젝트 요약 작업, IsNull은 빈 행입니다.
+                if level > 0 and text(element, 'IsNull') != '1':
+                    del outline[level - 1:]
+                    uid = text(element, 'UID')
+                    data = {
+                        'title': text(element, 'Name'),
+                        'description': text(element, 'Notes'),
+                        'start_date': text(element, 'Start')[:10],
+                        'end_date': text(element, 'Finish')[:10],
+                    }
+                    try:
+                        percent = int(text(element, 'PercentComplete') or 0)
+                        data['status'] = 'completed' if percent >= 100 else ('in_progress' if percent else 'not_started')
+                        data['progress'] = percent
+                    except ValueError:
+                        # CSV와 같이 원래 값을 넘겨 진행률 검증 오류로 보고합니다.
+                        data['progress'] = text(element, 'PercentComplete')
+                    rows.append({
+                        'line': text(element, 'ID') or uid,
+                        'key': uid,
+                        'parent': outline[-1] if outline else None,
+                        'assignees': [],
+                        'data': data,
+                        'errors': row_errors,
+                    })
+                    outline.append(uid)
+                element.clear()
+            elif tag == 'Resource':
+                resources[text(element, 'UID')] = text(element, 'Name')
+                element.clear()
+            elif tag == 'Assignment':
+                assignments.append((text(element, 'TaskUID'), text(element, 'ResourceUID')))
+                element.clear()
+    try:
+        parser.close()
+    except ET.ParseError as exc:
+        raise serializers.ValidationError({'file': [f'XML 형식 오류: {exc}']})
+
+    rows_by_key = {row['key']: row for row in rows}
+    for task_uid, resource_uid in assignments:
+        if task_uid in rows_by_key and resources.get(resource_uid):
+            rows_by_key[task_uid]['assignees'].append(resources[resource_uid])
+    return rows
+
+
+READERS = {
+    'csv': read_csv,
+    'xml': read_msproject,
+}
+
+
+def validate_rows(rows, parent_task=None):
+    """
+    모든 행을 검증하고 상위 작업/담당자 참조를 풉니다.
+    parent_task: 파일의 최상위 행들을 붙일 기존 작업 (없으면 최상위 작업으로 생성)
+    반환: 검증된 행 목록 (상위 작업이 항상 하위 작업보다 앞)
+    """
+    rows = list(rows)
+    if not rows:
+        raise serializers.ValidationError({'file': ['가져올 작업이 없습니다.']})
+
+    errors = {}
+
+    def error(row, field, message):
+        errors.setdefault(row['line'], {}).setdefault(field, []).append(message)
+
+    # 파일을 읽을 때 발견한 행 오류 (형식이 잘못된 값)
+    for row in rows:
+        for field, message in row.get('errors', ()):
+            error(row, field, message)
+
+    serializer = TaskCreateSerializer(data=[row['data'] for row in rows], many=True)
+    if not serializer.is_valid():
+        for row, row_errors in zip(rows, serializer.errors):
+            for field, messages in row_errors.items():
+                for message in messages:
+                    error(row, field, str(message))
+
+    rows_by_key = {}
+    for row in rows:
+        if row['key'] in rows_by_key:
+            error(row, 'key', f'키가 중복되었습니다: {row["key"]}')
+        rows_by_key[row['key']] = row
+
+    # 파일 안에 없는 상위 작업 참조는 기존 작업 ID로 봅니다.
+    external_ids = {
+        _task_id(row['parent']) for row in rows
+        if row['parent'] is not None and row['parent'] not in rows_by_key
+    } - {None}
+    existing = set(Task.objects.filter(pk__in=external_ids).values_list('id', flat=True))
+    for row in rows:
+        parent = row['parent']
+        if parent is None:
+            row['parent'] = parent_task.pk if parent_task is not None else None
+        elif parent in rows_by_key:
+            row['parent'] = rows_by_key[parent]
+        elif _task_id(parent) in existing:
+            row['parent'] = _task_id(parent)
+        else:
+            error(row, 'parent', f'상위 작업을 찾을 수 없습니다: {parent}')
+            row['parent'] = None
+
+    usernames = {username for row in rows for username in row['assignees']}
+    users = {user.username: user for user in User.objects.filter(username__in=usernames)}
+    for row in rows:
+        for username in row['assignees']:
+            if username not in users:
+                error(row, 'assignees', f'사용자를 찾을 수 없습니다: {username}')
+        row['assignees'] = [users[username] for username in row['assignees'] if username in users]
+
+    ordered = _parents_first(rows, error)
+    if errors:
+        raise serializers.ValidationError({'rows': errors})
+
+    for row, data in zip(rows, serializer.validated_data):
+        row['data'] = data
+    return ordered
+
+
+def _task_id(value):
+    """
+    기존 작업 ID로 볼 수 있는 값이면 정수, 아니면 None
+    ('²' 같은 문자도 isdigit()은 참이므로 isdecimal()로, DB 정수 범위를 넘는 값도 거릅니다.)
+    """
+    if value.isdecimal() and int(value) < 2 ** 63:
+        return int(value)
+    return None
+
+
+def _parents_first(rows, error):
+    """상위 작업이 항상 앞에 오도록 정렬하고 파일 안의 순환 참조를 찾습니다."""
+    ordered, state = [], {}
+    for start in rows:
+        # 반복문으로 상위 작업 사슬을 따라 올라갑니다 (깊은 트리에서도 재귀 한도 없음).
+        chain, row = [], start
+        while isinstance(row, dict) and id(row) not in state:
+            state[id(row)] = 'visiting'
+            chain.append(row)
+            row = row['parent']
+        if isinstance(row, dict) and state[id(row)] == 'visiting':
+            for looped in chain:
+                error(looped, 'parent', '상위 작업 참조가 순환합니다.')
+        for row in reversed(chain):
+            state[id(row)] = 'done'
+            ordered.append(row)
+    return ordered
+
+
+@transaction.atomic
+def import_rows(rows, user):
+    """
+    검증을 마친 행(상위 작업이 항상 앞)을 저장합니다.
+    반환: {'created': 생성한 작업 수, 'root_ids': 파일의 최상위 작업 ID 목록}
+    """
+    index_of = {id(row): index for index, row in enumerate(rows)}
+    tasks, parents, depths = [], [], []
+    existing_parents = set()
+    parent_info = {
+        task_id: (path, depth)
+        for task_id, path, depth in Task.objects.filter(
+            pk__in={row['parent'] for row in rows if isinstance(row['parent'], int)}
+        ).values_list('id', 'path', 'depth')
+    }
+
+    for row in rows:
+        data = dict(row['data'])
+        task = Task(created_by=user, **data)
+        parent = row['parent']
+        if isinstance(parent, dict):
+            parents.append(index_of[id(parent)])
+            depths.append(depths[parents[-1]] + 1)
+        else:
+            parents.append(None)
+            depths.append(parent_info[parent][1] + 1 if parent is not None else 0)
+            task.parent_task_id = parent
+            if parent is not None:
+                existing_parents.add(parent)
+            elif task.color == '#':
+                task.color = task.generate_random_color()
+        task.depth = depths[-1]
+        tasks.append(task)
+
+    summarize_unsaved(tasks, parents)
+
+    # 깊이별로 저장하며 상위 작업 ID를 채우고, 경로는 상위 작업 경로 + 자신의 ID로 채웁니다.
+    for depth in sorted(set(depths)):
+        level = [index for index, value in enumerate(depths) if value == depth]
+        for index in level:
+            if parents[index] is not None:
+                tasks[index].parent_task_id = tasks[parents[index]].pk
+        Task.objects.bulk_create([tasks[index] for index in level])
+
+        level_ids = [tasks[index].pk for index in level]
+        parent_path = Subquery(Task.objects.filter(pk=OuterRef('parent_task_id')).values('path')[:1])
+        for offset in range(0, len(level_ids), UPDATE_BATCH_SIZE):
+            batch = level_ids[offset:offset + UPDATE_BATCH_SIZE]
+            Task.objects.filter(pk__in=batch, parent_task__isnull=True).update(
+                path=Concat(Cast('id', CharField()), Value('/'))
+            )
+            Task.objects.filter(pk__in=batch, parent_task__isnull=False).update(
+                path=Concat(parent_path, Cast('id', CharField()), Value('/'))
+            )
+
+    for task, parent in zip(tasks, parents):
+        parent_path = tasks[parent].path if parent is not None else parent_info.get(task.parent_task_id, ('',))[0]
+        task.path = f'{parent_path}{task.pk}/'
+
+    Through = Task.assigned_to.through
+    Through.objects.bulk_create([
+        Through(task_id=task.pk, user_id=assignee.pk)
+        for task, row in zip(tasks, rows)
+        for assignee in row['assignees']
+    ])
+
+    mark_dirty(*existing_parents)
+    tasks_bulk_saved(tasks)
+    return {
+        'created': len(tasks),
+        'root_ids': [task.pk for task, parent in zip(tasks, parents) if parent is None],
+    }
+
+
+def import_file(file, file_format, user, parent_task=None, encoding=None):
+    """
+    파일을 읽고 검증한 뒤 저장합니다. file_format: 'csv' 또는 'xml'
+    encoding: CSV 파일의 인코딩 (XML은 문서의 선언을 따릅니다)
+    """
+    rows = READERS[file_format](file, encoding) if file_format == 'csv' else READERS[file_format](file)
+    rows = validate_rows(rows, parent_task=parent_task)
+    return import_rows(rows, user)
+
@@ -0,0 +1,315 @@
+"""
+자원 평준화 (resource leveling)
+
+담당자별 하루 작업 수(capacity)를 넘지 않도록 작업을 뒤로 미룬 일정을 제안합니다.
+우선순위 큐 기반 직렬 리스트 스케줄링으로 계산합니다.
+- 선후행 관계의 선행 작업이 모두 배치된 작업만 큐에 들어가며,
+  가장 빠른 시작 → 총 여유(주공정 우선) → 계획 시작일 → ID 순으로 꺼냅니다.
+- 꺼낸 작업은 모든 담당자가 기간 내내 여유가 있는 가장 이른 업무일에 배치합니다.
+  담당자별로 가득 찬 날을 정렬 목록과 건너뛰기 표(경로 압축)로 관리해
+  이미 찬 구간을 한 번에 넘어갑니다.
+- 작업을 앞당기지는 않으며, 하위 작업이 없고 완료되지 않은 작업만 옮깁니다.
+  진행 중인 작업과 root 밖의 작업은 제자리에 고정된 채 담당자 부하로만 계산합니다.
+- 상위 작업이 선행 작업인 관계는 옮긴 하위 작업으로 다시 정해질 상위 작업 기간으로 제약합니다.
+  상위 작업 일정은 적용 후 롤업 엔진이 하위 작업으로부터 다시 계산합니다.
+"""
+import heapq
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import PROJECT_END, DataVersion, Task, TaskDependency
+from .rollup import mark_dirty
+from .schedule import DependencyCycle, get_project_schedule, successor_start
+from .workdays import get_calendar
+
+ONE_DAY = timedelta(days=1)
+# 제자리에 두는 작업 상태 (이미 시작한 작업)
+PINNED_STATUSES = {'in_progress'}
+
+
+class StalePlan(Exception):
+    """미리 본 뒤 데이터가 바뀌었습니다."""
+
+    def __init__(self, version):
+        super().__init__(version)
+        self.version = version
+
+
+class BeyondProjectEnd(Exception):
+    """평준화하면 프로젝트 종료일을 넘기는 작업이 있습니다."""
+
+    def __init__(self, task_ids):
+        super().__init__(task_ids)
+        self.task_ids = task_ids
+
+
+class _Resource:
+    """담당자 한 명의 업무일별 배정 수"""
+    __slots__ = ['usage', 'full', 'skip']
+
+    def __init__(self):
+        self.usage = defaultdict(int)
+        self.full = []  # 더 배정할 수 없는 업무일 번호 (정렬)
+        self.skip = {}  # 가득 찬 날 → 그 뒤에 확인할 날 (경로 압축)
+
+    def next_free(self, day):
+        """day 이후 첫 번째로 여유가 있는 업무일 번호"""
+        path = []
+        while day in self.skip:
+            path.append(day)
+            day = self.skip[day]
+        for visited in path:
+            self.skip[visited] = day
+        return day
+
+
+class ResourcePool:
+    """담당자별 부하를 추적하며 여유 구간을 찾고 배정합니다."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.resources = defaultdict(_Resource)
+
+    def earliest_fit(self, user_ids, start, duration):
+        """모든 담당자가 [start, start + duration) 동안 한 건 더 맡을 수 있는 가장 이른 시작 번호"""
+        resources = [self.resources[user_id] for user_id in user_ids]
+        if not resources or not duration:
+            return start
+        while True:
+            # 모두 여유가 있는 첫 날로 이동
+            moved = True
+            while moved:
+                moved = False
+                for resource in resources:
+                    day = resource.next_free(start)
+                    if day != start:
+                        start, moved = day, True
+            # 기간 안에 가득 찬 날이 있으면 그 날로 이동해 다시 찾습니다.
+            end = start + duration
+            blocked = None
+            for resource in resources:
+                position = bisect_left(resource.full, start)
+                if position < len(resource.full) and resource.full[position] < end:
+                    day = resource.full[position]
+                    blocked = day if blocked is None else min(blocked, day)
+            if blocked is None:
+                return start
+            start = blocked
+
+    def book(self, user_ids, start, duration):
+        """[start, start + duration)에 배정합니다 (고정 작업은 capacity를 넘을 수 있습니다)."""
+        for user_id in user_ids:
+            resource = self.resources[user_id]
+            for day in range(start, start + duration):
+                resource.usage[day] += 1
+                if resource.usage[day] + 1 > self.capacity and day not in resource.skip:
+                    resource.skip[day] = day + 1
+                    insort(resource.full, day)
+
+
+def plan_leveling(capacity=None, root=None, version=None):
+    """
+    평준화한 일정을 계산합니다 (저장하지 않음).
+    반환: {'capacity', 'version', 'considered', 'moved': [변경 내역], 'project_end_before', 'project_end_after',
+           'beyond_project_end'}
+    """
+    if capacity is None:
+        capacity = getattr(settings, 'WBS_WORKLOAD_CAPACITY', 1)
+    if version is None:
+        version = DataVersion.current().version
+    calendar = get_calendar()
+
+    schedule = get_project_schedule(version)
+    if schedule['cycle']:
+        raise DependencyCycle(schedule['cycle'])
+    total_float = {row['id']: row['total_float'] for row in schedule['tasks']}
+
+    tasks = list(
+        Task.objects.order_by('id')
+        .values_list('id', 'title', 'start_date', 'end_date', 'status', 'path', 'parent_task_id', 'subtask_count')
+    )
+    assignees = defaultdict(list)
+    assignments = (
+        Task.assigned_to.through.objects
+        .filter(task__subtask_count=0).exclude(task__status='completed')
+        .order_by().values_list('task_id', 'user_id')
+    )
+    for task_id, user_id in assignments:
+        assignees[task_id].append(user_id)
+
+    numbers, dates = {}, {}
+    def to_number(day):
+        if day not in numbers:
+            numbers[day] = calendar.workday_index(day)
+        return numbers[day]
+    def to_date(number):
+        if number not in dates:
+            dates[number] = calendar.workday_at(number)
+        return dates[number]
+
+    pool = ResourcePool(capacity)
+    spans, parents, movable = {}, {}, {}
+    for task_id, title, start, end, status, path, parent_id, subtask_count in tasks:
+        planned = to_number(start)
+        duration = to_number(end + ONE_DAY) - planned
+        spans[task_id] = (planned, planned + duration)
+        parents[task_id] = parent_id
+        if subtask_count or status == 'completed':
+            continue
+        if status in PINNED_STATUSES or (root is not None and not path.startswith(root.path)):
+            pool.book(assignees[task_id], planned, duration)
+        else:
+            movable[task_id] = (title, start, end, parent_id, planned, duration)
+
+    # 상위 작업 기간은 하위 작업 기간의 최소 시작~최대 종료이므로, 옮길 작업의 상위 작업은
+    # 하위 작업이 모두 배치된 뒤 기간이 정해지는 노드로 다룹니다 (고정된 하위 작업은 저장된 기간).
+    summaries = {}
+    for task_id in movable:
+        parent_id = parents[task_id]
+        while parent_id is not None and parent_id not in summaries:
+            summaries[parent_id] = [None, None, 0]  # [최소 시작, 최대 종료, 배치를 기다리는 하위 작업 수]
+            parent_id = parents[parent_id]
+    for task_id, parent_id in parents.items():
+        if parent_id in summaries:
+            summary = summaries[parent_id]
+            if task_id in movable or task_id in summaries:
+                summary[2] += 1
+            else:
+                start, finish = spans[task_id]
+                summary[0] = start if summary[0] is None else min(summary[0], start)
+                summary[1] = finish if summary[1] is None else max(summary[1], finish)
+
+    # 옮길 작업/상위 작업 사이의 관계는 위상 순서로, 고정된 선행 작업은 계획 일정으로 제약합니다.
+    earliest = {task_id: values[4] for task_id, values in movable.items()}
+    successors = defaultdict(list)
+    indegree = defaultdict(int)
+    links = TaskDependency.objects.order_by().values_list('predecessor_id', 'successor_id', 'dependency_type', 'lag')
+    for predecessor_id, successor_id, kind, lag in links:
+        if successor_id not in movable:
+            continue
+        if predecessor_id in movable or predecessor_id in summaries:
+            successors[predecessor_id].append((successor_id, kind, lag))
+            indegree[successor_id] += 1
+        else:
+            start, finish = spans[predecessor_id]
+            bound = successor_start(kind, lag, start, finish, movable[successor_id][5])
+            earliest[successor_id] = max(earliest[successor_id], bound)
+
+    def entry(task_id):
+        return (earliest[task_id], total_float.get(task_id, 0), movable[task_id][4], task_id)
+
+    queue = [entry(task_id) for task_id in movable if not indegree[task_id]]
+    heapq.heapify(queue)
+    placed = {}
+
+    def release(task_id, start, finish):
+        """배치가 끝난 작업의 후행 작업 제약을 갱신하고, 상위 작업 기간이 정해지면 거슬러 올라갑니다."""
+        while True:
+            for successor_id, kind, lag in successors[task_id]:
+                bound = successor_start(kind, lag, start, finish, movable[successor_id][5])
+                earliest[successor_id] = max(earliest[successor_id], bound)
+                indegree[successor_id] -= 1
+                if not indegree[successor_id]:
+                    heapq.heappush(queue, entry(successor_id))
+            summary = summaries.get(parents[task_id])
+            if summary is None:
+                return
+            summary[0] = start if summary[0] is None else min(summary[0], start)
+            summary[1] = finish if summary[1] is None else max(summary[1], finish)
+            summary[2] -= 1
+            if summary[2]:
+                return
+            task_id, start, finish = parents[task_id], summary[0], summary[1]
+
+    while queue:
+        _, _, _, task_id = heapq.heappop(queue)
+        duration = movable[task_id][5]
+        if not duration and earliest[task_id] > movable[task_id][4]:
+            # 업무일이 없는(주말/휴일만 걸친) 작업을 옮기면 하루짜리 작업이 됩니다.
+            duration = 1
+        start = pool.earliest_fit(assignees[task_id], earliest[task_id], duration)
+        pool.book(assignees[task_id], start, duration)
+        placed[task_id] = (start, duration)
+        release(task_id, start, start + duration)
+    if len(placed) < len(movable):
+        # 일정 계산에서 순환을 먼저 확인하지만, 상위 작업 관계가 하위 작업을 거쳐
+        # 되돌아오는 경우(A⊂P → B, B⊂Q → A)는 평준화에서만 순환이 됩니다.
+        raise DependencyCycle(sorted(set(movable) - set(placed)))
+
+    moved = []
+    end_before = end_after = None
+    for task_id, (title, start, end, parent_id, planned, _) in movable.items():
+        new_start, new_end = start, end
+        number, duration = placed[task_id]
+        if number != planned:
+            new_start = to_date(number)
+            new_end = to_date(number + duration - 1)
+            moved.append({
+                'id': task_id,
+                'title': title,
+                'parent_task': parent_id,
+                'start_date': start,
+                'end_date': end,
+                'new_start_date': new_start,
+                'new_end_date': new_end,
+                'shift': number - planned,
+            })
+        end_before = max(end_before or end, end)
+        end_after = max(end_after or new_end, new_end)
+
+    return {
+        'capacity': capacity,
+        'version': version,
+        'considered': len(movable),
+        'moved': moved,
+        'project_end_before': end_before,
+        'project_end_after': end_after,
+        'beyond_project_end': sum(1 for row in moved if row['new_end_date'] > PROJECT_END),
+    }
+
+
+@transaction.atomic
+def apply_leveling(capacity=None, root=None, expected_version=None, allow_beyond_project_end=False):
+    """
+    평준화한 일정을 계산해 한 트랜잭션에서 일괄 UPDATE로 저장하고,
+    상위 작업 롤업과 변경 기록/알림을 한 번에 처리합니다.
+    expected_version(미리 본 데이터 버전)이 현재 버전과 다르면 저장하지 않고 StalePlan을 발생시킵니다.
+    프로젝트 종료일(PROJECT_END)을 넘기는 작업이 생기면 allow_beyond_project_end가 아닌 한
+    저장하지 않고 BeyondProjectEnd를 발생시킵니다 (작업 생성/수정과 같은 프로젝트 기간 규칙).
+    반환: plan_leveling과 같은 결과
+    """
+    from .signals import tasks_bulk_saved
+
+    # 데이터 버전 행을 잠가, 버전 확인부터 저장까지 다른 쓰기가 버전을 올리며 끼어들지 못하게 합니다.
+    version = DataVersion.objects.select_for_update().get_or_create(pk=DataVersion.GLOBAL_ID)[0].version
+    if expected_version is not None and expected_version != version:
+        raise StalePlan(version)
+    plan = plan_leveling(capacity, root, version)
+    if plan['beyond_project_end'] and not allow_beyond_project_end:
+        raise BeyondProjectEnd([row['id'] for row in plan['moved'] if row['new_end_date'] > PROJECT_END])
+    now = timezone.now()
+    # 새 일정이 같은 작업끼리 묶어 한 번의 UPDATE로 저장합니다.
+    # (필드별 CASE WHEN을 만드는 bulk_update보다 훨씬 빠르고, 옮긴 작업은 대개 같은 날짜로 모입니다.)
+    groups = defaultdict(list)
+    tasks = []
+    for row in plan['moved']:
+        groups[row['new_start_date'], row['new_end_date']].append(row['id'])
+        tasks.append(Task(id=row['id'], parent_task_id=row['parent_task']))
+    for (start, end), task_ids in groups.items():
+        for offset in range(0, len(task_ids), 500):
+            Task.objects.filter(pk__in=task_ids[offset:offset + 500]).update(
+                start_date=start, end_date=end, effective_start_date=start, effective_end_date=end, updated_at=now
+            )
+    # 변경 알림의 프로젝트를 구하기 위해 경로를 읽습니다 (쿼리 변수 수를 제한하도록 나눠서).
+    for offset in range(0, len(tasks), 500):
+        batch = {task.id: task for task in tasks[offset:offset + 500]}
+        for task_id, path in Task.objects.filter(pk__in=batch).values_list('id', 'path'):
+            batch[task_id].path = path
+    mark_dirty(*{task.parent_task_id for task in tasks})
+    tasks_bulk_saved(tasks)
+    return plan
@@ -0,0 +1,208 @@
+import asyncio
+import io
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test import Client
+
+from wbs_app.management.commands.benchmark_endpoints import percentile
+from wbs_app.models import Task, User
+
+# 측정할 읽기 API (이름, WSGI 경로, ASGI 경로)
+ENDPOINTS = [
+    ('gantt_chart', '/api/tasks/gantt_chart/', '/api/async/tasks/gantt_chart/'),
+    ('timeline', '/api/timeline/', '/api/async/timeline/'),
+    ('dashboard', '/api/dashboard/', '/api/async/dashboard/'),
+    ('tasks', '/api/tasks/?page_size=50', '/api/async/tasks/?page_size=50'),
+]
+
+
+class Command(BaseCommand):
+    """
+    같은 읽기 API를 WSGI(동기 뷰, 동시 요청 수만큼의 스레드)와
+    ASGI(비동기 뷰, 하나의 이벤트 루프)로 동시 요청 수를 늘려 가며 호출하고
+    처리량과 p50/p95 응답 시간을 JSON으로 출력합니다.
+    ASGI 핸들러 자체의 비용과 구분할 수 있도록 동기 뷰를 ASGI로 호출한 결과(asgi_sync)도 함께 잽니다.
+    서버 없이 프로세스 안에서 Django의 WSGI/ASGI 핸들러를 직접 호출하며,
+    요청 처리(세션, 연결 정리 등)는 실제 서버와 같은 경로를 지납니다.
+    측정은 예열 호출로 캐시가 채워진 상태에서 시작합니다.
+
+    로컬 SQLite는 I/O 대기가 거의 없어 차이가 작습니다.
+    --db-latency로 쿼리마다 원격 DB 왕복 시간을 더하면 DB 대기가 큰 환경을 흉내 낼 수 있습니다.
+    """
+    help = '읽기 API의 WSGI/ASGI 동시 요청 처리량을 비교해 JSON으로 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16], help='동시 요청 수 목록')
+        parser.add_argument('--requests', type=int, default=64, help='동시 요청 수마다 보낼 요청 수')
+        parser.add_argument('--db-latency', type=float, default=0, help='쿼리마다 더할 지연 (ms)')
+        parser.add_argument('--username', help='요청에 사용할 사용자 (기본값: 첫 번째 활성 사용자)')
+        parser.add_argument('--endpoints', nargs='+', help='측정할 항목 (기본값: 전체)')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (기본값: 표준 출력)')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or min(options['concurrency']) < 1:
+            raise CommandError('--requests와 --concurrency는 1 이상이어야 합니다.')
+        users = User.objects.filter(is_active=True).order_by('id')
+        if options['username']:
+            users = users.filter(username=options['username'])
+        user = users.first()
+        if user is None:
+            raise CommandError('요청에 사용할 사용자가 없습니다. generate_wbs_data를 먼저 실행하세요.')
+
+        client = Client()
+        client.force_login(user)
+        cookie = f'{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}'
+        if options['db_latency']:
+            self.add_db_latency(options['db_latency'] / 1000)
+
+        wsgi, asgi = get_wsgi_application(), get_asgi_application()
+        selected = set(options['endpoints'] or [name for name, _, _ in ENDPOINTS])
+        results = {}
+        for name, wsgi_url, asgi_url in ENDPOINTS:
+            if name not in selected:
+                continue
+            results[name] = []
+            for concurrency in options['concurrency']:
+                wsgi_result = self.measure_wsgi(wsgi, wsgi_url, cookie, concurrency, options['requests'])
+                asgi_result = self.measure_asgi(asgi, asgi_url, cookie, concurrency, options['requests'])
+                asgi_sync_result = self.measure_asgi(asgi, wsgi_url, cookie, concurrency, options['requests'])
+                results[name].append({
+                    'concurrency': concurrency,
+                    'wsgi': wsgi_result,
+                    'asgi': asgi_result,
+                    'asgi_sync': asgi_sync_result,
+                    'throughput_ratio': round(asgi_result['throughput_rps'] / wsgi_result['throughput_rps'], 2),
+                })
+                self.stderr.write(
+                    f'[{name}] 동시 {concurrency}: WSGI {wsgi_result["throughput_rps"]} req/s, '
+                    f'ASGI {asgi_result["throughput_rps"]} req/s (동기 뷰 {asgi_sync_result["throughput_rps"]} req/s)'
+                )
+
+        report = {
+            'database': connection.vendor,
+            'debug': settings.DEBUG,
+            'db_latency_ms': options['db_latency'],
+            'tasks': Task.objects.count(),
+            'requests': options['requests'],
+            'results': results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output + '\n')
+            self.stderr.write(f'결과를 {options["output"]}에 저장했습니다.')
+        else:
+            self.stdout.write(output)
+
+    def add_db_latency(self, seconds):
+        """이미 열린 연결과 앞으로 열릴 모든 연결(스레드별)의 쿼리에 지연을 더합니다."""
+        def delay(execute, sql, params, many, context):
+            time.sleep(seconds)
+            return execute(sql, params, many, context)
+
+        def install(sender, connection, **kwargs):
+            if delay not in connection.execute_wrappers:
+                connection.execute_wrappers.append(delay)
+
+        for alias in connections:
+            install(None, connections[alias])
+        connection_created.connect(install, weak=False)
+
+    def summarize(self, timings, elapsed):
+        return {
+            'throughput_rps': round(len(timings) / elapsed, 1),
+            'p50_ms': round(percentile(timings, 50), 2),
+            'p95_ms': round(percentile(timings, 95), 2),
+            'elapsed_s': round(elapsed, 3),
+        }
+
+    def check_status(self, url, status):
+        if status >= 400:
+            raise CommandError(f'요청이 실패했습니다 ({status}): {url}')
+
+    def measure_wsgi(self, application, url, cookie, concurrency, total):
+        """동시 요청 수만큼의 스레드로 WSGI 핸들러를 호출합니다 (스레드 기반 WSGI 서버와 같은 방식)."""
+        parts = urlsplit(url)
+
+        def call():
+            environ = {
+                'REQUEST_METHOD': 'GET', 'PATH_INFO': parts.path, 'QUERY_STRING': parts.query,
+                'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+                'HTTP_HOST': 'localhost', 'HTTP_COOKIE': cookie, 'REMOTE_ADDR': '127.0.0.1',
+                'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+                'wsgi.version': (1, 0), 'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+            }
+            status = []
+            start = time.perf_counter()
+            body = application(environ, lambda line, headers, exc_info=None: status.append(line))
+            try:
+                for _ in body:
+                    pass
+            finally:
+                body.close()
+            self.check_status(url, int(status[0].split()[0]))
+            return (time.perf_counter() - start) * 1000
+
+        call()  # 예열 (캐시 채움)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter()
+            timings = list(executor.map(lambda _: call(), range(total)))
+            elapsed = time.perf_counter() - start
+        return self.summarize(timings, elapsed)
+
+    def measure_asgi(self, application, url, cookie, concurrency, total):
+        """하나의 이벤트 루프에서 최대 동시 요청 수만큼 ASGI 핸들러를 호출합니다 (uvicorn 워커 하나와 같은 방식)."""
+        parts = urlsplit(url)
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': parts.path, 'raw_path': parts.path.encode(),
+            'query_string': parts.query.encode(), 'root_path': '',
+            'headers': [(b'host', b'localhost'), (b'cookie', cookie.encode())],
+            'client': ('127.0.0.1', 0), 'server': ('localhost', 80),
+        }
+
+        async def call():
+            sent = False
+            status = []
+
+            async def receive():
+                nonlocal sent
+                if not sent:
+                    sent = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                # 응답이 끝날 때까지 연결을 끊지 않습니다.
+                await asyncio.Future()
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+
+            start = time.perf_counter()
+            await application(dict(scope), receive, send)
+            self.check_status(url, status[0])
+            return (time.perf_counter() - start) * 1000
+
+        async def run():
+            await call()  # 예열 (캐시 채움)
+            limit = asyncio.Semaphore(concurrency)
+
+            async def limited():
+                async with limit:
+                    return await call()
+
+            start = time.perf_counter()
+            timings = await asyncio.gather(*(limited() for _ in range(total)))
+            return timings, time.perf_counter() - start
+
+        timings, elapsed = asyncio.run(run())
+        return self.summarize(timings, elapsed)
@@ -0,0 +1,203 @@
+import json
+import subprocess
+import time
+import tracemalloc
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+
+from wbs_app.middleware import QueryStats
+from wbs_app.models import Task, TaskComment, User
+
+# 측정할 읽기 API (이름, 경로)
+READ_ENDPOINTS = [
+    ('gantt_chart', '/api/tasks/gantt_chart/'),
+    ('timeline', '/api/timeline/'),
+    ('dashboard', '/api/dashboard/'),
+    ('tasks', '/api/tasks/'),
+]
+
+
+def percentile(values, percent):
+    """최근접 순위 방식의 백분위수"""
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class Command(BaseCommand):
+    """
+    Django 테스트 클라이언트로 주요 API와 일괄 쓰기를 반복 호출해
+    p50/p95 응답 시간, 쿼리 수, 최대 메모리 사용량을 JSON으로 출력합니다.
+    커밋마다 같은 데이터(generate_wbs_data)로 실행해 결과를 비교합니다.
+    """
+    help = '주요 API와 일괄 쓰기의 응답 시간/쿼리 수/메모리를 측정해 JSON으로 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='API별 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=2, help='측정 전 예열 호출 횟수')
+        parser.add_argument('--bulk-size', type=int, default=100, help='일괄 쓰기 1회의 생성/수정 작업 수')
+        parser.add_argument('--username', help='요청에 사용할 사용자 (기본값: 첫 번째 활성 사용자)')
+        parser.add_argument('--endpoints', nargs='+', help='측정할 항목 (기본값: 전체, bulk 포함)')
+        parser.add_argument('--keep-cache', action='store_true', help='호출마다 캐시를 비우지 않음')
+        parser.add_argument('--output', help='결과 JSON 파일 경로 (기본값: 표준 출력)')
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations는 1 이상이어야 합니다.')
+        users = User.objects.filter(is_active=True).order_by('id')
+        if options['username']:
+            users = users.filter(username=options['username'])
+        user = users.first()
+        if user is None:
+            raise CommandError('요청에 사용할 사용자가 없습니다. generate_wbs_data를 먼저 실행하세요.')
+
+        self.client = Client(SERVER_NAME='localhost')
+        self.client.force_login(user)
+        self.options = options
+
+        selected = set(options['endpoints'] or [name for name, _ in READ_ENDPOINTS] + ['bulk'])
+        results = {}
+        for name, url in READ_ENDPOINTS:
+            if name in selected:
+                results[name] = self.measure(lambda url=url: self.client.get(url))
+        if 'bulk' in selected:
+            results['bulk'] = self.measure_bulk(user)
+
+        report = {
+            'commit': self.current_commit(),
+            'database': connection.vendor,
+            'debug': settings.DEBUG,
+            'tasks': Task.objects.count(),
+            'comments': TaskComment.objects.count(),
+            'users': User.objects.count(),
+            'iterations': options['iterations'],
+            'results': results,
+        }
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output + '\n')
+            self.stderr.write(f'결과를 {options["output"]}에 저장했습니다.')
+        else:
+            self.stdout.write(output)
+
+    def request(self, call):
+        """한 번 호출하고 응답 본문까지 모두 읽습니다. 반환: 응답 바이트 수"""
+        if not self.options['keep_cache']:
+            cache.clear()
+        response = call()
+        if response.status_code >= 400:
+            raise CommandError(f'요청이 실패했습니다 ({response.status_code}): {response.content[:200]!r}')
+        if hasattr(response, 'streaming_content'):
+            return sum(len(chunk) for chunk in response.streaming_content)
+        return len(response.content)
+
+    def measure(self, call, after=None):
+        """
+        예열 후 iterations번 시간을 재고, 따로 한 번씩 쿼리 수와 최대 메모리를 잽니다.
+        (tracemalloc은 실행을 느리게 하므로 시간 측정과 분리합니다.)
+        after: 호출마다 측정 밖에서 실행할 정리 함수
+        """
+        def run(measured):
+            try:
+                return measured()
+            finally:
+                if after:
+                    after()
+
+        for _ in range(self.options['warmup']):
+            run(lambda: self.request(call))
+
+        timings = []
+        for _ in range(self.options['iterations']):
+            def timed():
+                start = time.perf_counter()
+                self.request(call)
+                timings.append((time.perf_counter() - start) * 1000)
+            run(timed)
+
+        stats = QueryStats()
+        def counted():
+            with stats:
+                return self.request(call)
+        size = run(counted)
+
+        def traced():
+            tracemalloc.start()
+            try:
+                self.request(call)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        peak = run(traced)
+
+        return {
+            'p50_ms': round(percentile(timings, 50), 2),
+            'p95_ms': round(percentile(timings, 95), 2),
+            'mean_ms': round(sum(timings) / len(timings), 2),
+            'min_ms': round(min(timings), 2),
+            'max_ms': round(max(timings), 2),
+            'queries': stats.count,
+            'db_ms': round(stats.duration * 1000, 2),
+            'peak_memory_kb': round(peak / 1024, 1),
+            'response_bytes': size,
+        }
+
+    def measure_bulk(self, user):
+        """
+        POST /api/tasks/bulk/ 로 bulk_size개 생성 + bulk_size개 수정을 측정합니다.
+        매 호출 뒤 만든 작업을 지우고 수정한 진행률을 되돌립니다 (측정 밖).
+        """
+        size = self.options['bulk_size']
+        parents = list(Task.objects.filter(subtask_count__gt=0).order_by('id').values_list('id', flat=True)[:size])
+        leaves = list(
+            Task.objects.filter(subtask_count=0).order_by('id').values_list('id', 'progress')[:size]
+        )
+        if not parents or not leaves:
+            raise CommandError('일괄 쓰기를 측정할 작업이 없습니다. generate_wbs_data를 먼저 실행하세요.')
+
+        operations = [
+            {
+                'op': 'create',
+                'data': {
+                    'title': f'벤치마크 {i + 1}',
+                    'start_date': date(2025, 8, 1).isoformat(),
+                    'end_date': date(2025, 8, 8).isoformat(),
+                    'parent_task': parents[i % len(parents)],
+                    'assigned_to': [user.id],
+                },
+            }
+            for i in range(size)
+        ] + [
+            {'op': 'update', 'id': task_id, 'data': {'progress': (progress + 1) % 101}}
+            for task_id, progress in leaves
+        ]
+        restore = [
+            {'op': 'update', 'id': task_id, 'data': {'progress': progress}}
+            for task_id, progress in leaves
+        ]
+        last_id = Task.objects.order_by('-id').values_list('id', flat=True).first() or 0
+
+        def post(payload):
+            return self.client.post('/api/tasks/bulk/', {'operations': payload}, content_type='application/json')
+
+        def cleanup():
+            created = Task.objects.filter(id__gt=last_id, title__startswith='벤치마크 ')
+            deletes = [{'op': 'delete', 'id': task_id} for task_id in created.values_list('id', flat=True)]
+            post(deletes + restore)
+
+        return self.measure(lambda: post(operations), after=cleanup)
+
+    def current_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
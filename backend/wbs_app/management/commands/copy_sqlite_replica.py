@@ -0,0 +1,45 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from wbs_app.routers import REPLICA_DB_ALIAS
+
+
+class Command(BaseCommand):
+    """
+    로컬 개발용: 주 SQLite 파일을 읽기 복제본 파일(DB_REPLICA_NAME)로 복사해 복제를 흉내 냅니다.
+    다음 복사 전까지 복제본은 복제 지연처럼 이전 데이터를 보여 주므로,
+    쓰기 직후의 조회가 주 DB에서 읽히는지(read-your-writes) 확인할 수 있습니다.
+    """
+    help = '주 SQLite DB를 읽기 복제본 SQLite 파일로 복사합니다 (--interval로 주기적 복사).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, help='지정하면 이 간격(초)으로 계속 복사합니다 (복제 지연)')
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES['default']
+        replica = settings.DATABASES.get(REPLICA_DB_ALIAS)
+        if replica is None:
+            raise CommandError('읽기 복제본이 설정되어 있지 않습니다. DB_REPLICA_NAME을 지정하세요.')
+        if not (primary['ENGINE'].endswith('sqlite3') and replica['ENGINE'].endswith('sqlite3')):
+            raise CommandError('SQLite 주 DB와 복제본에서만 사용할 수 있습니다.')
+        if str(primary['NAME']) == str(replica['NAME']):
+            raise CommandError('주 DB와 복제본이 같은 파일입니다.')
+
+        while True:
+            self.copy(primary['NAME'], replica['NAME'])
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def copy(self, source_path, target_path):
+        # 온라인 백업 API는 쓰기 중인 주 DB에서도 일관된 시점의 사본을 만듭니다.
+        source, target = sqlite3.connect(source_path), sqlite3.connect(target_path)
+        try:
+            source.backup(target)
+        finally:
+            source.close()
+            target.close()
+        self.stdout.write(self.style.SUCCESS(f'{source_path} → {target_path} 복사를 마쳤습니다.'))
@@ -0,0 +1,188 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+
+from wbs_app.models import PROJECT_END, PROJECT_START, Task, TaskComment, TaskDependency, User
+from wbs_app.rollup import summarize_unsaved
+from wbs_app.signals import tasks_bulk_saved
+
+STATUSES = [choice for choice, _ in Task.TASK_STATUS_CHOICES]
+
+
+class Command(BaseCommand):
+    """
+    성능 측정용 합성 WBS 데이터를 만듭니다.
+    트리 모양(깊이/하위 작업 수)과 계층 경로, 롤업 값을 메모리에서 먼저 계산한 뒤
+    작업/담당자/댓글/선후행 관계를 모두 bulk_create로 저장합니다.
+    """
+    help = '지정한 규모(1천~20만 개)의 합성 작업 트리, 담당자, 댓글을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tasks', type=int, default=1000, help='생성할 작업 수 (1,000~200,000)')
+        parser.add_argument('--users', type=int, default=50, help='생성할 사용자 수')
+        parser.add_argument('--max-depth', type=int, default=6, help='최대 계층 깊이 (루트 = 1)')
+        parser.add_argument('--min-fanout', type=int, default=2, help='하위 작업을 가지는 작업의 최소 하위 작업 수')
+        parser.add_argument('--max-fanout', type=int, default=8, help='하위 작업을 가지는 작업의 최대 하위 작업 수')
+        parser.add_argument('--leaf-ratio', type=float, default=0.3, help='최대 깊이 전에 하위 작업 없이 끝나는 비율')
+        parser.add_argument('--comments', type=float, default=1.0, help='작업당 평균 댓글 수')
+        parser.add_argument('--dependency-ratio', type=float, default=0.5, help='바로 앞 형제 작업을 선행 작업(FS)으로 가지는 비율')
+        parser.add_argument('--max-assignees', type=int, default=3, help='작업당 최대 담당자 수')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드 (같은 시드면 같은 모양)')
+        parser.add_argument('--batch-size', type=int, default=2000, help='bulk_create 배치 크기')
+        parser.add_argument('--clear', action='store_true', help='기존 작업과 댓글을 먼저 삭제')
+
+    def handle(self, *args, **options):
+        if not 1000 <= options['tasks'] <= 200000:
+            raise CommandError('--tasks는 1,000 이상 200,000 이하여야 합니다.')
+        if not 1 <= options['min_fanout'] <= options['max_fanout']:
+            raise CommandError('--min-fanout은 1 이상, --max-fanout 이하여야 합니다.')
+        if options['max_depth'] < 1 or options['users'] < 1:
+            raise CommandError('--max-depth와 --users는 1 이상이어야 합니다.')
+
+        rng = random.Random(options['seed'])
+        batch_size = options['batch_size']
+
+        with transaction.atomic():
+            if options['clear']:
+                Task.objects.all().delete()
+
+            users = self.create_users(options['users'], batch_size)
+            parents, depths = self.plan_tree(rng, options)
+            tasks = self.create_tasks(rng, parents, users, batch_size)
+            task_ids = [task.id for task in tasks]
+            assignments = self.create_assignees(rng, task_ids, users, options['max_assignees'], batch_size)
+            comments = self.create_comments(rng, task_ids, users, options['comments'], batch_size)
+            dependencies = self.create_dependencies(rng, tasks, parents, options['dependency_ratio'], batch_size)
+            # bulk_create는 시그널을 보내지 않으므로 변경 기록/데이터 버전/캐시를 한 번에 처리합니다.
+            tasks_bulk_saved(tasks)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'작업 {len(tasks)}개 (최대 깊이 {max(depths) + 1}), 담당자 연결 {assignments}개, '
+            f'댓글 {comments}개, 선후행 관계 {dependencies}개를 생성했습니다.'
+        ))
+
+    def create_users(self, count, batch_size):
+        """synthetic_user_N 사용자를 준비합니다 (이미 있으면 재사용)"""
+        usernames = [f'synthetic_user_{i}' for i in range(count)]
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        password = make_password(None)
+        User.objects.bulk_create(
+            [
+                User(username=username, name=f'합성 사용자 {username.rsplit("_", 1)[1]}', password=password)
+                for username in usernames if username not in existing
+            ],
+            batch_size=batch_size,
+        )
+        return list(User.objects.filter(username__in=usernames).values_list('id', flat=True))
+
+    def plan_tree(self, rng, options):
+        """
+        너비 우선으로 트리 모양을 정합니다.
+        반환: (상위 작업 순번 목록 (루트는 None), 깊이 목록 (루트 = 0))
+        """
+        total = options['tasks']
+        parents, depths = [], []
+        queue, head = [], 0
+        while len(parents) < total:
+            if head == len(queue):
+                # 모든 가지가 끝났으면 새 루트를 시작합니다.
+                parents.append(None)
+                depths.append(0)
+                queue.append(len(parents) - 1)
+
+            index = queue[head]
+            head += 1
+            if depths[index] + 1 >= options['max_depth'] or (depths[index] and rng.random() < options['leaf_ratio']):
+                continue
+            for _ in range(rng.randint(options['min_fanout'], options['max_fanout'])):
+                if len(parents) == total:
+                    break
+                parents.append(index)
+                depths.append(depths[index] + 1)
+                queue.append(len(parents) - 1)
+        return parents, depths
+
+    def create_tasks(self, rng, parents, users, batch_size):
+        """
+        작업 ID를 미리 정해 계층 경로와 롤업 값까지 메모리에서 계산한 뒤 한 번에 bulk_create합니다.
+        너비 우선 순번이라 상위 작업이 항상 하위 작업보다 앞에 있습니다.
+        반환: 순번별 작업 객체
+        """
+        first_id = (Task.objects.aggregate(last=Max('id'))['last'] or 0) + 1
+        span = (PROJECT_END - PROJECT_START).days
+        tasks, windows = [], []
+        for index, parent in enumerate(parents):
+            if parent is None:
+                start, days = PROJECT_START, span
+            else:
+                start, days = windows[parent]
+            offset = rng.randint(0, days)
+            length = rng.randint(0, days - offset)
+            windows.append((start + timedelta(days=offset), length))
+
+            task = Task(
+                id=first_id + index,
+                title=f'작업 {index + 1}',
+                start_date=windows[index][0],
+                end_date=windows[index][0] + timedelta(days=length),
+                parent_task_id=tasks[parent].id if parent is not None else None,
+                status=rng.choice(STATUSES),
+                progress=rng.randint(0, 100),
+                created_by_id=rng.choice(users),
+            )
+            task.path = f'{tasks[parent].path if parent is not None else ""}{task.id}/'
+            task.depth = task.path.count('/') - 1
+            if parent is None:
+                task.color = task.generate_random_color()
+            tasks.append(task)
+
+        summarize_unsaved(tasks, parents)
+        Task.objects.bulk_create(tasks, batch_size=batch_size)
+        # ID를 직접 지정했으므로 시퀀스를 맞춥니다 (PostgreSQL).
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Task]):
+                cursor.execute(sql)
+        return tasks
+
+    def create_assignees(self, rng, tasks, users, max_assignees, batch_size):
+        Assignee = Task.assigned_to.through
+        rows = [
+            Assignee(task_id=task_id, user_id=user_id)
+            for task_id in tasks
+            for user_id in rng.sample(users, rng.randint(0, min(max_assignees, len(users))))
+        ]
+        Assignee.objects.bulk_create(rows, batch_size=batch_size)
+        return len(rows)
+
+    def create_comments(self, rng, tasks, users, average, batch_size):
+        count = round(len(tasks) * average)
+        comments = [
+            TaskComment(task_id=rng.choice(tasks), author_id=rng.choice(users), content=f'합성 댓글 {i + 1}')
+            for i in range(count)
+        ]
+        TaskComment.objects.bulk_create(comments, batch_size=batch_size)
+        return count
+
+    def create_dependencies(self, rng, tasks, parents, ratio, batch_size):
+        """
+        같은 상위 작업의 바로 앞 형제 작업과 종료-시작(FS) 관계를 맺습니다.
+        선행 작업이 항상 앞 순번이므로 순환이 생기지 않습니다.
+        """
+        last_child = {}
+        dependencies = []
+        for index, parent in enumerate(parents):
+            if parent is None:
+                continue
+            previous = last_child.get(parent)
+            last_child[parent] = index
+            if previous is not None and rng.random() < ratio:
+                dependencies.append(TaskDependency(
+                    predecessor_id=tasks[previous].id, successor_id=tasks[index].id, lag=rng.randint(0, 2)
+                ))
+        TaskDependency.objects.bulk_create(dependencies, batch_size=batch_size)
+        return len(dependencies)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from wbs_app.importer import READERS, import_file
+from wbs_app.models import Task, User
+
+
+class Command(BaseCommand):
+    """CSV/MS Project XML 파일의 작업을 검증한 뒤 한 번에 가져옵니다 (POST /api/tasks/import/와 같은 처리)."""
+    help = 'CSV 또는 MS Project XML 파일에서 작업을 일괄 가져옵니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='가져올 파일 경로')
+        parser.add_argument('--format', choices=sorted(READERS), help='파일 형식 (기본값: 확장자)')
+        parser.add_argument('--user', required=True, help='작업 생성자로 기록할 사용자명')
+        parser.add_argument('--parent', type=int, help='최상위 행들을 붙일 기존 작업 ID')
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or options['path'].rsplit('.', 1)[-1].lower()
+        if file_format not in READERS:
+            raise CommandError('--format을 csv 또는 xml로 지정하세요.')
+        try:
+            user = User.objects.get(username=options['user'])
+            parent_task = Task.objects.get(pk=options['parent']) if options['parent'] else None
+        except (User.DoesNotExist, Task.DoesNotExist) as exc:
+            raise CommandError(str(exc))
+
+        with open(options['path'], 'rb') as file:
+            try:
+                result = import_file(file, file_format, user, parent_task=parent_task)
+            except ValidationError as exc:
+                raise CommandError(f'가져오기에 실패했습니다: {exc.detail}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'작업 {result["created"]}개를 가져왔습니다 (최상위 작업 {len(result["root_ids"])}개).'
+        ))
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from wbs_app.sync import prune_changes
+
+
+class Command(BaseCommand):
+    """
+    증분 동기화 변경 로그 중 보관 기간이 지난 로그를 정리합니다 (주기적으로 실행).
+    정리된 범위의 동기화 토큰으로 요청한 클라이언트는 410 응답을 받고 전체 목록을 다시 받습니다.
+    """
+    help = '보관 기간(WBS_SYNC_RETENTION_DAYS)이 지난 변경 로그를 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.WBS_SYNC_RETENTION_DAYS, help='보관 기간 (일)')
+
+    def handle(self, *args, **options):
+        if options['days'] < 0:
+            raise CommandError('--days는 0 이상이어야 합니다.')
+        deleted = prune_changes(options['days'])
+        self.stdout.write(self.style.SUCCESS(f'변경 로그 {deleted}개를 정리했습니다.'))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from wbs_app.rollup import rebuild_all
+
+
+class Command(BaseCommand):
+    """작업 계층 경로와 롤업 값(하위 작업 수, 실제 일정, 롤업 진행률)을 일괄 재계산합니다."""
+    help = '모든 작업의 계층 경로와 롤업 값을 부모 관계로부터 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 저장할 작업 수')
+
+    def handle(self, *args, **options):
+        updated = rebuild_all(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{updated}개 작업의 롤업 값을 갱신했습니다.'))
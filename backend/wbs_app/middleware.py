@@ -0,0 +1,206 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.urls import Resolver404, resolve
+
+from .routers import REPLICA_DB_ALIAS, read_database, replica_configured
+
+logger = logging.getLogger('wbs_app.queries')
+
+# 현재 요청의 QueryStats (다른 스레드에서 실행되는 조회도 같은 통계에 더하기 위해 사용)
+current_query_stats = ContextVar('current_query_stats', default=None)
+
+# IN (%s, %s, ...) 처럼 인자 수만 다른 쿼리를 같은 형태로 묶습니다.
+PLACEHOLDER_LIST_RE = re.compile(r'%s(?:\s*,\s*%s)+')
+
+
+def query_signature(sql):
+    """파라미터를 제외한 쿼리 형태"""
+    return PLACEHOLDER_LIST_RE.sub('%s, ...', sql)
+
+
+class QueryStats:
+    """
+    블록 안에서 실행된 SQL 쿼리의 수, 총 실행 시간, 중복 형태를 기록합니다.
+    DEBUG 설정과 관계없이 connection.execute_wrapper로 모든 DB 연결을 감시합니다.
+
+        with QueryStats() as stats:
+            ...
+        stats.count, stats.duration, stats.duplicates()
+    """
+    def __init__(self, using=None):
+        self.aliases = [using] if using else list(connections)
+        self.count = 0
+        self.duration = 0.0
+        self.signatures = Counter()
+        self._lock = threading.Lock()
+        self._stack = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.duration += duration
+                self.count += 1
+                self.signatures[query_signature(sql)] += 1
+
+    @contextmanager
+    def watching(self):
+        """현재 스레드의 DB 연결을 감시합니다. 여러 스레드에서 동시에 써도 됩니다."""
+        with ExitStack() as stack:
+            for alias in self.aliases:
+                stack.enter_context(connections[alias].execute_wrapper(self))
+            yield self
+
+    def __enter__(self):
+        self._stack = ExitStack()
+        self._stack.enter_context(self.watching())
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stack.__exit__(*exc_info)
+        self._stack = None
+
+    def duplicates(self, threshold=2):
+        """threshold번 이상 반복된 쿼리 형태 (N+1 의심)"""
+        return [(sql, count) for sql, count in self.signatures.most_common() if count >= threshold]
+
+
+def watch_queries():
+    """현재 요청의 QueryStats가 있으면 이 스레드의 쿼리도 함께 기록합니다."""
+    stats = current_query_stats.get()
+    return stats.watching() if stats is not None else nullcontext()
+
+
+class QueryBudgetMiddleware:
+    """
+    요청마다 쿼리 수, 총 DB 시간, 반복된 쿼리 형태를 기록합니다.
+    WBS_QUERY_HEADERS가 켜져 있으면 (기본값: DEBUG) Server-Timing/X-DB-Queries 헤더로 노출하고,
+    꺼져 있으면 WBS_QUERY_BUDGET 또는 WBS_QUERY_DUPLICATE_THRESHOLD를 넘는 요청을 로그로 남깁니다.
+    스트리밍 응답은 본문을 만드는 동안 실행되는 쿼리를 포함하지 않습니다.
+    
+    ASGI에서는 비동기로 동작하며, 감시 시작/종료는 요청의 DB 스레드(thread_sensitive)에서 실행해
+    sync_to_async로 실행되는 뷰와 비동기 ORM 쿼리가 같은 연결에서 기록되게 합니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        try:
+            with stats:
+                response = self.get_response(request)
+        finally:
+            current_query_stats.reset(token)
+        return self.report(request, response, stats)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        await sync_to_async(stats.__enter__)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stats.__exit__)(None, None, None)
+            current_query_stats.reset(token)
+        return self.report(request, response, stats)
+
+    def report(self, request, response, stats):
+        """쿼리 통계를 응답 헤더나 로그로 남깁니다."""
+        threshold = getattr(settings, 'WBS_QUERY_DUPLICATE_THRESHOLD', 5)
+        duplicates = stats.duplicates(threshold)
+        duration_ms = stats.duration * 1000
+
+        if getattr(settings, 'WBS_QUERY_HEADERS', settings.DEBUG):
+            response['X-DB-Queries'] = str(stats.count)
+            if duplicates:
+                response['X-DB-Duplicate-Queries'] = str(sum(count for _, count in duplicates))
+            server_timing = f'db;dur={duration_ms:.1f};desc="{stats.count} queries"'
+            if response.has_header('Server-Timing'):
+                server_timing = f'{response["Server-Timing"]}, {server_timing}'
+            response['Server-Timing'] = server_timing
+
+        budget = getattr(settings, 'WBS_QUERY_BUDGET', 50)
+        if duplicates or stats.count > budget:
+            logger.warning(
+                '%s %s: 쿼리 %d개 (%.1fms), 반복 쿼리 %s',
+                request.method, request.path, stats.count, duration_ms,
+                '; '.join(f'{count}x {sql[:200]}' for sql, count in duplicates) or '없음',
+            )
+        else:
+            logger.info('%s %s: 쿼리 %d개 (%.1fms)', request.method, request.path, stats.count, duration_ms)
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    읽기 API(WBS_REPLICA_VIEWS의 URL 이름)에 대한 GET/HEAD 요청의 조회를 읽기 복제본으로 보냅니다.
+    쓰기 요청(POST/PUT/PATCH/DELETE)의 응답에는 고정 쿠키를 붙여, WBS_REPLICA_PIN_SECONDS 동안
+    그 클라이언트의 조회는 주 DB에서 읽게 합니다 (자신이 쓴 내용을 바로 읽을 수 있도록).
+    복제본이 설정되어 있지 않으면 아무것도 하지 않습니다.
+    """
+    sync_capable = True
+    async_capable = True
+    pin_cookie_name = 'wbs_primary'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = read_database.set(self.read_alias(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.pin(request, response)
+
+    async def __acall__(self, request):
+        token = read_database.set(self.read_alias(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.pin(request, response)
+
+    def read_alias(self, request):
+        """이 요청의 조회를 보낼 DB 별칭 (None이면 주 DB)"""
+        if not replica_configured() or request.method not in ('GET', 'HEAD'):
+            return None
+        if request.COOKIES.get(self.pin_cookie_name):
+            return None
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        return REPLICA_DB_ALIAS if match.url_name in settings.WBS_REPLICA_VIEWS else None
+
+    def pin(self, request, response):
+        if replica_configured() and request.method not in ('GET', 'HEAD', 'OPTIONS', 'TRACE'):
+            response.set_cookie(
+                self.pin_cookie_name, '1', max_age=settings.WBS_REPLICA_PIN_SECONDS,
+                httponly=True, samesite='Lax',
+            )
+        return response
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:01
+
+from django.db import migrations, models
+
+
+def build_paths(apps, schema_editor):
+    """
+    기존 작업들의 계층 경로와 깊이를 채웁니다.
+    상위 작업을 따라 올라가는 반복문으로 계산하며, 상위 작업 관계가 순환하면 해당 작업 ID와 함께 중단합니다.
+    """
+    Task = apps.get_model('wbs_app', 'Task')
+    parents = dict(Task.objects.values_list('id', 'parent_task_id'))
+    paths = {}
+
+    for task_id in parents:
+        # 경로를 아는 상위 작업(또는 최상위)까지 올라간 뒤 내려오며 채웁니다.
+        chain, visited, current = [], set(), task_id
+        while current is not None and current not in paths:
+            if current in visited:
+                cycle = chain[chain.index(current):]
+                raise RuntimeError(
+                    f'상위 작업 관계가 순환합니다 (작업 ID {" -> ".join(map(str, cycle + [current]))}). '
+                    '순환에 속한 작업 하나의 parent_task_id를 비운 뒤 다시 마이그레이션하세요.'
+                )
+            visited.add(current)
+            chain.append(current)
+            current = parents[current]
+        prefix = paths.get(current, '')
+        for chain_id in reversed(chain):
+            prefix = paths[chain_id] = f'{prefix}{chain_id}/'
+
+    tasks = list(Task.objects.only('id'))
+    for task in tasks:
+        task.path = paths[task.id]
+        task.depth = task.path.count('/') - 1
+    Task.objects.bulk_update(tasks, ['path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0002_remove_task_assigned_to_alter_user_groups_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='depth',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='계층 깊이'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=500, verbose_name='계층 경로'),
+        ),
+        migrations.RunPython(build_paths, migrations.RunPython.noop),
+    ]
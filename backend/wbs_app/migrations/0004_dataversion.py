@@ -0,0 +1,26 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:04
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0003_task_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(default=0, verbose_name='버전')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '데이터 버전',
+                'verbose_name_plural': '데이터 버전들',
+            },
+        ),
+    ]
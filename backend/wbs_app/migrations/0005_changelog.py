@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0004_dataversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(choices=[('task', '작업'), ('comment', '댓글')], max_length=10, verbose_name='대상 모델')),
+                ('object_id', models.BigIntegerField(verbose_name='대상 ID')),
+                ('action', models.CharField(choices=[('upsert', '생성/수정'), ('delete', '삭제')], max_length=10, verbose_name='변경 유형')),
+                ('version', models.BigIntegerField(default=0, verbose_name='데이터 버전')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='기록일')),
+            ],
+            options={
+                'verbose_name': '변경 로그',
+                'verbose_name_plural': '변경 로그들',
+                'ordering': ['version', 'id'],
+                'indexes': [models.Index(fields=['version', 'id'], name='changelog_version_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='dataversion',
+            name='pruned_version',
+            field=models.BigIntegerField(default=0, verbose_name='정리된 변경 로그 버전'),
+        ),
+    ]
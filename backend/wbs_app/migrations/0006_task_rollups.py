@@ -0,0 +1,110 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:10
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 마이그레이션 시점의 업무일 계산을 고정한 사본입니다 (wbs_app.workdays가 바뀌어도 결과가 같아야 합니다).
+# 가중치는 rollup.summarize와 같이 주말과 휴일표(WBS_HOLIDAY_SETS, WBS_HOLIDAYS)를 뺀 업무일 수입니다.
+FROZEN_HOLIDAY_SETS = {
+    'KR': [
+        '2025-01-01', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+        '2025-05-05', '2025-05-06', '2025-06-03', '2025-06-06', '2025-08-15',
+        '2025-10-03', '2025-10-06', '2025-10-07', '2025-10-08', '2025-10-09',
+        '2025-12-25',
+        '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02',
+        '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17', '2026-09-24',
+        '2026-09-25', '2026-10-05', '2026-10-09', '2026-12-25',
+    ],
+}
+
+
+def weekday_holidays():
+    """설정된 휴일 중 평일인 날짜 (정렬)"""
+    holidays = list(getattr(settings, 'WBS_HOLIDAYS', []))
+    for name in getattr(settings, 'WBS_HOLIDAY_SETS', []):
+        holidays.extend(FROZEN_HOLIDAY_SETS.get(name, []))
+    days = {date.fromisoformat(day) if isinstance(day, str) else day for day in holidays}
+    return sorted(day for day in days if day.weekday() < 5)
+
+
+def count_workdays(start_date, end_date, holidays):
+    """start_date ~ end_date(포함) 사이의 업무일 수"""
+    days = (end_date - start_date).days + 1
+    if days <= 0:
+        return 0
+    weeks, rest = divmod(days, 7)
+    weekdays = weeks * 5 + sum(
+        1 for offset in range(rest) if (start_date + timedelta(days=offset)).weekday() < 5
+    )
+    return weekdays - (bisect_right(holidays, end_date) - bisect_left(holidays, start_date))
+
+
+def fill_rollups(apps, schema_editor):
+    """기존 작업들의 롤업 값을 아래 단계부터 채웁니다."""
+    Task = apps.get_model('wbs_app', 'Task')
+    holidays = weekday_holidays()
+    tasks = list(Task.objects.order_by('-depth'))
+    children = defaultdict(list)
+    for task in tasks:
+        children[task.parent_task_id].append(task)
+
+    for task in tasks:
+        subtasks = children[task.id]
+        task.subtask_count = len(subtasks)
+        if subtasks:
+            task.effective_start_date = min(
+                day for subtask in subtasks for day in (subtask.effective_start_date, subtask.start_date) if day
+            )
+            task.effective_end_date = max(
+                day for subtask in subtasks for day in (subtask.effective_end_date, subtask.end_date) if day
+            )
+            weights = [
+                max(count_workdays(subtask.start_date, subtask.end_date, holidays), 1) for subtask in subtasks
+            ]
+            weighted = sum(weight * subtask.rolled_up_progress for weight, subtask in zip(weights, subtasks))
+            task.rolled_up_progress = round(weighted / sum(weights))
+        else:
+            task.effective_start_date = task.start_date
+            task.effective_end_date = task.end_date
+            task.rolled_up_progress = task.progress
+
+    Task.objects.bulk_update(
+        tasks,
+        ['subtask_count', 'effective_start_date', 'effective_end_date', 'rolled_up_progress'],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0005_changelog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='effective_end_date',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='실제 종료일'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='effective_start_date',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='실제 시작일'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='rolled_up_progress',
+            field=models.IntegerField(default=0, editable=False, verbose_name='롤업 진행률 (%)'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='subtask_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='하위 작업 수'),
+        ),
+        migrations.RunPython(fill_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0006_task_rollups'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['start_date', 'end_date', 'path'], name='task_start_end_path_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['end_date', 'start_date', 'path'], name='task_end_start_path_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-17 20:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wbs_app', '0008_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskDependency',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dependency_type', models.CharField(choices=[('FS', '종료-시작'), ('SS', '시작-시작'), ('FF', '종료-종료'), ('SF', '시작-종료')], default='FS', max_length=2, verbose_name='관계 유형')),
+                ('lag', models.IntegerField(default=0, verbose_name='지연 (업무일)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('predecessor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='successor_links', to='wbs_app.task', verbose_name='선행 작업')),
+                ('successor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='predecessor_links', to='wbs_app.task', verbose_name='후행 작업')),
+            ],
+            options={
+                'verbose_name': '작업 선후행 관계',
+                'verbose_name_plural': '작업 선후행 관계들',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='taskdependency',
+            constraint=models.CheckConstraint(check=models.Q(('predecessor', models.F('successor')), _negated=True), name='dependency_not_self'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='taskdependency',
+            unique_together={('predecessor', 'successor')},
+        ),
+    ]
@@ -1,7 +1,15 @@
 from django.db import models
+from django.db.models import F, Max, Value
+from django.db.models.functions import Concat, Substr
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 import random
+from datetime import date
+
+# 프로젝트 기간 (작업 일정 검증, 간트/타임라인 표시 구간, 평준화 기준)
+PROJECT_START = date(2025, 7, 23)
+PROJECT_END = date(2025, 9, 15)
 
 
 class User(AbstractUser):
@@ -43,6 +51,9 @@ class Task(models.Model):
         ('completed', '완료'),
         ('on_hold', '보류'),
     ]
+    # 하위 작업이 없는 작업의 롤업 값은 아래 원본 필드에서 바로 정해집니다.
+    LEAF_ROLLUP_SOURCES = {'start_date', 'end_date', 'progress'}
+    LEAF_ROLLUP_FIELDS = {'effective_start_date', 'effective_end_date', 'rolled_up_progress'}
     
     title = models.CharField(max_length=200, verbose_name='작업 제목')
     description = models.TextField(blank=True, verbose_name='작업 설명')
@@ -82,11 +93,36 @@ class Task(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    # 계층 인덱스 (materialized path): 루트부터 자신까지의 ID를 '/'로 연결, 예) '1/5/12/'
+    path = models.CharField(max_length=500, blank=True, default='', db_index=True, editable=False, verbose_name='계층 경로')
+    depth = models.PositiveIntegerField(default=0, editable=False, verbose_name='계층 깊이')
+    # 하위 작업 기준 롤업 값 (wbs_app.rollup이 갱신, 하위 작업이 없으면 자신의 값)
+    subtask_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='하위 작업 수')
+    effective_start_date = models.DateField(null=True, blank=True, editable=False, verbose_name='실제 시작일')
+    effective_end_date = models.DateField(null=True, blank=True, editable=False, verbose_name='실제 종료일')
+    rolled_up_progress = models.IntegerField(default=0, editable=False, verbose_name='롤업 진행률 (%)')
     
     class Meta:
         verbose_name = '작업'
         verbose_name_plural = '작업들'
         ordering = ['start_date', 'title']
+        indexes = [
+            # 목록/키셋 페이지네이션 정렬 (start_date, title, id)
+            models.Index(fields=['start_date', 'title', 'id'], name='task_list_order_idx'),
+            # 최상위 작업만 고르는 부분 인덱스 (parent_task IS NULL)
+            models.Index(
+                fields=['start_date', 'title'],
+                condition=models.Q(parent_task__isnull=True),
+                name='task_root_order_idx',
+            ),
+            # 상태별 집계 (대시보드)
+            models.Index(fields=['status'], name='task_status_idx'),
+            # 최근 작업 (대시보드)
+            models.Index(fields=['-created_at'], name='task_created_desc_idx'),
+            # 일정 구간 조회용 (경로까지 포함해 인덱스만으로 처리)
+            models.Index(fields=['start_date', 'end_date', 'path'], name='task_start_end_path_idx'),
+            models.Index(fields=['end_date', 'start_date', 'path'], name='task_end_start_path_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -95,7 +131,56 @@ class Task(models.Model):
         # 상위 작업이 없고 색상이 기본값인 경우 랜덤 색상 할당
         if not self.parent_task and self.color == '#':
             self.color = self.generate_random_color()
+        
+        update_fields = kwargs.get('update_fields')
+        if not self.subtask_count:
+            self.apply_leaf_rollups()
+            if update_fields is not None and self.LEAF_ROLLUP_SOURCES.intersection(update_fields):
+                kwargs['update_fields'] = set(update_fields) | self.LEAF_ROLLUP_FIELDS
         super().save(*args, **kwargs)
+        
+        if update_fields is None or 'parent_task' in update_fields:
+            self.refresh_path()
+    
+    def apply_leaf_rollups(self):
+        """하위 작업이 없는 작업은 자신의 일정과 진행률이 곧 롤업 값입니다."""
+        self.effective_start_date = self.start_date
+        self.effective_end_date = self.end_date
+        self.rolled_up_progress = self.progress
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 저장 시 상위 작업 변경 여부를 알 수 있도록 불러온 시점의 값을 보관합니다.
+        if 'parent_task_id' in field_names:
+            instance._loaded_parent_task_id = instance.parent_task_id
+        return instance
+    
+    def build_path(self):
+        """현재 상위 작업 기준의 계층 경로"""
+        parent_path = ''
+        if self.parent_task_id:
+            parent_path = Task.objects.filter(pk=self.parent_task_id).values_list('path', flat=True).get()
+        return f'{parent_path}{self.pk}/'
+    
+    def refresh_path(self):
+        """
+        상위 작업을 기준으로 계층 경로와 깊이를 갱신합니다.
+        상위 작업이 바뀐 경우 하위 작업 전체의 경로도 한 번의 UPDATE로 옮깁니다.
+        """
+        new_path = self.build_path()
+        if new_path == self.path:
+            return
+        
+        new_depth = new_path.count('/') - 1
+        if self.path:
+            Task.objects.filter(path__startswith=self.path).exclude(pk=self.pk).update(
+                path=Concat(Value(new_path), Substr('path', len(self.path) + 1), output_field=models.CharField()),
+                depth=F('depth') + (new_depth - self.depth),
+            )
+        Task.objects.filter(pk=self.pk).update(path=new_path, depth=new_depth)
+        self.path = new_path
+        self.depth = new_depth
     
     def generate_random_color(self):
         """랜덤한 파스텔 색상 생성"""
@@ -107,38 +192,42 @@ class Task(models.Model):
         ]
         return random.choice(colors)
     
+    @property
+    def ancestor_ids(self):
+        """루트부터 직계 상위 작업까지의 ID 목록"""
+        return [int(task_id) for task_id in self.path.split('/')[:-2]]
+    
+    def get_ancestors(self):
+        """모든 상위 작업 (단일 쿼리)"""
+        return Task.objects.filter(pk__in=self.ancestor_ids).order_by('depth')
+    
+    def get_descendants(self, include_self=False):
+        """모든 하위 작업 (경로 인덱스를 사용하는 단일 쿼리)"""
+        descendants = Task.objects.filter(path__startswith=self.path)
+        if not include_self:
+            descendants = descendants.exclude(pk=self.pk)
+        return descendants
+    
+    def is_descendant_of(self, other):
+        """other의 하위 작업(또는 자기 자신)인지 확인"""
+        return bool(other.path) and self.path.startswith(other.path)
+    
     @property
     def is_parent_task(self):
         """상위 작업인지 확인"""
-        return self.parent_task is None
+        return self.parent_task_id is None
     
     @property
     def has_subtasks(self):
         """하위 작업이 있는지 확인"""
-        return self.subtasks.exists()
+        return self.subtask_count > 0
     
     @property
     def total_duration(self):
-        """작업 기간 계산 (주말 제외)"""
-        from datetime import timedelta
-        current_date = self.start_date
-        end_date = self.end_date
-        work_days = 0
-        
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # 월요일(0) ~ 금요일(4)
-                work_days += 1
-            current_date += timedelta(days=1)
-        
-        return work_days
-    
-    @property
-    def effective_end_date(self):
-        """상위 작업의 경우 하위 작업들의 최대 종료일 반환"""
-        if self.is_parent_task and self.has_subtasks:
-            max_end_date = max(subtask.end_date for subtask in self.subtasks.all())
-            return max_end_date
-        return self.end_date
+        """작업 기간 계산 (주말 및 휴일 제외)"""
+        from .workdays import get_calendar
+        return get_calendar().count_workdays(self.start_date, self.end_date)
+
 
 
 class TaskComment(models.Model):
@@ -162,6 +251,143 @@ class TaskComment(models.Model):
         verbose_name = '작업 댓글'
         verbose_name_plural = '작업 댓글들'
         ordering = ['-created_at']
+        indexes = [
+            # 작업별 댓글 (task_id, -created_at)
+            models.Index(fields=['task', '-created_at'], name='comment_task_created_idx'),
+            # 전체 댓글 목록/키셋 페이지네이션 (-created_at, id)
+            models.Index(fields=['-created_at', 'id'], name='comment_created_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.author.username}의 댓글 - {self.task.title}"
+
+
+class TaskDependency(models.Model):
+    """
+    작업 간 선후행 관계
+    지연(lag)은 업무일 단위이며, 음수이면 선행 작업과 겹쳐 진행(lead)합니다.
+    """
+    TYPE_CHOICES = [
+        ('FS', '종료-시작'),
+        ('SS', '시작-시작'),
+        ('FF', '종료-종료'),
+        ('SF', '시작-종료'),
+    ]
+    
+    predecessor = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name='successor_links',
+        verbose_name='선행 작업'
+    )
+    successor = models.ForeignKey(
+        Task,
+        on_delete=models.CASCADE,
+        related_name='predecessor_links',
+        verbose_name='후행 작업'
+    )
+    dependency_type = models.CharField(max_length=2, choices=TYPE_CHOICES, default='FS', verbose_name='관계 유형')
+    lag = models.IntegerField(default=0, verbose_name='지연 (업무일)')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    
+    class Meta:
+        verbose_name = '작업 선후행 관계'
+        verbose_name_plural = '작업 선후행 관계들'
+        ordering = ['id']
+        unique_together = ['predecessor', 'successor']
+        constraints = [
+            models.CheckConstraint(check=~models.Q(predecessor=F('successor')), name='dependency_not_self'),
+        ]
+    
+    def __str__(self):
+        return f"{self.predecessor_id} -{self.dependency_type}({self.lag:+d})-> {self.successor_id}"
+
+
+class DataVersion(models.Model):
+    """
+    WBS 데이터 버전 (단일 행)
+    작업/댓글/담당자가 바뀔 때마다 시그널에서 1씩 증가하며,
+    조회 API의 ETag와 Last-Modified를 만드는 데 사용됩니다.
+    """
+    GLOBAL_ID = 1
+    
+    version = models.BigIntegerField(default=0, verbose_name='버전')
+    updated_at = models.DateTimeField(default=timezone.now, verbose_name='수정일')
+    # 이 버전까지의 변경 로그는 정리되어, 그보다 오래된 동기화 토큰은 전체 동기화가 필요합니다.
+    pruned_version = models.BigIntegerField(default=0, verbose_name='정리된 변경 로그 버전')
+    
+    class Meta:
+        verbose_name = '데이터 버전'
+        verbose_name_plural = '데이터 버전들'
+    
+    def __str__(self):
+        return f"v{self.version}"
+    
+    @classmethod
+    def current(cls):
+        """
+        현재 버전 조회 (기본 키 단일 조회)
+        get_or_create는 항상 주 DB에서 읽으므로, 응답 데이터와 같은 DB(읽기 복제본)에서 먼저 읽습니다.
+        """
+        try:
+            return cls.objects.get(pk=cls.GLOBAL_ID)
+        except cls.DoesNotExist:
+            version, _ = cls.objects.get_or_create(pk=cls.GLOBAL_ID)
+            return version
+    
+    @classmethod
+    async def acurrent(cls):
+        """current()의 비동기 버전"""
+        try:
+            return await cls.objects.aget(pk=cls.GLOBAL_ID)
+        except cls.DoesNotExist:
+            version, _ = await cls.objects.aget_or_create(pk=cls.GLOBAL_ID)
+            return version
+    
+    @classmethod
+    def bump(cls):
+        """
+        버전을 원자적으로 1 증가시킵니다.
+        UPDATE로 이 행이 트랜잭션 끝까지 잠기므로, 버전을 올린 쓰기들은 버전 순서대로 커밋됩니다.
+        """
+        updated = cls.objects.filter(pk=cls.GLOBAL_ID).update(
+            version=F('version') + 1,
+            updated_at=timezone.now()
+        )
+        if not updated:
+            cls.objects.get_or_create(pk=cls.GLOBAL_ID, defaults={'version': 1})
+
+
+class ChangeLog(models.Model):
+    """
+    작업/댓글 변경 로그
+    증분 동기화(tasks/changes/)에서 마지막 토큰 이후의 변경과 삭제 기록(tombstone)을
+    찾는 데 사용됩니다. 기록할 때 올린 데이터 버전(version)이 곧 동기화 위치입니다.
+    (자동 증가 ID는 커밋 전에 정해져 커밋 순서와 다를 수 있으므로 위치로 쓰지 않습니다.)
+    """
+    MODEL_CHOICES = [
+        ('task', '작업'),
+        ('comment', '댓글'),
+    ]
+    ACTION_CHOICES = [
+        ('upsert', '생성/수정'),
+        ('delete', '삭제'),
+    ]
+    
+    model = models.CharField(max_length=10, choices=MODEL_CHOICES, verbose_name='대상 모델')
+    object_id = models.BigIntegerField(verbose_name='대상 ID')
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES, verbose_name='변경 유형')
+    version = models.BigIntegerField(default=0, verbose_name='데이터 버전')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='기록일')
+    
+    class Meta:
+        verbose_name = '변경 로그'
+        verbose_name_plural = '변경 로그들'
+        ordering = ['version', 'id']
+        indexes = [
+            # 토큰 이후의 변경 조회와 정리 (version, id)
+            models.Index(fields=['version', 'id'], name='changelog_version_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.author.username}의 댓글 - {self.task.title}"
\ No newline at end of file
+        return f"{self.model}#{self.object_id} {self.action}"
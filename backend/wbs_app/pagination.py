@@ -0,0 +1,211 @@
+"""
+키셋(커서) 페이지네이션과 스트리밍 목록 응답
+
+- KeysetPagination: 정렬 키의 마지막 값을 커서로 넘겨 다음 페이지를 찾습니다.
+  OFFSET을 쓰지 않으므로 중간에 행이 추가되어도 중복/누락 없이 이어집니다.
+  cursor 또는 page_size 파라미터가 있을 때만 동작하여 기존 배열 응답과 호환됩니다.
+- streaming_list_response: QuerySet.iterator(chunk_size)로 읽으면서 JSON 배열을 흘려보내
+  테이블 크기와 관계없이 요청당 메모리를 일정하게 유지합니다.
+  ASGI의 비동기 뷰에서는 비동기 이터레이터로 흘려보내는 astreaming_list_response를 씁니다.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .renderers import render_json
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder는 시각을 밀리초까지만 쓰므로, 커서에는 마이크로초까지 그대로 씁니다.
+    (잘린 값으로 비교하면 같은 밀리초 안의 뒤쪽 행들을 건너뜁니다.)
+    """
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(BasePagination):
+    """정렬 키 기반 커서 페이지네이션"""
+    ordering = ('id',)
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    invalid_cursor_message = '잘못된 커서입니다.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page = self.page_queryset(queryset, request)
+        return self.set_page(list(page)) if page is not None else None
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset()의 비동기 버전"""
+        page = self.page_queryset(queryset, request)
+        return self.set_page([row async for row in page]) if page is not None else None
+
+    def page_queryset(self, queryset, request):
+        """이번 페이지 행과 다음 페이지 여부 확인용 한 행을 고르는 쿼리셋 (페이지 요청이 아니면 None)"""
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.after(self.decode_cursor(cursor, queryset.model)))
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, api_settings.PAGE_SIZE))
+        except ValueError:
+            page_size = api_settings.PAGE_SIZE
+        return max(1, min(page_size, self.max_page_size))
+
+    def after(self, position):
+        """
+        position 뒤에 오는 행 조건
+        (a, b, c) > (x, y, z) == a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+        내림차순 키는 비교 방향을 뒤집습니다.
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def encode_cursor(self, row):
+        position = [getattr(row, field.lstrip('-')) for field in self.ordering]
+        raw = json.dumps(position, cls=CursorEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor, model):
+        """커서를 정렬 필드 값 목록으로 바꿉니다. 각 값은 model의 해당 필드 형식(날짜, 문자열, 정수)으로 읽습니다."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            position = json.loads(raw)
+        except (ValueError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        values = []
+        for field_name, value in zip(self.ordering, position):
+            name = field_name.lstrip('-')
+            field = model._meta.pk if name == 'pk' else model._meta.get_field(name)
+            try:
+                value = field.to_python(value)
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+            # 정렬 키는 NULL이 아니므로 None은 위조된 커서입니다.
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            values.append(value)
+        return values
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+
+class TaskKeysetPagination(KeysetPagination):
+    ordering = ('start_date', 'title', 'id')
+
+
+class CommentKeysetPagination(KeysetPagination):
+    ordering = ('-created_at', 'id')
+
+
+class UserKeysetPagination(KeysetPagination):
+    ordering = ('username', 'id')
+
+
+def wants_stream(request):
+    """?stream=1 요청 여부"""
+    return request.query_params.get('stream') in ('1', 'true')
+
+
+def streaming_list_response(queryset, serializer_class, context=None, chunk_size=500):
+    """
+    쿼리셋을 chunk_size 단위로 읽고 직렬화하여 JSON 배열로 흘려보냅니다.
+    prefetch_related는 청크마다 적용됩니다.
+    """
+    def generate():
+        yield b'['
+        separator = b''
+        rows = queryset.iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            for item in serializer_class(chunk, many=True, context=context).data:
+                yield separator + render_json(item)
+                separator = b','
+        yield b']'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
+
+
+def astreaming_list_response(queryset, serializer_class, context=None, chunk_size=500):
+    """
+    streaming_list_response()의 비동기 버전
+    청크를 키셋 조건으로 이어 읽고, 청크마다 (prefetch 포함) 조회와 직렬화를 DB 스레드에서 실행합니다.
+    ASGI는 동기 이터레이터 응답을 끝까지 모은 뒤 보내므로 비동기 제너레이터가 필요합니다.
+    """
+    keyset = KeysetPagination()
+    keyset.ordering = tuple(queryset.query.order_by) or ('pk',)
+    queryset = queryset.order_by(*keyset.ordering)
+
+    def read_chunk(position):
+        chunk = queryset.filter(keyset.after(position)) if position else queryset
+        rows = list(chunk[:chunk_size])
+        if not rows:
+            return None, b''
+        last = [getattr(rows[-1], field.lstrip('-')) for field in keyset.ordering]
+        data = serializer_class(rows, many=True, context=context).data
+        return last, b','.join(render_json(item) for item in data)
+
+    async def generate():
+        yield b'['
+        position, separator = None, b''
+        while True:
+            position, body = await sync_to_async(read_chunk)(position)
+            if position is None:
+                break
+            yield separator + body
+            separator = b','
+        yield b']'
+
+    return StreamingHttpResponse(generate(), content_type='application/json')
@@ -0,0 +1,120 @@
+"""
+orjson 기반 JSON 렌더러
+
+DRF JSONRenderer와 같은 바이트를 더 빠르게 만듭니다.
+- dict/list 하위 클래스(ReturnDict, OrderedDict 등)와 UUID는 orjson이 복사 없이 직접 직렬화하고,
+  date는 isoformat으로 바로 변환합니다.
+- datetime/time, Decimal, 지연 번역 문자열 등은 DRF JSONEncoder 규칙(밀리초, 'Z' 표기 등)을 그대로 따릅니다.
+- orjson이 설치되어 있지 않거나, 들여쓰기/ASCII 출력처럼 표준 json만 지원하는 설정이거나,
+  orjson 출력이 표준 json과 달라질 수 있는 값(지수 표기 실수, 64비트를 넘는 정수,
+  문자열이 아닌 dict 키)이 있으면 DRF 기본 구현으로 렌더링합니다.
+- 단, NaN/Infinity는 오류 대신 null로 출력됩니다.
+- 이미 렌더링된 JSON 조각(RawJSON)은 다시 직렬화하지 않고 출력 바이트에 그대로 이어 붙입니다.
+"""
+import datetime
+import json
+import os
+import re
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 숫자 토큰 중 지수 표기(1e16)나 1e-4 미만 고정 소수(0.00001)는 표준 json과 표기가 다릅니다.
+# 전체 출력을 훑는 비용을 줄이기 위해 빠른 사전 검사(EXPONENT_HINT_RE, '0.0000')를 먼저 합니다.
+EXPONENT_HINT_RE = re.compile(rb'e[-0-9]')
+DIVERGENT_FLOAT_RE = re.compile(rb'[:,\[]-?(?:[0-9.]+e|0\.0000)')
+# RawJSON 조각 자리에 넣는 표식 ("\u0000<렌더링마다 다른 값>:<순번>")
+# 값 위치(:, ',', [ 바로 뒤이고 ',', ], } 바로 앞)의 문자열 전체만 찾아,
+# 다른 문자열 안의 이스케이프된 따옴표 뒤나 dict 키는 건너뜁니다.
+FRAGMENT_MARK_RE = re.compile(rb'(?<=[:,\[])"\\u0000([0-9a-f]{16}):([0-9]+)"(?=[,\]}])')
+
+
+
+class RawJSON(bytes):
+    """render_json으로 미리 렌더링한 JSON 조각 (응답에 그대로 이어 붙입니다)"""
+    __slots__ = ()
+
+
+class FragmentJSONEncoder(JSONEncoder):
+    """표준 json 경로에서는 조각을 다시 읽어 일반 값으로 직렬화합니다."""
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            return json.loads(obj)
+        return super().default(obj)
+
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """orjson이 직접 처리하지 않는 값은 DRF JSONEncoder로 변환합니다."""
+    if type(obj) is datetime.date:
+        return obj.isoformat()
+    return _encoder.default(obj)
+
+
+def orjson_dumps(data):
+    """
+    DRF JSONRenderer(압축, UTF-8, 엄격 모드)와 같은 바이트를 orjson으로 만듭니다.
+    같은 결과를 보장할 수 없으면 None을 반환합니다.
+    """
+    if orjson is None:
+        return None
+    # 조각 자리에는 요청마다 다른 표식 문자열을 넣었다가 직렬화 후 조각 바이트로 바꿉니다.
+    fragments = []
+    nonce = os.urandom(8).hex()
+
+    def default(obj):
+        if isinstance(obj, RawJSON):
+            fragments.append(obj)
+            return f'\x00{nonce}:{len(fragments) - 1}'
+        return _default(obj)
+
+    try:
+        content = orjson.dumps(data, default=default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    except orjson.JSONEncodeError:
+        return None
+    if (EXPONENT_HINT_RE.search(content) or b'0.0000' in content) and DIVERGENT_FLOAT_RE.search(content):
+        return None
+    # DRF와 같이 자바스크립트 문자열에서 줄바꿈으로 해석되는 문자를 이스케이프합니다.
+    if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+        content = content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    if fragments:
+        nonce = nonce.encode()
+        content = FRAGMENT_MARK_RE.sub(
+            lambda match: fragments[int(match[2])] if match[1] == nonce and int(match[2]) < len(fragments) else match[0],
+            content
+        )
+    return content
+
+
+class ORJSONRenderer(JSONRenderer):
+    """orjson으로 렌더링하고, 결과가 달라질 수 있는 경우 DRF JSONRenderer로 돌아갑니다."""
+    encoder_class = FragmentJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        uses_defaults = (
+            self.encoder_class is FragmentJSONEncoder
+            and not self.ensure_ascii and self.compact and self.strict
+            and self.get_indent(accepted_media_type, renderer_context) is None
+        )
+        if uses_defaults:
+            content = orjson_dumps(data)
+            if content is not None:
+                return content
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+def render_json(data):
+    """뷰 밖(스트리밍 응답 등)에서 API 응답과 같은 형식으로 JSON 바이트를 만듭니다."""
+    return ORJSONRenderer().render(data)
@@ -0,0 +1,190 @@
+"""
+상위 작업 롤업 엔진
+
+작업이 바뀌면 다시 계산해야 할 상위 작업을 트랜잭션 동안 모아 두었다가,
+커밋 후(transaction.on_commit) 한 번에 계산합니다.
+- 모인 작업들의 모든 상위 작업(조상)을 경로 인덱스로 찾아 깊은 단계부터 계산합니다.
+- 단계마다 하위 작업 조회 1회와 bulk_update 1회만 수행합니다.
+- 대상 행을 ID 순서로 잠가(select_for_update) 동시에 쓰는 작업자와 충돌하지 않게 합니다.
+
+계산하는 값은 시작일/종료일(하위 작업 Min/Max), 하위 작업 수, 실제 시작일/종료일,
+업무일 수로 가중 평균한 롤업 진행률입니다.
+"""
+import threading
+from collections import defaultdict
+
+from django.db import transaction
+
+from .models import Task
+from .workdays import get_calendar
+
+_state = threading.local()
+
+ROLLUP_FIELDS = [
+    'start_date', 'end_date', 'subtask_count',
+    'effective_start_date', 'effective_end_date', 'rolled_up_progress',
+]
+# summarize()가 하위 작업에서 읽는 값
+CHILD_FIELDS = ['start_date', 'end_date', 'effective_start_date', 'effective_end_date', 'rolled_up_progress']
+
+
+def summarize(task, children):
+    """
+    하위 작업 값 목록으로 task의 롤업 필드를 계산해 반영합니다.
+    children: CHILD_FIELDS 순서의 튜플 목록
+    반환: 값이 바뀌었는지 여부
+    """
+    before = [getattr(task, field) for field in ROLLUP_FIELDS]
+
+    task.subtask_count = len(children)
+    if children:
+        starts, ends, effective_starts, effective_ends, progresses = zip(*children)
+        task.start_date = min(starts)
+        task.end_date = max(ends)
+        task.effective_start_date = min(day for day in effective_starts + starts if day)
+        task.effective_end_date = max(day for day in effective_ends + ends if day)
+
+        calendar = get_calendar()
+        weights = [max(calendar.count_workdays(start, end), 1) for start, end in zip(starts, ends)]
+        weighted = sum(weight * progress for weight, progress in zip(weights, progresses))
+        task.rolled_up_progress = round(weighted / sum(weights))
+    else:
+        # 마지막 하위 작업이 빠져도 일정은 그대로 두고 롤업 값만 자신의 값으로 돌립니다.
+        task.apply_leaf_rollups()
+
+    return before != [getattr(task, field) for field in ROLLUP_FIELDS]
+
+
+def summarize_unsaved(tasks, parents):
+    """
+    아직 저장하지 않은 작업 트리의 롤업 값을 메모리에서 계산합니다 (일괄 생성/가져오기용).
+    tasks: 상위 작업이 항상 하위 작업보다 앞에 오는 작업 목록
+    parents: 같은 순서의 상위 작업 순번 목록 (목록 밖의 작업이 상위 작업이면 None)
+    """
+    children = defaultdict(list)
+    for index in range(len(tasks) - 1, -1, -1):
+        task = tasks[index]
+        summarize(task, children.pop(index, []))
+        if parents[index] is not None:
+            children[parents[index]].append(tuple(getattr(task, field) for field in CHILD_FIELDS))
+
+
+def mark_dirty(*task_ids):
+    """주어진 작업들의 롤업 재계산을 현재 트랜잭션 커밋 후로 예약합니다."""
+    task_ids = {task_id for task_id in task_ids if task_id}
+    if not task_ids:
+        return
+    batch = getattr(_state, 'batch', None)
+    if batch is None:
+        batch = _state.batch = set()
+    batch.update(task_ids)
+    # 세이브포인트가 롤백되면 콜백도 사라지므로 매번 등록합니다.
+    # 같은 묶음은 처음 실행된 콜백이 모두 처리하고 나머지는 아무 일도 하지 않습니다.
+    transaction.on_commit(lambda: _flush(batch))
+
+
+def _flush(batch):
+    if getattr(_state, 'batch', None) is batch:
+        _state.batch = None
+    task_ids = set(batch)
+    batch.clear()
+    if task_ids:
+        rollup(task_ids)
+
+
+def rollup(task_ids):
+    """
+    주어진 작업들과 그 모든 상위 작업의 롤업 값을
+    하위 작업 기준으로 아래 단계부터 다시 계산합니다.
+    반환: 값이 바뀐 작업 목록
+    """
+    from .signals import tasks_bulk_saved
+
+    with transaction.atomic():
+        affected = set()
+        for path in Task.objects.filter(pk__in=task_ids).values_list('path', flat=True):
+            affected.update(int(task_id) for task_id in path.split('/')[:-1])
+
+        levels = defaultdict(list)
+        for task in Task.objects.select_for_update().filter(pk__in=affected).order_by('id'):
+            levels[task.depth].append(task)
+
+        changed = []
+        for depth in sorted(levels, reverse=True):
+            tasks = {task.id: task for task in levels[depth]}
+            children = defaultdict(list)
+            child_rows = (
+                Task.objects.filter(parent_task__in=tasks.keys())
+                .order_by()
+                .values_list('parent_task', *CHILD_FIELDS)
+            )
+            for parent_id, *values in child_rows:
+                children[parent_id].append(tuple(values))
+
+            level_changed = [task for task in tasks.values() if summarize(task, children[task.id])]
+            # 다음(상위) 단계 계산이 갱신된 값을 보도록 단계마다 저장합니다.
+            Task.objects.bulk_update(level_changed, ROLLUP_FIELDS)
+            changed.extend(level_changed)
+
+        tasks_bulk_saved(changed)
+    return changed
+
+
+class _Node:
+    """전체 재계산용 경량 작업 레코드"""
+    __slots__ = ['id', 'parent_task_id', 'path', 'depth', 'progress'] + ROLLUP_FIELDS
+
+    def apply_leaf_rollups(self):
+        Task.apply_leaf_rollups(self)
+
+
+def rebuild_all(batch_size=1000):
+    """
+    모든 작업의 계층 경로/깊이와 롤업 값을 부모 관계로부터 일괄 재계산합니다.
+    전체를 가벼운 레코드로 한 번 읽고, 바뀐 작업만 batch_size 단위로 저장합니다.
+    반환: 저장한 작업 수
+    """
+    from .signals import tasks_bulk_saved
+
+    fields = ['id', 'parent_task_id', 'path', 'depth', 'progress'] + ROLLUP_FIELDS
+    nodes = {}
+    for values in Task.objects.order_by().values_list(*fields).iterator(chunk_size=batch_size):
+        node = _Node()
+        for field, value in zip(fields, values):
+            setattr(node, field, value)
+        nodes[node.id] = node
+
+    children = defaultdict(list)
+    for node in nodes.values():
+        children[node.parent_task_id].append(node)
+
+    # 위에서부터 경로를 만들고 (깊이 우선), 깊은 단계부터 롤업합니다.
+    # 상위 작업은 항상 하위 작업보다 먼저 방문하며, 롤업 순서는 아래에서 depth로 정렬해 정합니다.
+    order, dirty = [], set()
+    stack = [(node, '') for node in children[None]]
+    while stack:
+        node, parent_path = stack.pop()
+        path = f'{parent_path}{node.id}/'
+        if (node.path, node.depth) != (path, path.count('/') - 1):
+            node.path, node.depth = path, path.count('/') - 1
+            dirty.add(node.id)
+        order.append(node)
+        stack.extend((child, path) for child in children[node.id])
+
+    for node in sorted(order, key=lambda node: node.depth, reverse=True):
+        child_values = [
+            tuple(getattr(child, field) for field in CHILD_FIELDS)
+            for child in children[node.id]
+        ]
+        if summarize(node, child_values):
+            dirty.add(node.id)
+
+    update_fields = ['path', 'depth'] + ROLLUP_FIELDS
+    pending = [
+        Task(**{field: getattr(nodes[task_id], field) for field in ['id'] + update_fields})
+        for task_id in dirty
+    ]
+    with transaction.atomic():
+        Task.objects.bulk_update(pending, update_fields, batch_size=batch_size)
+        tasks_bulk_saved(pending)
+    return len(pending)
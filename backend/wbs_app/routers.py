@@ -0,0 +1,59 @@
+"""
+주 DB / 읽기 복제본 라우터
+
+쓰기는 항상 주 DB(default)로 보내고, 조회는 ReplicaRoutingMiddleware가 요청마다 정한
+별칭(read_database)으로 보냅니다. 요청 밖(관리 명령, 시그널 등)이나 트랜잭션 안의 조회는 주 DB에서 읽습니다.
+복제본(replica 별칭)이 설정되어 있지 않으면 아무것도 바꾸지 않습니다.
+
+복제본은 주 DB보다 늦을 수 있으므로, 시그널로 무효화되는 공유 캐시(가지 조각, 대시보드)는
+복제본이 주 DB를 따라잡은 상태에서 읽은 결과만 저장합니다 (replica_caught_up).
+"""
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+# 현재 요청의 조회 별칭 (None이면 주 DB)
+read_database = ContextVar('read_database', default=None)
+
+
+def replica_configured():
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def reading_replica():
+    """지금 실행되는 조회가 복제본으로 가는지"""
+    return read_database.get() is not None and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+def replica_caught_up(version):
+    """
+    요청 시작 시 읽은 데이터 버전(version)이 주 DB의 현재 버전과 같은지 (복제본 조회일 때만 주 DB 조회 1회)
+    같으면 그 사이 복제본에서 읽은 데이터가 주 DB와 같으므로 공유 캐시에 저장해도 됩니다.
+    """
+    if not reading_replica():
+        return True
+    if version is None:
+        return False
+    from .models import DataVersion
+    return DataVersion.objects.using(DEFAULT_DB_ALIAS).filter(pk=DataVersion.GLOBAL_ID, version=version).exists()
+
+
+class PrimaryReplicaRouter:
+    """쓰기와 마이그레이션은 주 DB, 조회는 요청별로 정한 DB로 보냅니다."""
+
+    def db_for_read(self, model, **hints):
+        return read_database.get() if reading_replica() else None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 주 DB와 같은 데이터이므로 어느 쪽에서 읽은 객체끼리도 연결할 수 있습니다.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본의 스키마는 복제로 따라옵니다.
+        return False if db == REPLICA_DB_ALIAS else None
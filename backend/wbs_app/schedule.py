@@ -0,0 +1,260 @@
+"""
+선후행 관계 기반 일정 계산 (CPM, 주공정)
+
+작업을 노드, 선후행 관계(FS/SS/FF/SF + 업무일 지연)를 간선으로 보고
+위상 정렬(Kahn) 순서로 한 번씩 훑어 O(V+E)에 계산합니다.
+- 전진 계산: 가장 빠른 시작/종료 (계획 시작일보다 앞당기지는 않습니다)
+- 후진 계산: 프로젝트 종료일 기준 가장 늦은 시작/종료
+- 총 여유(total float) = 가장 늦은 시작 - 가장 빠른 시작, 0이면 주공정
+
+날짜는 업무일 번호(WorkCalendar.workday_index)로 바꿔 정수로 계산하며,
+종료는 마지막 업무일 다음 번호(배타적 끝)로 다룹니다.
+상위 작업도 롤업된 계획 기간을 가진 하나의 작업으로 계산합니다.
+결과는 데이터 버전별로 캐시됩니다.
+"""
+from datetime import timedelta
+
+from .cache import get_schedule
+from .models import DataVersion, Task, TaskDependency
+from .workdays import get_calendar
+
+ONE_DAY = timedelta(days=1)
+
+
+class DependencyCycle(ValueError):
+    """선후행 관계에 순환이 있습니다."""
+
+    def __init__(self, task_ids):
+        super().__init__(task_ids)
+        self.task_ids = task_ids
+
+
+def find_cycle(pending, edges):
+    """
+    위상 정렬 후 남은 노드(pending) 안에서 순환 하나를 찾아 순서대로 반환합니다.
+    남은 노드는 모두 남은 노드 중에 선행 노드가 있으므로, 선행 노드를 따라가면 반드시 되돌아옵니다.
+    """
+    predecessor = {}
+    for source, target in edges:
+        if source in pending and target in pending:
+            predecessor.setdefault(target, source)
+
+    seen = {}
+    node = next(iter(pending))
+    while node not in seen:
+        seen[node] = len(seen)
+        node = predecessor[node]
+    walk = list(seen)[seen[node]:]
+    return walk[::-1]
+
+
+def successor_start(kind, lag, start, finish, duration):
+    """
+    선행 작업이 [start, finish) 업무일 번호에 놓였을 때
+    관계 유형(kind)과 지연(lag)이 허용하는 후행 작업(기간 duration)의 가장 빠른 시작 번호
+    """
+    if kind == 'FS':
+        return finish + lag
+    if kind == 'SS':
+        return start + lag
+    if kind == 'FF':
+        return finish + lag - duration
+    return start + lag - duration  # SF
+
+
+def compute_schedule(tasks, dependencies, calendar=None):
+    """
+    tasks: (작업 ID, 시작일, 종료일) 목록
+    dependencies: (관계 ID, 선행 작업 ID, 후행 작업 ID, 유형, 지연) 목록
+    반환: 일정 계산 결과 dict. 순환이 있으면 DependencyCycle을 발생시킵니다.
+    """
+    calendar = calendar or get_calendar()
+    ids = [task_id for task_id, _, _ in tasks]
+    position = {task_id: index for index, task_id in enumerate(ids)}
+    count = len(ids)
+
+    # 업무일 번호 기준 계획 시작과 기간 (주말/휴일만 걸친 작업은 기간 0)
+    # 작업 날짜는 대부분 겹치므로 날짜별 번호를 한 번만 계산합니다.
+    numbers = {}
+    def to_number(day):
+        if day not in numbers:
+            numbers[day] = calendar.workday_index(day)
+        return numbers[day]
+
+    planned = [to_number(start) for _, start, _ in tasks]
+    durations = [to_number(end + ONE_DAY) - to_number(start) for _, start, end in tasks]
+
+    successors = [[] for _ in range(count)]
+    indegree = [0] * count
+    edges = []
+    for dependency_id, predecessor_id, successor_id, kind, lag in dependencies:
+        source, target = position.get(predecessor_id), position.get(successor_id)
+        if source is None or target is None:
+            continue
+        successors[source].append((target, kind, lag))
+        indegree[target] += 1
+        edges.append((dependency_id, source, target, kind, lag))
+
+    # Kahn 위상 정렬
+    order = [index for index in range(count) if not indegree[index]]
+    for index in order:
+        for target, _, _ in successors[index]:
+            indegree[target] -= 1
+            if not indegree[target]:
+                order.append(target)
+    if len(order) < count:
+        pending = {index for index in range(count) if indegree[index]}
+        cycle = find_cycle(pending, [(source, target) for _, source, target, _, _ in edges])
+        raise DependencyCycle([ids[index] for index in cycle])
+
+    # 전진 계산: 후행 작업의 가장 빠른 시작을 제약 중 가장 늦은 값으로 밉니다.
+    early_start = list(planned)
+    for index in order:
+        start = early_start[index]
+        finish = start + durations[index]
+        for target, kind, lag in successors[index]:
+            bound = successor_start(kind, lag, start, finish, durations[target])
+            if bound > early_start[target]:
+                early_start[target] = bound
+    early_finish = [start + duration for start, duration in zip(early_start, durations)]
+
+    # 후진 계산: 프로젝트 종료에서 거꾸로 가장 늦은 종료를 당깁니다.
+    project_finish = max(early_finish, default=0)
+    late_finish = [project_finish] * count
+    for index in reversed(order):
+        duration = durations[index]
+        for target, kind, lag in successors[index]:
+            if kind == 'FS':
+                bound = late_finish[target] - durations[target] - lag
+            elif kind == 'SS':
+                bound = late_finish[target] - durations[target] - lag + duration
+            elif kind == 'FF':
+                bound = late_finish[target] - lag
+            else:  # SF
+                bound = late_finish[target] - lag + duration
+            if bound < late_finish[index]:
+                late_finish[index] = bound
+    late_start = [finish - duration for finish, duration in zip(late_finish, durations)]
+
+    # 같은 업무일 번호가 반복되므로 날짜 변환 결과를 재사용합니다.
+    dates = {}
+    def to_date(number):
+        if number not in dates:
+            dates[number] = calendar.workday_at(number)
+        return dates[number]
+
+    rows = []
+    critical = [False] * count
+    for index in order:
+        total_float = late_start[index] - early_start[index]
+        critical[index] = total_float == 0
+        rows.append({
+            'id': ids[index],
+            'earliest_start': to_date(early_start[index]),
+            'earliest_finish': to_date(max(early_finish[index] - 1, early_start[index])),
+            'latest_start': to_date(late_start[index]),
+            'latest_finish': to_date(max(late_finish[index] - 1, late_start[index])),
+            'total_float': total_float,
+            'is_critical': critical[index],
+        })
+
+    links = []
+    for dependency_id, source, target, kind, lag in edges:
+        # 양쪽이 주공정이고 후행 작업의 시작을 실제로 결정한 관계만 주공정 관계입니다.
+        if kind == 'FS':
+            driving = early_finish[source] + lag == early_start[target]
+        elif kind == 'SS':
+            driving = early_start[source] + lag == early_start[target]
+        elif kind == 'FF':
+            driving = early_finish[source] + lag == early_finish[target]
+        else:
+            driving = early_start[source] + lag == early_finish[target]
+        links.append({
+            'id': dependency_id,
+            'predecessor': ids[source],
+            'successor': ids[target],
+            'dependency_type': kind,
+            'lag': lag,
+            'is_critical': driving and critical[source] and critical[target],
+        })
+
+    project_start = min(early_start, default=0)
+    return {
+        'project_start': to_date(project_start) if count else None,
+        'project_finish': to_date(max(project_finish - 1, project_start)) if count else None,
+        'critical_path': [ids[index] for index in order if critical[index]],
+        'tasks': rows,
+        'dependencies': links,
+        'cycle': None,
+    }
+
+
+def build_schedule():
+    """전체 작업과 선후행 관계를 읽어 일정을 계산합니다 (쿼리 2회)."""
+    tasks = list(Task.objects.order_by().values_list('id', 'start_date', 'end_date'))
+    dependencies = list(
+        TaskDependency.objects.order_by().values_list('id', 'predecessor_id', 'successor_id', 'dependency_type', 'lag')
+    )
+    try:
+        return compute_schedule(tasks, dependencies)
+    except DependencyCycle as error:
+        # 순환은 저장 시 검증으로 막지만, 관리자 화면 등으로 들어온 경우에도 응답은 돌려줍니다.
+        return {
+            'project_start': None,
+            'project_finish': None,
+            'critical_path': [],
+            'tasks': [],
+            'dependencies': [
+                {'id': dependency_id, 'predecessor': predecessor_id, 'successor': successor_id,
+                 'dependency_type': kind, 'lag': lag, 'is_critical': False}
+                for dependency_id, predecessor_id, successor_id, kind, lag in dependencies
+            ],
+            'cycle': error.task_ids,
+        }
+
+
+def get_project_schedule(version=None):
+    """
+    현재 데이터 버전의 일정 계산 결과 (캐시)
+    version: 이미 읽은 DataVersion.version (없으면 조회)
+    """
+    if version is None:
+        version = DataVersion.current().version
+    return get_schedule(version, build_schedule)
+
+
+def restrict_schedule(schedule, task_ids):
+    """화면에 보이는 작업(task_ids)에 해당하는 일정과 양쪽 끝이 모두 보이는 관계만 남깁니다."""
+    return dict(
+        schedule,
+        critical_path=[task_id for task_id in schedule['critical_path'] if task_id in task_ids],
+        tasks=[row for row in schedule['tasks'] if row['id'] in task_ids],
+        dependencies=[
+            link for link in schedule['dependencies']
+            if link['predecessor'] in task_ids and link['successor'] in task_ids
+        ],
+    )
+
+
+def creates_cycle(predecessor_id, successor_id, exclude=None):
+    """
+    predecessor → successor 관계를 추가하면 순환이 생기는지 확인합니다.
+    successor에서 후행 관계를 따라 predecessor에 닿는지 너비 우선으로 탐색합니다 (O(V+E)).
+    exclude: 수정 중인 관계 ID (자기 자신은 제외)
+    """
+    links = TaskDependency.objects.order_by()
+    if exclude is not None:
+        links = links.exclude(pk=exclude)
+    successors = {}
+    for source, target in links.values_list('predecessor_id', 'successor_id'):
+        successors.setdefault(source, []).append(target)
+
+    queue, seen = [successor_id], {successor_id}
+    for node in queue:
+        if node == predecessor_id:
+            return True
+        for target in successors.get(node, ()):
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+    return False
@@ -1,5 +1,7 @@
+import codecs
+
 from rest_framework import serializers
-from .models import User, Task, TaskComment
+from .models import PROJECT_END, PROJECT_START, User, Task, TaskComment, TaskDependency
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -60,8 +62,52 @@ class TaskSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'color']
     
+    # 요청 시에만 포함되는 무거운 필드
+    EXPANDABLE_FIELDS = {'subtasks', 'comments'}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.context.get('task_fields')
+        if selected is not None:
+            for name in set(self.fields) - selected:
+                self.fields.pop(name)
+    
+    @classmethod
+    def field_options(cls, query_params):
+        """
+        ?fields= / ?expand= / ?depth= 파라미터를 시리얼라이저 context 값으로 변환합니다.
+        - fields: 출력할 필드 (쉼표 구분)
+        - expand: subtasks, comments 중 포함할 필드 (fields가 없으면 나머지 기본 필드와 함께)
+        - depth: 하위 작업 단계 제한 (0이면 하위 작업 목록을 비움)
+        아무 파라미터도 없으면 기존과 같이 전체 필드를 출력합니다.
+        """
+        options = {}
+        fields = {name for name in query_params.get('fields', '').split(',') if name}
+        expand = {name for name in query_params.get('expand', '').split(',') if name}
+        
+        unknown = fields - set(cls.Meta.fields)
+        if unknown:
+            raise serializers.ValidationError({'fields': f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"})
+        if not expand <= cls.EXPANDABLE_FIELDS:
+            raise serializers.ValidationError({'expand': "subtasks, comments만 지정할 수 있습니다."})
+        
+        if fields or expand:
+            base = fields or set(cls.Meta.fields) - cls.EXPANDABLE_FIELDS
+            options['task_fields'] = base | expand
+        
+        depth = query_params.get('depth')
+        if depth is not None:
+            try:
+                options['task_depth'] = max(int(depth), 0)
+            except ValueError:
+                raise serializers.ValidationError({'depth': "정수여야 합니다."})
+        return options
+    
     def get_subtasks(self, obj):
         """하위 작업들을 재귀적으로 가져오기"""
+        if 'task_children' in self.context:
+            # 트리 조립기(build_task_tree)가 메모리에서 연결합니다.
+            return []
         subtasks = obj.subtasks.all()
         return TaskSerializer(subtasks, many=True).data
 
@@ -70,6 +116,21 @@ class TaskSerializer(serializers.ModelSerializer):
         return [user.name for user in obj.assigned_to.all()]
 
 
+class TaskSyncSerializer(TaskSerializer):
+    """증분 동기화용 작업 시리얼라이저 (하위 작업/댓글 제외)"""
+    class Meta(TaskSerializer.Meta):
+        fields = [
+            field for field in TaskSerializer.Meta.fields
+            if field not in ('subtasks', 'comments')
+        ]
+
+
+class TaskCommentSyncSerializer(TaskCommentSerializer):
+    """증분 동기화용 댓글 시리얼라이저 (작업 ID 포함)"""
+    class Meta(TaskCommentSerializer.Meta):
+        fields = ['id', 'task', 'content', 'author', 'author_name', 'created_at']
+
+
 class TaskCreateSerializer(serializers.ModelSerializer):
     """작업 생성 시리얼라이저"""
     class Meta:
@@ -88,14 +149,10 @@ class TaskCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("시작일은 종료일보다 이전이어야 합니다.")
         
         # 프로젝트 기간 내에 있는지 확인 (7월 23일 ~ 9월 15일)
-        from datetime import date
-        project_start = date(2025, 7, 23)
-        project_end = date(2025, 9, 15)
-        
-        if start_date and start_date < project_start:
+        if start_date and start_date < PROJECT_START:
             raise serializers.ValidationError("시작일은 2025년 7월 23일 이후여야 합니다.")
         
-        if end_date and end_date > project_end:
+        if end_date and end_date > PROJECT_END:
             raise serializers.ValidationError("종료일은 2025년 9월 15일 이전이어야 합니다.")
         
         return data
@@ -110,40 +167,189 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
             'parent_task', 'status', 'progress', 'assigned_to'
         ]
     
+    def validate_parent_task(self, value):
+        """상위 작업 변경 시 순환 참조 방지"""
+        if value and self.instance and value.is_descendant_of(self.instance):
+            raise serializers.ValidationError("자기 자신이나 하위 작업을 상위 작업으로 지정할 수 없습니다.")
+        return value
+    
     def validate(self, data):
         """데이터 유효성 검사"""
         return TaskCreateSerializer.validate(self, data)
 
 
+class TaskBulkOperationSerializer(serializers.Serializer):
+    """작업 일괄 처리의 개별 작업 (create/update/delete)"""
+    OP_CHOICES = ['create', 'update', 'delete']
+    
+    op = serializers.ChoiceField(choices=OP_CHOICES)
+    id = serializers.IntegerField(required=False)
+    data = serializers.DictField(required=False)
+    
+    def validate(self, data):
+        if data['op'] != 'create' and 'id' not in data:
+            raise serializers.ValidationError("수정/삭제할 작업의 id가 필요합니다.")
+        if data['op'] != 'delete' and 'data' not in data:
+            raise serializers.ValidationError("생성/수정할 작업의 data가 필요합니다.")
+        return data
+
+
+class TaskImportSerializer(serializers.Serializer):
+    """작업 가져오기 요청 (파일, 형식, 붙일 상위 작업, CSV 인코딩)"""
+    FORMAT_CHOICES = ['csv', 'xml']
+    
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=FORMAT_CHOICES, required=False)
+    parent_task = serializers.PrimaryKeyRelatedField(queryset=Task.objects.all(), required=False)
+    encoding = serializers.CharField(required=False)
+    
+    def validate_encoding(self, value):
+        """CSV 인코딩 이름 (예: utf-8, cp949). 없으면 자동으로 판단합니다."""
+        try:
+            codecs.lookup(value)
+        except LookupError:
+            raise serializers.ValidationError(f"알 수 없는 인코딩입니다: {value}")
+        return value
+    
+    def validate(self, data):
+        if 'format' not in data:
+            extension = data['file'].name.rsplit('.', 1)[-1].lower()
+            if extension not in self.FORMAT_CHOICES:
+                raise serializers.ValidationError("파일 형식(format)을 csv 또는 xml로 지정해야 합니다.")
+            data['format'] = extension
+        return data
+
+
+class TaskDependencySerializer(serializers.ModelSerializer):
+    """작업 선후행 관계 시리얼라이저"""
+    class Meta:
+        model = TaskDependency
+        fields = ['id', 'predecessor', 'successor', 'dependency_type', 'lag', 'created_at']
+        read_only_fields = ['id', 'created_at']
+    
+    def validate(self, data):
+        """자기 참조, 상하위 작업 간 관계, 순환 방지"""
+        from .schedule import creates_cycle
+        
+        predecessor = data.get('predecessor', getattr(self.instance, 'predecessor', None))
+        successor = data.get('successor', getattr(self.instance, 'successor', None))
+        if predecessor == successor:
+            raise serializers.ValidationError("작업은 자기 자신을 선행 작업으로 가질 수 없습니다.")
+        if predecessor.is_descendant_of(successor) or successor.is_descendant_of(predecessor):
+            raise serializers.ValidationError("상위 작업과 그 하위 작업 사이에는 선후행 관계를 만들 수 없습니다.")
+        if creates_cycle(predecessor.id, successor.id, exclude=getattr(self.instance, 'pk', None)):
+            raise serializers.ValidationError("선후행 관계에 순환이 생깁니다.")
+        return data
+
+
+class TaskWindowSerializer(serializers.Serializer):
+    """간트/타임라인 조회 구간 (?start=&end=&root=)"""
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    root = serializers.PrimaryKeyRelatedField(queryset=Task.objects.all(), required=False)
+    
+    def validate(self, data):
+        if data.get('start') and data.get('end') and data['start'] > data['end']:
+            raise serializers.ValidationError("시작일은 종료일보다 이전이어야 합니다.")
+        return data
+
+
+class WorkloadQuerySerializer(serializers.Serializer):
+    """작업 부하 조회 조건 (?start=&end=&users=&capacity=&include_completed=)"""
+    MAX_DAYS = 731
+    
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    users = serializers.ListField(child=serializers.IntegerField(), required=False)
+    capacity = serializers.FloatField(min_value=0, required=False)
+    include_completed = serializers.BooleanField(default=False)
+    
+    def validate(self, data):
+        # 기본 구간은 프로젝트 기간 (7월 23일 ~ 9월 15일)
+        data.setdefault('start', PROJECT_START)
+        data.setdefault('end', PROJECT_END)
+        if data['start'] > data['end']:
+            raise serializers.ValidationError("시작일은 종료일보다 이전이어야 합니다.")
+        if (data['end'] - data['start']).days >= self.MAX_DAYS:
+            raise serializers.ValidationError("조회 구간은 2년을 넘을 수 없습니다.")
+        return data
+
+
+class LevelingSerializer(serializers.Serializer):
+    """
+    자원 평준화 조건 (capacity: 담당자별 하루 작업 수, root: 옮길 하위 트리, version: 미리 본 데이터 버전,
+    allow_beyond_project_end: 프로젝트 종료일을 넘겨도 적용)
+    """
+    capacity = serializers.FloatField(min_value=1, required=False)
+    root = serializers.PrimaryKeyRelatedField(queryset=Task.objects.all(), required=False)
+    version = serializers.IntegerField(required=False)
+    allow_beyond_project_end = serializers.BooleanField(default=False)
+
+
 class GanttChartSerializer(serializers.Serializer):
     """간트 차트 데이터 시리얼라이저"""
     tasks = TaskSerializer(many=True)
     project_start_date = serializers.DateField()
     project_end_date = serializers.DateField()
     work_days = serializers.ListField(child=serializers.DateField())
+    schedule = serializers.DictField(read_only=True)
     
     def to_representation(self, instance):
         """간트 차트 형식으로 데이터 변환"""
-        from datetime import date, timedelta
+        return self.assemble(*[read() for read in self.readers(instance)])
+    
+    async def ato_representation(self, instance):
+        """to_representation()의 비동기 버전 (작업 트리와 일정을 동시에 조회)"""
+        from .utils import read_concurrently
+        return self.assemble(*await read_concurrently(*self.readers(instance)))
+    
+    def readers(self, instance):
+        """서로 독립적인 조회 함수 (작업 트리와 보이는 작업 ID, 선후행 관계 일정)"""
+        from .cache import fragments_enabled
+        from .schedule import get_project_schedule
+        from .tree import build_task_tree, build_task_tree_fragments, windowed_tasks
+        window = self.context.get('task_window') or {}
         
-        # 프로젝트 기간 설정
-        project_start = date(2025, 7, 23)
-        project_end = date(2025, 9, 15)
+        def read_tasks():
+            # 조회 구간이 있으면 구간과 겹치는 작업(과 상위 작업)만 포함
+            tasks, root_ids = windowed_tasks(instance, **window)
+            visible_ids = None
+            if tasks is not instance:
+                visible_ids = set(tasks.order_by().values_list('id', flat=True))
+            
+            # 상위 작업부터 트리를 한 번에 조립, 전체 트리는 (공유 캐시가 있으면) 가지별 캐시 조각으로 조립
+            fields = self.context.get('task_fields')
+            whole_tree = tasks is instance and self.context.get('task_depth') is None
+            if whole_tree and fragments_enabled() and (fields is None or 'subtasks' in fields):
+                return build_task_tree_fragments(tasks, context=self.context), visible_ids
+            return build_task_tree(tasks, root_ids=root_ids, context=self.context), visible_ids
         
-        # 업무일 계산 (주말 제외)
-        work_days = []
-        current_date = project_start
-        while current_date <= project_end:
-            if current_date.weekday() < 5:  # 월요일(0) ~ 금요일(4)
-                work_days.append(current_date)
-            current_date += timedelta(days=1)
+        def read_schedule():
+            return get_project_schedule(self.context.get('data_version'))
+        
+        return read_tasks, read_schedule
+    
+    def assemble(self, tasks, schedule):
+        from .schedule import restrict_schedule
+        from .workdays import get_calendar
+        
+        window = self.context.get('task_window') or {}
+        
+        # 업무일 계산 (주말 및 휴일 제외)
+        work_days = get_calendar().work_days(
+            max(PROJECT_START, window.get('start') or PROJECT_START),
+            min(PROJECT_END, window.get('end') or PROJECT_END)
+        )
         
-        # 상위 작업만 필터링
-        parent_tasks = instance.filter(parent_task__isnull=True)
+        # 선후행 관계 일정 (주공정), 구간 조회면 보이는 작업으로 한정
+        tree, visible_ids = tasks
+        if visible_ids is not None:
+            schedule = restrict_schedule(schedule, visible_ids)
         
         return {
-            'tasks': TaskSerializer(parent_tasks, many=True).data,
-            'project_start_date': project_start,
-            'project_end_date': project_end,
-            'work_days': work_days
+            'tasks': tree,
+            'project_start_date': PROJECT_START,
+            'project_end_date': PROJECT_END,
+            'work_days': work_days,
+            'schedule': schedule
         }
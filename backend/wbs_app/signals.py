@@ -1,54 +1,197 @@
-from django.db.models.signals import post_save, post_delete
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
-from django.db.models import Min, Max
-from .models import Task
+from .cache import invalidate_branches, invalidate_dashboard, invalidate_fragments
+from .events import project_of, publish_change
+from .models import Task, TaskComment, TaskDependency, User
+from .rollup import mark_dirty
+from .sync import bump_version, record_change, record_changes
 
-def update_parent_task_dates(parent_task):
+# 이 필드들이 바뀔 때만 상위 작업 롤업 값에 영향을 줍니다.
+ROLLUP_FIELDS = {'start_date', 'end_date', 'progress', 'parent_task'}
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance, update_fields=None, **kwargs):
     """
-    주어진 상위 작업의 시작일과 종료일을
-    하위 작업들을 기반으로 업데이트합니다.
+    작업이 저장된 후, 상위 작업의 롤업 갱신을 커밋 후로 예약합니다.
+    상위 작업이 바뀐 경우 이전 상위 작업도 함께 갱신합니다.
     """
-    if not parent_task:
+    old_parent_id = getattr(instance, '_loaded_parent_task_id', None)
+    instance._loaded_parent_task_id = instance.parent_task_id
+    if update_fields is not None and not ROLLUP_FIELDS.intersection(update_fields):
         return
+    mark_dirty(instance.parent_task_id, old_parent_id)
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance, **kwargs):
+    """
+    작업이 삭제된 후, 상위 작업의 롤업 갱신을 커밋 후로 예약합니다.
+    """
+    # CASCADE로 상위 작업이 함께 삭제된 경우에는 롤업 시점에 대상이 없어 건너뜁니다.
+    mark_dirty(instance.parent_task_id)
 
-    subtasks = parent_task.subtasks.all()
-    
-    if subtasks.exists():
-        # 하위 작업들로부터 가장 빠른 시작일과 가장 늦은 종료일을 계산합니다.
-        new_dates = subtasks.aggregate(
-            min_start=Min('start_date'),
-            max_end=Max('end_date')
-        )
-        
-        # 부모 작업의 날짜를 업데이트하고, 재귀적인 시그널 호출을 방지하기 위해
-        # update_fields를 사용하여 저장합니다.
-        parent_task.start_date = new_dates['min_start']
-        parent_task.end_date = new_dates['max_end']
-        parent_task.save(update_fields=['start_date', 'end_date'])
 
 @receiver(post_save, sender=Task)
-def task_saved(sender, instance, **kwargs):
+@receiver(post_delete, sender=Task)
+@receiver(post_save, sender=TaskComment)
+@receiver(post_delete, sender=TaskComment)
+def task_data_changed(sender, **kwargs):
     """
-    작업이 저장된 후, 상위 작업의 날짜를 업데이트합니다.
+    작업 또는 댓글이 바뀌면 대시보드 캐시를 무효화합니다.
+    데이터 버전은 커밋 후 변경 로그를 기록할 때(record_change) 한 번에 올립니다.
     """
-    # 저장된 작업의 상위 작업 또는 이전 상위 작업의 날짜를 업데이트합니다.
-    if instance.parent_task:
-        update_parent_task_dates(instance.parent_task)
-    
-    # 만약 작업의 상위 작업이 변경되었다면, 이전 상위 작업도 업데이트해야 합니다.
-    try:
-        # 'update_fields'를 사용하면 'get_dirty_fields'를 사용할 수 없습니다.
-        # 따라서, 간단하게 이전 상태를 추적하는 대신 항상 부모를 업데이트합니다.
-        # 좀 더 복잡한 시나리오에서는 pre_save에서 이전 부모를 저장해야 할 수 있습니다.
-        pass
-    except AttributeError:
-        pass
+    invalidate_dashboard()
 
 
+@receiver(post_save, sender=Task)
 @receiver(post_delete, sender=Task)
-def task_deleted(sender, instance, **kwargs):
+@receiver(post_save, sender=TaskComment)
+@receiver(post_delete, sender=TaskComment)
+def gantt_branch_changed(sender, instance, signal, update_fields=None, **kwargs):
+    """
+    작업 또는 댓글이 바뀌면 그 작업이 속한 가지의 간트 조각을 커밋 후 무효화합니다.
+    삭제된 작업은 상위 작업의 가지를, 제목이 바뀌었을 수 있으면 하위 작업 조각도 무효화합니다.
+    """
+    if sender is TaskComment:
+        invalidate_branches(instance.task_id)
+    elif signal is post_delete:
+        invalidate_branches(instance.parent_task_id)
+    elif update_fields is None or 'title' in update_fields:
+        invalidate_branches(renamed=[instance.pk])
+    else:
+        invalidate_branches(instance.pk)
+
+
+@receiver(post_save, sender=TaskDependency)
+@receiver(post_delete, sender=TaskDependency)
+def dependency_changed(sender, instance, signal, **kwargs):
+    """
+    선후행 관계가 바뀌면 데이터 버전을 올려 일정(주공정) 캐시가 다시 계산되게 하고,
+    후행 작업의 프로젝트 구독자에게 알립니다.
+    """
+    bump_version()
+    action = 'delete' if signal is post_delete else 'upsert'
+    successor_path = Task.objects.filter(pk=instance.successor_id).values_list('path', flat=True).first()
+    publish_change('dependency', instance.pk, action, project_of(successor_path))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, update_fields=None, **kwargs):
+    """
+    사용자 이름 등은 작업 응답에 포함되므로 데이터 버전을 올립니다.
+    로그인 시각만 갱신되는 경우는 제외합니다.
+    """
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    bump_version()
+    invalidate_dashboard()
+    # 담당자/작성자/댓글 작성자 이름은 여러 가지에 걸쳐 있어 조각 전체를 무효화합니다.
+    transaction.on_commit(invalidate_fragments)
+
+
+@receiver(m2m_changed, sender=Task.assigned_to.through)
+def task_assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    담당자가 바뀌면 데이터 버전을 올리고 대시보드 캐시와 해당 작업들의 간트 조각을 무효화합니다.
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_version()
+        invalidate_dashboard()
+        if not reverse:
+            invalidate_branches(instance.pk)
+        elif pk_set:
+            invalidate_branches(*pk_set)
+        else:
+            # 사용자 쪽에서 전체를 비운 경우(post_clear)는 대상 작업을 알 수 없습니다.
+            transaction.on_commit(invalidate_fragments)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=TaskComment)
+def record_saved(sender, instance, **kwargs):
+    """
+    증분 동기화를 위해 작업/댓글의 생성·수정을 기록합니다.
     """
-    작업이 삭제된 후, 상위 작업의 날짜를 업데이트합니다.
+    record_change(instance, 'upsert')
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=TaskComment)
+def record_deleted(sender, instance, **kwargs):
+    """
+    증분 동기화를 위해 작업/댓글의 삭제 기록(tombstone)을 남깁니다.
+    """
+    record_change(instance, 'delete')
+
+
+@receiver(m2m_changed, sender=Task.assigned_to.through)
+def record_assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    담당자 변경은 해당 작업의 수정으로 기록합니다.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        record_change(instance, 'upsert')
+    elif pk_set:
+        # 사용자 쪽에서 변경한 경우 영향을 받은 작업들을 기록합니다.
+        record_changes(list(Task.objects.filter(pk__in=pk_set)), 'upsert')
+
+
+def _change_target(instance):
+    """이벤트 대상 모델 이름과 프로젝트(최상위 작업) ID"""
+    if isinstance(instance, Task):
+        # 새 작업은 post_save 시점에 아직 경로가 저장되기 전입니다.
+        return 'task', project_of(instance.path or instance.build_path())
+    task_path = Task.objects.filter(pk=instance.task_id).values_list('path', flat=True).first()
+    return 'comment', project_of(task_path)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=TaskComment)
+def push_saved(sender, instance, **kwargs):
+    """
+    구독 중인 클라이언트에 생성·수정 이벤트를 보냅니다.
     """
-    if instance.parent_task:
-        update_parent_task_dates(instance.parent_task)
+    model, project = _change_target(instance)
+    publish_change(model, instance.pk, 'upsert', project)
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=TaskComment)
+def push_deleted(sender, instance, **kwargs):
+    """
+    구독 중인 클라이언트에 삭제 이벤트를 보냅니다.
+    """
+    model, project = _change_target(instance)
+    publish_change(model, instance.pk, 'delete', project)
+
+
+@receiver(m2m_changed, sender=Task.assigned_to.through)
+def push_assignees_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    담당자 변경은 작업 수정 이벤트로 보냅니다.
+    """
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    tasks = [instance] if not reverse else Task.objects.filter(pk__in=pk_set or ())
+    for task in tasks:
+        publish_change('task', task.pk, 'upsert', project_of(task.path))
+
+
+def tasks_bulk_saved(tasks):
+    """
+    bulk_create/bulk_update는 모델 시그널을 보내지 않으므로,
+    일괄 저장된 작업들에 대해 시그널과 같은 후처리를 한 번에 수행합니다.
+    """
+    if not tasks:
+        return
+    # 변경 로그 기록이 데이터 버전도 올립니다.
+    record_changes(tasks, 'upsert')
+    invalidate_dashboard()
+    invalidate_branches(*(task.pk for task in tasks))
+    for task in tasks:
+        publish_change('task', task.pk, 'upsert', project_of(task.path))
@@ -0,0 +1,197 @@
+"""
+증분 동기화
+
+데이터 버전(DataVersion.version)을 불투명한 동기화 토큰으로 감싸 주고받습니다.
+클라이언트는 토큰 이후에 생성/수정/삭제된 작업과 댓글만 받아 갑니다.
+
+변경은 트랜잭션 동안 모아 두었다가 커밋 후(transaction.on_commit) 한 번에 기록합니다.
+한 트랜잭션의 변경이 몇 건이든 데이터 버전은 한 번만 올리고, 로그도 bulk_create 한 번으로 저장합니다.
+기록은 별도 트랜잭션에서 버전을 올린 뒤 그 버전을 로그에 저장합니다.
+버전을 올리는 UPDATE가 트랜잭션 끝까지 DataVersion 행을 잠그므로 로그는 버전 순서대로 커밋되고,
+읽은 버전 이하의 로그는 모두 커밋된 상태입니다. (자동 증가 ID는 커밋 전에 정해져,
+동시에 쓰는 경우 낮은 ID가 나중에 보일 수 있어 위치로 쓰면 변경을 놓칩니다.)
+데이터 커밋과 버전 기록 사이의 짧은 순간에는 이전 버전(ETag)으로 새 데이터가 보일 수 있습니다.
+
+오래된 로그는 prune_changes로 정리하며, 정리된 범위의 토큰은 SyncTokenExpired로 전체 동기화를 요구합니다.
+"""
+import base64
+import binascii
+import threading
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Subquery
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import ChangeLog, DataVersion, Task, TaskComment
+
+TOKEN_PREFIX = 'wbs-sync:'
+
+_state = threading.local()
+
+
+class InvalidSyncToken(ValueError):
+    """잘못된 동기화 토큰"""
+
+
+class SyncTokenExpired(Exception):
+    """변경 로그가 정리되어 이어서 동기화할 수 없는 토큰"""
+
+
+def encode_token(version):
+    """데이터 버전을 동기화 토큰으로 변환합니다."""
+    raw = f'{TOKEN_PREFIX}{version}'.encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_token(token):
+    """동기화 토큰을 데이터 버전으로 변환합니다."""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        if not raw.startswith(TOKEN_PREFIX):
+            raise ValueError
+        return int(raw[len(TOKEN_PREFIX):])
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise InvalidSyncToken(token)
+
+
+def current_token():
+    """현재 시점의 동기화 토큰"""
+    return encode_token(DataVersion.current().version)
+
+
+def record_changes(instances, action):
+    """
+    작업 또는 댓글들의 변경 기록을 현재 트랜잭션 커밋 후로 예약합니다.
+    같은 객체가 여러 번 바뀌면 마지막 변경만 기록합니다.
+    """
+    _schedule({
+        ('task' if isinstance(instance, Task) else 'comment', instance.pk): action
+        for instance in instances
+    })
+
+
+def record_change(instance, action):
+    """작업 또는 댓글의 변경을 기록합니다."""
+    record_changes([instance], action)
+
+
+def bump_version():
+    """
+    변경 로그 없이 데이터 버전만 올립니다 (선후행 관계, 사용자 이름 등).
+    같은 트랜잭션의 변경 기록과 합쳐 커밋 후 한 번만 올립니다.
+    """
+    _schedule({})
+
+
+def _schedule(changes):
+    batch = getattr(_state, 'batch', None)
+    if batch is None:
+        batch = _state.batch = {}
+    for key, action in changes.items():
+        # 순서를 마지막 변경 기준으로 맞춥니다.
+        batch.pop(key, None)
+        batch[key] = action
+    # 세이브포인트가 롤백되면 콜백도 사라지므로 매번 등록합니다 (rollup.mark_dirty와 같은 방식).
+    # 같은 묶음은 처음 실행된 콜백이 모두 기록하고 나머지는 아무 일도 하지 않습니다.
+    transaction.on_commit(lambda: _flush(batch))
+
+
+def _flush(batch):
+    if getattr(_state, 'batch', None) is not batch:
+        return
+    _state.batch = None
+    changes = dict(batch)
+    batch.clear()
+    # 롤백된 트랜잭션에서 모인 삭제가 남아 있을 수 있으므로, 아직 있는 객체는 수정으로 기록합니다.
+    # (없는 객체의 수정 기록은 collect_changes가 삭제로 알려 줍니다.)
+    for model, queryset in (('task', Task.objects), ('comment', TaskComment.objects)):
+        deleted = [object_id for (name, object_id), action in changes.items() if name == model and action == 'delete']
+        if deleted:
+            for object_id in queryset.filter(pk__in=deleted).values_list('pk', flat=True):
+                changes[(model, object_id)] = 'upsert'
+    with transaction.atomic():
+        DataVersion.bump()
+        if changes:
+            version = Subquery(DataVersion.objects.filter(pk=DataVersion.GLOBAL_ID).values('version'))
+            ChangeLog.objects.bulk_create([
+                ChangeLog(model=model, object_id=object_id, action=action, version=version)
+                for (model, object_id), action in changes.items()
+            ])
+
+
+def read_logs(since, limit):
+    """
+    since 버전 이후의 변경 로그 (버전, 모델, ID, 동작)를 버전 순서로 읽습니다.
+    다음 위치가 버전 중간을 가리키지 않도록 마지막 버전은 통째로 빼거나, 한 버전뿐이면 통째로 넣습니다.
+
+    반환: (로그 목록, 남은 로그 여부)
+    """
+    changes = ChangeLog.objects.order_by('version', 'id').values_list('version', 'model', 'object_id', 'action')
+    logs = list(changes.filter(version__gt=since)[:limit + 1])
+    has_more = len(logs) > limit
+    if has_more:
+        last_version = logs[-1][0]
+        if logs[0][0] == last_version:
+            logs = list(changes.filter(version=last_version))
+        else:
+            logs = [log for log in logs if log[0] < last_version]
+    return logs, has_more
+
+
+def collect_changes(since, limit=1000):
+    """
+    since 버전 이후의 변경을 모아 반환합니다.
+    같은 객체의 변경이 여러 번 있으면 마지막 변경만 반영합니다.
+    한 버전의 로그(한 트랜잭션의 변경)는 나누지 않으므로 limit보다 많이 반환할 수 있습니다.
+
+    반환: (변경된 작업 목록, 변경된 댓글 목록, 삭제된 ID 딕셔너리, 마지막 버전, 남은 변경 여부)
+    """
+    logs, has_more = read_logs(since, limit)
+    # 로그를 읽은 뒤에 확인해야 그 사이 정리된 범위도 놓치지 않습니다.
+    if since < DataVersion.current().pruned_version:
+        raise SyncTokenExpired(since)
+
+    latest = {}
+    for version, model, object_id, action in logs:
+        latest[(model, object_id)] = action
+
+    upserted = {'task': set(), 'comment': set()}
+    deleted = {'task': set(), 'comment': set()}
+    for (model, object_id), action in latest.items():
+        (deleted if action == 'delete' else upserted)[model].add(object_id)
+
+    tasks = list(
+        Task.objects.filter(pk__in=upserted['task'])
+        .select_related('parent_task', 'created_by')
+        .prefetch_related('assigned_to')
+    )
+    comments = list(TaskComment.objects.filter(pk__in=upserted['comment']).select_related('author'))
+
+    # 이번 범위 이후에 삭제된 객체는 삭제로 알려 줍니다.
+    deleted['task'] |= upserted['task'] - {task.id for task in tasks}
+    deleted['comment'] |= upserted['comment'] - {comment.id for comment in comments}
+
+    last_version = logs[-1][0] if logs else since
+    return tasks, comments, deleted, last_version, has_more
+
+
+def prune_changes(days):
+    """
+    days일보다 오래된 변경 로그를 버전 단위로 정리하고, 정리한 마지막 버전을 기록합니다.
+    반환: 삭제한 로그 수
+    """
+    cutoff = timezone.now() - timedelta(days=days)
+    with transaction.atomic():
+        horizon = (
+            ChangeLog.objects.filter(created_at__lt=cutoff)
+            .order_by('-version').values_list('version', flat=True).first()
+        )
+        if horizon is None:
+            return 0
+        deleted, _ = ChangeLog.objects.filter(version__lte=horizon).delete()
+        DataVersion.objects.filter(pk=DataVersion.GLOBAL_ID).update(
+            pruned_version=Greatest('pruned_version', horizon)
+        )
+    return deleted
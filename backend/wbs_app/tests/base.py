@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from wbs_app import rollup, sync
+from wbs_app.models import PROJECT_START, Task, TaskComment, TaskDependency, User
+from wbs_app.sync import encode_token
+
+# 테스트는 설정된 캐시(공유 파일 캐시일 수 있음)를 비우지 않도록 별도의 LocMem 캐시를 씁니다.
+# 테스트는 한 프로세스에서 실행되므로 간트 조각 캐시도 켭니다.
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'wbs-tests',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    }
+}
+
+
+@override_settings(CACHES=TEST_CACHES, WBS_GANTT_FRAGMENT_CACHE=True)
+class WBSTestCase(TestCase):
+    """로그인한 API 클라이언트와 작업 생성 도우미를 갖춘 테스트 기반 클래스"""
+
+    def setUp(self):
+        cache.clear()
+        # 커밋 후 처리 묶음은 스레드에 남으므로, 이전 테스트에서 롤백된 변경이 섞이지 않게 비웁니다.
+        rollup._state.batch = sync._state.batch = None
+        self.user = User.objects.create_user(username='tester', name='테스터', password='password')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_task(self, title, parent=None, start=date(2025, 8, 1), end=date(2025, 8, 8), **fields):
+        """작업 생성 (상위 작업 롤업은 커밋 후 실행되므로 즉시 반영합니다)"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return Task.objects.create(
+                title=title, parent_task=parent, start_date=start, end_date=end, created_by=self.user, **fields
+            )
+
+    def create_sample_wbs(self, children=3):
+        """
+        쿼리 점검용 최소 WBS (루트 - 하위 작업 - 손자 작업, 담당자, 댓글, 하위 작업 간 선후행 관계)
+        URL 템플릿에 넣을 값(task_id, sync_token)을 반환합니다.
+        """
+        root = self.create_task('점검 루트', start=PROJECT_START, end=PROJECT_START + timedelta(days=children * 7))
+        previous = None
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(children):
+                start = PROJECT_START + timedelta(days=i * 7)
+                child = Task.objects.create(
+                    title=f'점검 {i}', start_date=start, end_date=start + timedelta(days=5),
+                    parent_task=root, created_by=self.user
+                )
+                child.assigned_to.add(self.user)
+                TaskComment.objects.create(task=child, author=self.user, content='점검')
+                Task.objects.create(
+                    title=f'점검 {i}-0', start_date=child.start_date, end_date=child.end_date,
+                    parent_task=child, created_by=self.user
+                )
+                if previous is not None:
+                    TaskDependency.objects.create(predecessor=previous, successor=child)
+                previous = child
+        cache.clear()
+        return {'task_id': root.id, 'sync_token': encode_token(0)}
+
+    def reload(self, *tasks):
+        for task in tasks:
+            task.refresh_from_db()
@@ -0,0 +1,43 @@
+from .base import WBSTestCase
+
+
+class AsyncViewParityTests(WBSTestCase):
+    """비동기 읽기 API는 동기 API와 같은 본문과 ETag/304 동작을 가져야 합니다."""
+
+    ENDPOINTS = [
+        ('/api/tasks/', '/api/async/tasks/'),
+        ('/api/tasks/?page_size=2', '/api/async/tasks/?page_size=2'),
+        ('/api/tasks/gantt_chart/', '/api/async/tasks/gantt_chart/'),
+        ('/api/timeline/', '/api/async/timeline/'),
+        ('/api/dashboard/', '/api/async/dashboard/'),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        root = self.create_task('루트')
+        self.create_task('하위 1', parent=root)
+        self.create_task('하위 2', parent=root)
+        self.create_task('다른 루트')
+        self.client.force_login(self.user)
+
+    def test_same_body_and_validators(self):
+        for sync_url, async_url in self.ENDPOINTS:
+            with self.subTest(url=async_url):
+                expected = self.client.get(sync_url)
+                response = self.client.get(async_url)
+                self.assertEqual(response.status_code, 200)
+                data, expected_data = response.json(), expected.json()
+                if 'next' in expected_data:
+                    # 다음 페이지 링크는 각자의 경로를 가리킵니다.
+                    self.assertEqual(data.pop('next').replace('/async', ''), expected_data.pop('next'))
+                self.assertEqual(data, expected_data)
+                self.assertEqual(response['ETag'], expected['ETag'])
+                if 'X-Sync-Token' in expected:
+                    self.assertEqual(response['X-Sync-Token'], expected['X-Sync-Token'])
+
+    def test_not_modified(self):
+        for _, async_url in self.ENDPOINTS:
+            with self.subTest(url=async_url):
+                etag = self.client.get(async_url)['ETag']
+                response = self.client.get(async_url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
@@ -0,0 +1,88 @@
+from wbs_app.models import Task
+
+from .base import WBSTestCase
+
+
+class BulkOperationTests(WBSTestCase):
+    """tasks/bulk/ 일괄 처리"""
+
+    def bulk(self, *operations):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/tasks/bulk/', {'operations': list(operations)}, format='json')
+
+    def test_rejects_cycle_within_batch(self):
+        root = self.create_task('루트')
+        a = self.create_task('A', parent=root)
+        b = self.create_task('B', parent=root)
+
+        response = self.bulk(
+            {'op': 'update', 'id': a.pk, 'data': {'parent_task': b.pk}},
+            {'op': 'update', 'id': b.pk, 'data': {'parent_task': a.pk}},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data['operations']), {0, 1})
+        self.reload(a, b)
+        self.assertEqual((a.parent_task_id, a.path), (root.pk, f'{root.pk}/{a.pk}/'))
+        self.assertEqual((b.parent_task_id, b.path), (root.pk, f'{root.pk}/{b.pk}/'))
+
+    def test_rejects_cycle_through_unmoved_descendant(self):
+        # A를 C(B의 하위 작업) 아래로, B를 A 아래로 옮기면 A → C → B → A
+        a = self.create_task('A')
+        b = self.create_task('B')
+        c = self.create_task('C', parent=b)
+
+        response = self.bulk(
+            {'op': 'update', 'id': a.pk, 'data': {'parent_task': c.pk}},
+            {'op': 'update', 'id': b.pk, 'data': {'parent_task': a.pk}},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data['operations']), {0, 1})
+
+    def test_moves_nested_tasks_in_one_batch(self):
+        a = self.create_task('A')
+        b = self.create_task('B', parent=a)
+        c = self.create_task('C', parent=b)
+        x = self.create_task('X')
+        y = self.create_task('Y')
+
+        # 상위 작업(A)을 먼저 옮긴 뒤 그 하위 작업(B)을 다른 곳으로 옮깁니다.
+        response = self.bulk(
+            {'op': 'update', 'id': a.pk, 'data': {'parent_task': x.pk}},
+            {'op': 'update', 'id': b.pk, 'data': {'parent_task': y.pk}},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.reload(a, b, c)
+        self.assertEqual(a.path, f'{x.pk}/{a.pk}/')
+        self.assertEqual(b.path, f'{y.pk}/{b.pk}/')
+        self.assertEqual((c.path, c.depth), (f'{y.pk}/{b.pk}/{c.pk}/', 2))
+        self.assertEqual(Task.objects.get(pk=a.pk).subtask_count, 0)
+        self.assertEqual(Task.objects.get(pk=y.pk).subtask_count, 1)
+
+    def test_create_update_delete(self):
+        parent = self.create_task('상위')
+        child = self.create_task('하위', parent=parent)
+        removed = self.create_task('삭제')
+
+        response = self.bulk(
+            {'op': 'create', 'data': {'title': '새 작업', 'start_date': '2025-08-20', 'end_date': '2025-08-25',
+                                      'parent_task': parent.pk}},
+            {'op': 'update', 'id': child.pk, 'data': {'progress': 50}},
+            {'op': 'delete', 'id': removed.pk},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        created = Task.objects.get(pk=response.data['created'][0])
+        self.assertEqual(created.path, f'{parent.pk}/{created.pk}/')
+        self.assertFalse(Task.objects.filter(pk=removed.pk).exists())
+        parent.refresh_from_db()
+        self.assertEqual(parent.subtask_count, 2)
+        self.assertEqual(parent.end_date.isoformat(), '2025-08-25')
+
+    def test_rejects_non_object_body(self):
+        for body in [[{'op': 'delete', 'id': 1}], 'operations', 1, {}, {'operations': {'op': 'delete'}}]:
+            with self.subTest(body=body):
+                response = self.client.post('/api/tasks/bulk/', body, format='json')
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.test import override_settings
+
+from wbs_app.cache import _branch_key, check_fragment_cache
+
+from .base import WBSTestCase
+
+
+class GanttFragmentCacheTests(WBSTestCase):
+    """간트 차트 가지별 조각 캐시와 무효화"""
+
+    def setUp(self):
+        super().setUp()
+        self.root = self.create_task('루트')
+        self.child = self.create_task('하위', parent=self.root)
+        self.leaf = self.create_task('말단', parent=self.child)
+        self.other = self.create_task('다른 루트')
+        self.leaf.assigned_to.add(self.user)
+
+    def gantt(self):
+        response = self.client.get('/api/tasks/gantt_chart/')
+        self.assertEqual(response.status_code, 200)
+        return {row['id']: row for row in self.flatten(response.json()['tasks'])}
+
+    def flatten(self, rows):
+        for row in rows:
+            yield row
+            yield from self.flatten(row['subtasks'])
+
+    def patch(self, url, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def branch_versions(self):
+        return {task.pk: cache.get(_branch_key(task.pk)) for task in [self.root, self.child, self.leaf, self.other]}
+
+    def test_edit_invalidates_only_its_branch(self):
+        self.gantt()
+        before = self.branch_versions()
+
+        self.patch(f'/api/tasks/{self.leaf.pk}/', {'title': '바뀐 말단'})
+
+        self.assertEqual(self.gantt()[self.leaf.pk]['title'], '바뀐 말단')
+        after = self.branch_versions()
+        for task in [self.root, self.child, self.leaf]:
+            self.assertNotEqual(after[task.pk], before[task.pk])
+        self.assertEqual(after[self.other.pk], before[self.other.pk])
+
+    def test_rename_updates_subtask_parent_titles(self):
+        self.gantt()
+
+        self.patch(f'/api/tasks/{self.child.pk}/', {'title': '바뀐 하위'})
+
+        self.assertEqual(self.gantt()[self.leaf.pk]['parent_task_title'], '바뀐 하위')
+
+    def test_user_rename_invalidates_all_fragments(self):
+        self.gantt()
+
+        self.user.name = '새 이름'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        self.assertEqual(self.gantt()[self.leaf.pk]['assigned_to_names'], ['새 이름'])
+
+    def test_cached_and_uncached_gantt_match(self):
+        cached = self.client.get('/api/tasks/gantt_chart/').content
+        self.assertEqual(self.client.get('/api/tasks/gantt_chart/').content, cached)
+        with override_settings(WBS_GANTT_FRAGMENT_CACHE=False):
+            self.assertEqual(self.client.get('/api/tasks/gantt_chart/').content, cached)
+
+
+class FragmentCacheCheckTests(WBSTestCase):
+    """조각 캐시는 프로세스 간에 공유되는 캐시에서만 켤 수 있습니다."""
+
+    def test_process_local_cache_is_rejected(self):
+        self.assertEqual([error.id for error in check_fragment_cache(None)], ['wbs_app.E001'])
+
+        with override_settings(WBS_GANTT_FRAGMENT_CACHE=False):
+            self.assertEqual(check_fragment_cache(None), [])
+
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': '/tmp'}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(check_fragment_cache(None), [])
@@ -0,0 +1,73 @@
+from django.utils.http import http_date, parse_http_date
+
+from .base import WBSTestCase
+
+
+class ConditionalGetTests(WBSTestCase):
+    """데이터 버전 ETag/Last-Modified 조건부 GET"""
+
+    def setUp(self):
+        super().setUp()
+        self.root = self.create_task('루트')
+        self.child = self.create_task('하위', parent=self.root)
+        self.urls = [
+            '/api/tasks/',
+            f'/api/tasks/{self.child.pk}/',
+            '/api/tasks/gantt_chart/',
+            '/api/timeline/',
+            '/api/dashboard/',
+        ]
+
+    def test_if_none_match_returns_304_without_a_body(self):
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                etag = response['ETag']
+
+                # 버전 조회 1회만 하고 본문은 만들지 않습니다.
+                with self.assertNumQueries(1):
+                    cached = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(cached.status_code, 304)
+                self.assertEqual(cached.content, b'')
+                self.assertEqual(cached['ETag'], etag)
+                self.assertIn('no-cache', cached['Cache-Control'])
+
+                # 약한 비교와 여러 값 목록도 허용합니다.
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=f'W/{etag}').status_code, 304)
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=f'"other", {etag}').status_code, 304)
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"wbs-0"').status_code, 200)
+
+    def test_if_modified_since(self):
+        response = self.client.get('/api/tasks/')
+        last_modified = response['Last-Modified']
+
+        self.assertEqual(self.client.get('/api/tasks/', HTTP_IF_MODIFIED_SINCE=last_modified).status_code, 304)
+        earlier = http_date(parse_http_date(last_modified) - 60)
+        self.assertEqual(self.client.get('/api/tasks/', HTTP_IF_MODIFIED_SINCE=earlier).status_code, 200)
+
+    def test_etag_changes_after_a_write(self):
+        etags = {url: self.client.get(url)['ETag'] for url in self.urls}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(f'/api/tasks/{self.child.pk}/', {'title': '수정'}, format='json')
+        self.assertEqual(response.status_code, 200)
+
+        for url in self.urls:
+            with self.subTest(url=url):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[url])
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etags[url])
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+    def test_comment_and_assignee_changes_bump_the_etag(self):
+        etag = self.client.get('/api/tasks/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/tasks/{self.child.pk}/add_comment/', {'content': '댓글'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        after_comment = self.client.get('/api/tasks/')['ETag']
+        self.assertNotEqual(after_comment, etag)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.child.assigned_to.add(self.user)
+        self.assertNotEqual(self.client.get('/api/tasks/')['ETag'], after_comment)
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+from wbs_app.models import Task, User
+
+from .base import WBSTestCase
+
+
+class DashboardTests(WBSTestCase):
+    """dashboard/ 집계를 손으로 만든 트리에서 센 값과 비교"""
+
+    def setUp(self):
+        super().setUp()
+        self.other = User.objects.create_user(username='kim', name='김', password='password')
+        self.idle = User.objects.create_user(username='lee', name='이', password='password')
+
+        # A(진행 중) ─ A1(완료), A2(시작 전) ─ A2a(보류) / B(완료) ─ B1(완료) / C(시작 전)
+        a = self.create_task('A', status='in_progress')
+        a1 = self.create_task('A1', parent=a, status='completed')
+        a2 = self.create_task('A2', parent=a, status='not_started')
+        a2a = self.create_task('A2a', parent=a2, status='on_hold')
+        b = self.create_task('B', status='completed')
+        b1 = self.create_task('B1', parent=b, status='completed')
+        c = self.create_task('C', status='not_started')
+        self.tasks = [a, a1, a2, a2a, b, b1, c]
+        # 생성 순서대로 1분씩 차이를 둬 최근 작업 순서를 고정합니다.
+        base = datetime(2025, 8, 1, tzinfo=timezone.utc)
+        for index, task in enumerate(self.tasks):
+            Task.objects.filter(pk=task.pk).update(created_at=base + timedelta(minutes=index))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            a1.assigned_to.set([self.user, self.other])
+            b.assigned_to.set([self.user])
+            a2a.assigned_to.set([self.other])
+            c.assigned_to.set([self.other])
+
+    def test_counts_match_the_tree(self):
+        data = self.client.get('/api/dashboard/').json()
+
+        self.assertEqual(data['total_tasks'], 7)
+        self.assertEqual(data['completed_tasks'], 3)
+        self.assertEqual(data['in_progress_tasks'], 1)
+        self.assertEqual(data['not_started_tasks'], 2)
+        # 완료 3 / 전체 7
+        self.assertEqual(data['project_progress'], 42.9)
+        self.assertEqual(
+            [(row['username'], row['task_count']) for row in data['user_task_counts']],
+            [('tester', 2), ('kim', 3), ('lee', 0)],
+        )
+
+    def test_recent_tasks_include_their_subtrees(self):
+        recent = self.client.get('/api/dashboard/').json()['recent_tasks']
+
+        self.assertEqual([row['title'] for row in recent], ['C', 'B1', 'B', 'A2a', 'A2'])
+        by_title = {row['title']: row for row in recent}
+        self.assertEqual([row['title'] for row in by_title['B']['subtasks']], ['B1'])
+        self.assertEqual([row['title'] for row in by_title['A2']['subtasks']], ['A2a'])
+        self.assertEqual(by_title['C']['subtasks'], [])
+
+    def test_cached_until_a_task_changes(self):
+        self.assertEqual(self.client.get('/api/dashboard/').json()['completed_tasks'], 3)
+        # 시그널을 거치지 않은 변경은 캐시 유지 시간 동안 보이지 않습니다.
+        Task.objects.filter(pk=self.tasks[-1].pk).update(status='completed')
+        self.assertEqual(self.client.get('/api/dashboard/').json()['completed_tasks'], 3)
+
+        task = self.tasks[2]
+        task.status = 'completed'
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        data = self.client.get('/api/dashboard/').json()
+        self.assertEqual((data['completed_tasks'], data['not_started_tasks']), (5, 0))
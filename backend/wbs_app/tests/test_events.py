@@ -0,0 +1,85 @@
+import asyncio
+from datetime import date
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient
+
+from wbs_app.events import ChangeLogEventLayer
+from wbs_app.models import TaskComment
+
+from .base import WBSTestCase
+
+
+class TaskEventsTests(WBSTestCase):
+    """events/ 실시간 변경 알림 (SSE)"""
+
+    def test_not_available_under_wsgi(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/api/events/')
+        self.assertEqual(response.status_code, 501)
+
+    async def test_streams_under_asgi(self):
+        client = AsyncClient()
+        await sync_to_async(client.force_login)(self.user)
+        response = await client.get('/api/events/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 3000\n\n')
+        await stream.aclose()
+
+
+class ChangeLogEventLayerTests(WBSTestCase):
+    """변경 로그 폴링 이벤트 계층"""
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        # 폴링 스레드 없이 poll()을 직접 호출합니다.
+        self.layer = ChangeLogEventLayer(interval=0)
+
+    def subscribe(self, group):
+        async def subscribe():
+            return self.layer.subscribe(group)
+        return self.loop.run_until_complete(subscribe())
+
+    def received(self, subscription):
+        self.loop.run_until_complete(asyncio.sleep(0))
+        events = []
+        while not subscription.queue.empty():
+            events.append(subscription.queue.get_nowait())
+        return sorted((event['model'], event['id'], event['action'], event['project']) for event in events)
+
+    def test_delivers_changes_logged_by_any_process(self):
+        project = self.create_task('프로젝트')
+        other = self.create_task('다른 프로젝트')
+        subscription = self.subscribe(str(project.pk))
+        everything = self.subscribe('*')
+        self.assertEqual(self.layer.poll(), 0)
+
+        # 상위 작업 기간을 넘겨 상위 작업도 함께 수정되게 합니다.
+        child = self.create_task('하위', parent=project, end=date(2025, 8, 20))
+        with self.captureOnCommitCallbacks(execute=True):
+            comment = TaskComment.objects.create(task=child, author=self.user, content='댓글')
+            other.title = '수정'
+            other.save()
+        removed_id = other.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        # 다른 워커가 보낸 것처럼 이 프로세스의 발행은 무시되고 변경 로그에서만 읽습니다.
+        self.assertEqual(self.received(everything), [])
+
+        self.assertEqual(self.layer.poll(), 4)
+        project_events = [
+            ('comment', comment.pk, 'upsert', project.pk),
+            ('task', project.pk, 'upsert', project.pk),
+            ('task', child.pk, 'upsert', project.pk),
+            ('task', removed_id, 'delete', None),
+        ]
+        self.assertEqual(self.received(subscription), sorted(project_events))
+        # 수정 후 삭제된 작업은 삭제 한 건으로 합쳐지고, 전체 구독자도 각 이벤트를 한 번만 받습니다.
+        self.assertEqual(self.received(everything), sorted(project_events))
+
+        self.assertEqual(self.layer.poll(), 0)
@@ -0,0 +1,97 @@
+import csv
+import io
+import zipfile
+from xml.etree import ElementTree as ET
+from unittest import mock
+
+from django.db.models.functions import Collate
+
+from wbs_app.export import export_rows, path_order
+from wbs_app.models import Task
+
+from .base import WBSTestCase
+
+
+class ExportTests(WBSTestCase):
+    """WBS 내보내기"""
+
+    def setUp(self):
+        super().setUp()
+        # 자릿수가 다른 ID가 섞이도록 (예: 1/10/ 과 1/2/11/) 작업을 만듭니다.
+        self.root = self.create_task('루트')
+        self.first = self.create_task('첫째', parent=self.root)
+        for index in range(8):
+            self.create_task(f'형제 {index}', parent=self.root)
+        self.create_task('손자', parent=self.first)
+
+    def test_rows_are_preorder_with_wbs_path(self):
+        rows = list(export_rows())
+        titles = dict(Task.objects.values_list('id', 'title'))
+
+        seen = set()
+        for row in rows:
+            task = Task.objects.get(pk=row['id'])
+            if task.parent_task_id:
+                self.assertIn(task.parent_task_id, seen)
+            seen.add(task.id)
+            self.assertEqual(row['wbs_path'], ' > '.join(titles[task_id] for task_id in task.ancestor_ids + [task.id]))
+        self.assertEqual(len(rows), Task.objects.count())
+
+    def test_postgresql_sorts_paths_bytewise(self):
+        queryset = Task.objects.all()
+        with mock.patch('wbs_app.export.connections') as connections:
+            connections.__getitem__.return_value.vendor = 'postgresql'
+            order = path_order(queryset)
+        self.assertIsInstance(order, Collate)
+        self.assertEqual(order.collation, 'C')
+        self.assertEqual(path_order(queryset), 'path')
+
+    def test_csv_endpoint(self):
+        response = self.client.get('/api/tasks/export/csv/')
+        self.assertEqual(response.status_code, 200)
+        content = b''.join(response.streaming_content).decode('utf-8-sig')
+        rows = list(csv.reader(io.StringIO(content)))
+        self.assertEqual(len(rows), Task.objects.count() + 1)
+        self.assertEqual(rows[1][1], '루트')
+
+    def test_formula_cells_are_text(self):
+        Task.objects.filter(pk=self.root.pk).update(title='=HYPERLINK("http://x","y")')
+        Task.objects.filter(pk=self.first.pk).update(title='-1+2')
+
+        content = b''.join(self.client.get('/api/tasks/export/csv/').streaming_content).decode('utf-8-sig')
+        rows = {row[0]: row for row in csv.reader(io.StringIO(content))}
+        self.assertEqual(rows[str(self.root.pk)][3], '\'=HYPERLINK("http://x","y")')
+        self.assertEqual(rows[str(self.first.pk)][3], "'-1+2")
+        # 계층 경로도 수식 문자로 시작하면 막습니다.
+        self.assertTrue(rows[str(self.first.pk)][1].startswith("'="))
+
+        cells = self.xlsx_cells()
+        self.assertEqual(cells[(self.root.pk, 3)], ('2', '=HYPERLINK("http://x","y")'))
+        self.assertEqual(cells[(self.first.pk, 3)], ('2', '-1+2'))
+
+    def test_xlsx_strips_xml_illegal_characters(self):
+        Task.objects.filter(pk=self.root.pk).update(title='벨\x07 탭\t 폼\x0c끝')
+
+        cells = self.xlsx_cells()
+
+        self.assertEqual(cells[(self.root.pk, 3)], (None, '벨 탭\t 폼끝'))
+
+    def xlsx_cells(self):
+        """(작업 ID, 열 번호) -> (스타일, 글자 값)"""
+        response = self.client.get('/api/tasks/export/xlsx/')
+        self.assertEqual(response.status_code, 200)
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        namespace = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+        sheet = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        cells = {}
+        for row in sheet.iter(namespace + 'row'):
+            values = list(row)
+            if values[0].find(namespace + 'v') is None:
+                continue
+            task_id = int(values[0].find(namespace + 'v').text)
+            for column, cell in enumerate(values):
+                text = cell.find(f'{namespace}is/{namespace}t')
+                if text is not None:
+                    cells[(task_id, column)] = (cell.get('s'), text.text)
+        return cells
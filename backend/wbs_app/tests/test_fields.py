@@ -0,0 +1,66 @@
+from .base import WBSTestCase
+
+
+class FieldSelectionTests(WBSTestCase):
+    """?fields= / ?depth= 필드 선택"""
+
+    def setUp(self):
+        super().setUp()
+        self.root = self.create_task('루트')
+        self.child = self.create_task('하위', parent=self.root)
+        self.leaf = self.create_task('말단', parent=self.child)
+
+    def test_fields_without_id(self):
+        urls = [
+            '/api/tasks/?fields=title',
+            '/api/tasks/?fields=title&page_size=10',
+            '/api/tasks/gantt_chart/?fields=title',
+            f'/api/tasks/{self.root.pk}/?fields=title',
+            '/api/async/tasks/?fields=title',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f'/api/tasks/{self.root.pk}/?fields=title')
+        self.assertEqual(response.json(), {'title': '루트'})
+
+    def test_subtasks_without_id(self):
+        leaf = {'title': '말단', 'subtasks': []}
+        tree = {'title': '루트', 'subtasks': [{'title': '하위', 'subtasks': [leaf]}]}
+
+        response = self.client.get('/api/tasks/gantt_chart/?fields=title,subtasks')
+        self.assertEqual(response.json()['tasks'], [tree])
+
+        response = self.client.get(f'/api/tasks/{self.child.pk}/?fields=title,subtasks')
+        self.assertEqual(response.json(), tree['subtasks'][0])
+
+    def test_depth_limit(self):
+        response = self.client.get(f'/api/tasks/{self.root.pk}/?fields=id,subtasks&depth=1')
+        self.assertEqual(response.json(), {'id': self.root.pk, 'subtasks': [{'id': self.child.pk, 'subtasks': []}]})
+
+    def test_unknown_field(self):
+        response = self.client.get('/api/tasks/?fields=nope')
+        self.assertEqual(response.status_code, 400)
+
+    def test_subtasks_endpoint(self):
+        sibling = self.create_task('하위 2', parent=self.root)
+        url = f'/api/tasks/{self.root.pk}/subtasks/'
+
+        # 데이터 버전, 작업 자신, 하위 작업, 담당자, 댓글 (하위 작업은 한 번만 조회)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.json()), 2)
+
+        response = self.client.get(url, {'fields': 'title,subtasks'})
+        self.assertEqual(response.json(), [
+            {'title': '하위', 'subtasks': [{'title': '말단', 'subtasks': []}]},
+            {'title': '하위 2', 'subtasks': []},
+        ])
+
+        response = self.client.get(url, {'fields': 'id,subtasks', 'depth': 0})
+        self.assertEqual(response.json(), [{'id': self.child.pk, 'subtasks': []}, {'id': sibling.pk, 'subtasks': []}])
+
+        response = self.client.get(url, {'fields': 'title'})
+        self.assertEqual(response.json(), [{'title': '하위'}, {'title': '하위 2'}])
@@ -0,0 +1,99 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from wbs_app.models import Task
+
+from .base import WBSTestCase
+
+MSPROJECT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Project xmlns="http://schemas.microsoft.com/project">
+  <Tasks>
+    <Task><UID>1</UID><ID>1</ID><Name>설계</Name><OutlineLevel>1</OutlineLevel>
+      <Start>2025-08-01T08:00:00</Start><Finish>2025-08-08T17:00:00</Finish><PercentComplete>{first}</PercentComplete></Task>
+    <Task><UID>2</UID><ID>2</ID><Name>화면 설계</Name><OutlineLevel>{level}</OutlineLevel>
+      <Start>2025-08-01T08:00:00</Start><Finish>2025-08-04T17:00:00</Finish><PercentComplete>100</PercentComplete></Task>
+  </Tasks>
+</Project>'''
+
+
+class ImportTests(WBSTestCase):
+    """tasks/import/ 파일 가져오기"""
+
+    def upload(self, name, content):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/tasks/import/', {'file': SimpleUploadedFile(name, content.encode())})
+
+    def test_msproject_hierarchy(self):
+        response = self.upload('plan.xml', MSPROJECT_XML.format(first='50', level='2'))
+
+        self.assertEqual(response.status_code, 201)
+        parent = Task.objects.get(title='설계')
+        child = Task.objects.get(title='화면 설계')
+        self.assertEqual((child.parent_task_id, child.path), (parent.pk, f'{parent.pk}/{child.pk}/'))
+        self.assertEqual((child.status, parent.subtask_count), ('completed', 1))
+
+    def test_msproject_invalid_numbers_are_row_errors(self):
+        response = self.upload('plan.xml', MSPROJECT_XML.format(first='abc', level='two'))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('progress', response.json()['rows']['1'])
+        self.assertIn('parent', response.json()['rows']['2'])
+        self.assertFalse(Task.objects.exists())
+
+    def test_csv_parent_reference(self):
+        existing = self.create_task('기존 작업')
+        content = (
+            'key,parent,title,start_date,end_date\n'
+            f'a,{existing.pk},하위 A,2025-08-01,2025-08-05\n'
+            'b,a,하위 B,2025-08-02,2025-08-03\n'
+        )
+
+        response = self.upload('tasks.csv', content)
+
+        self.assertEqual(response.status_code, 201)
+        b = Task.objects.get(title='하위 B')
+        self.assertEqual(b.depth, 2)
+        existing.refresh_from_db()
+        self.assertEqual(existing.subtask_count, 1)
+
+    def test_csv_non_decimal_parent(self):
+        for parent in ['²', '9' * 30]:
+            with self.subTest(parent=parent):
+                response = self.upload('tasks.csv', f'parent,title,start_date,end_date\n{parent},작업,2025-08-01,2025-08-05\n')
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('parent', response.json()['rows']['2'])
+
+    def test_csv_cp949(self):
+        content = 'title,start_date,end_date\n한글 작업,2025-08-01,2025-08-05\n'.encode('cp949')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/tasks/import/', {'file': SimpleUploadedFile('tasks.csv', content)})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Task.objects.filter(title='한글 작업').exists())
+
+    def test_csv_explicit_encoding(self):
+        content = 'title,start_date,end_date\nCafé,2025-08-01,2025-08-05\n'.encode('latin-1')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/tasks/import/', {'file': SimpleUploadedFile('tasks.csv', content), 'encoding': 'latin-1'}
+            )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Task.objects.filter(title='Café').exists())
+
+    def test_csv_undecodable_bytes(self):
+        content = 'title,start_date,end_date\n'.encode() + 'Café,2025-08-01,2025-08-05\n'.encode('latin-1')
+
+        response = self.client.post(
+            '/api/tasks/import/', {'file': SimpleUploadedFile('tasks.csv', content), 'encoding': 'utf-8'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('2번째 줄(바이트 위치 29)', response.json()['file'][0])
+
+        response = self.client.post(
+            '/api/tasks/import/', {'file': SimpleUploadedFile('tasks.csv', content), 'encoding': 'nope'}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('encoding', response.json())
@@ -0,0 +1,81 @@
+from datetime import date
+
+from wbs_app.leveling import BeyondProjectEnd, StalePlan, apply_leveling, plan_leveling
+from wbs_app.models import PROJECT_END, Task
+
+from .base import WBSTestCase
+
+
+class LevelingTests(WBSTestCase):
+    """자원 평준화"""
+
+    def setUp(self):
+        super().setUp()
+        # 같은 담당자에게 겹치는 작업 세 개 (2025-08-04 월 ~ 08-06 수)
+        self.tasks = []
+        for index in range(3):
+            task = self.create_task(f'작업 {index}', start=date(2025, 8, 4), end=date(2025, 8, 6))
+            task.assigned_to.add(self.user)
+            self.tasks.append(task)
+
+    def apply(self, **kwargs):
+        with self.captureOnCommitCallbacks(execute=True):
+            return apply_leveling(**kwargs)
+
+    def test_moves_overlapping_tasks_apart(self):
+        plan = plan_leveling(capacity=1)
+
+        self.assertEqual(len(plan['moved']), 2)
+        spans = sorted(
+            (row['new_start_date'], row['new_end_date']) for row in plan['moved']
+        )
+        self.assertEqual(spans, [(date(2025, 8, 7), date(2025, 8, 11)), (date(2025, 8, 12), date(2025, 8, 14))])
+        self.assertEqual(plan['beyond_project_end'], 0)
+
+    def test_apply_is_idempotent(self):
+        first = self.apply(capacity=1)
+        self.assertEqual(len(first['moved']), 2)
+        dates = list(Task.objects.order_by('id').values_list('start_date', 'end_date'))
+
+        second = self.apply(capacity=1)
+
+        self.assertEqual(second['moved'], [])
+        self.assertEqual(list(Task.objects.order_by('id').values_list('start_date', 'end_date')), dates)
+
+    def test_rejects_stale_preview(self):
+        preview = self.client.get('/api/tasks/leveling/', {'capacity': 1})
+        self.assertEqual(preview.status_code, 200)
+
+        self.tasks[0].title = '변경'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tasks[0].save()
+
+        response = self.client.post('/api/tasks/leveling/apply/', {'capacity': 1, 'version': preview.data['version']}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Task.objects.filter(start_date=date(2025, 8, 4)).count(), 3)
+
+        with self.assertRaises(StalePlan):
+            apply_leveling(capacity=1, expected_version=preview.data['version'])
+
+    def test_refuses_to_move_tasks_beyond_project_end(self):
+        for index in range(3, 30):
+            task = self.create_task(f'작업 {index}', start=date(2025, 8, 4), end=date(2025, 8, 6))
+            task.assigned_to.add(self.user)
+
+        plan = plan_leveling(capacity=1)
+        self.assertGreater(plan['beyond_project_end'], 0)
+        self.assertGreater(plan['project_end_after'], PROJECT_END)
+
+        response = self.client.post('/api/tasks/leveling/apply/', {'capacity': 1}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(len(response.data['tasks']), plan['beyond_project_end'])
+        self.assertFalse(Task.objects.filter(end_date__gt=PROJECT_END).exists())
+        with self.assertRaises(BeyondProjectEnd):
+            apply_leveling(capacity=1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/tasks/leveling/apply/', {'capacity': 1, 'allow_beyond_project_end': True}, format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Task.objects.filter(end_date__gt=PROJECT_END).count(), plan['beyond_project_end'])
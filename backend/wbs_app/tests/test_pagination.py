@@ -0,0 +1,64 @@
+import base64
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from wbs_app.models import TaskComment
+
+from .base import WBSTestCase
+
+
+class KeysetPaginationTests(WBSTestCase):
+    """키셋 페이지네이션으로 모든 페이지를 따라가면 행이 빠지거나 겹치지 않아야 합니다."""
+
+    def walk(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids.extend(row['id'] for row in response.data['results'])
+            url = response.data['next']
+            pages += 1
+        return ids, pages
+
+    def test_comment_pages_within_same_millisecond(self):
+        task = self.create_task('작업')
+        comments = TaskComment.objects.bulk_create([
+            TaskComment(task=task, author=self.user, content=f'댓글 {index}') for index in range(300)
+        ])
+        # 모든 댓글이 같은 밀리초 안에 마이크로초 단위로만 다르게 작성된 상황
+        base = datetime(2025, 8, 1, 12, 0, 0, tzinfo=timezone.utc)
+        for index, comment in enumerate(comments):
+            comment.created_at = base + timedelta(microseconds=index * 3)
+        TaskComment.objects.bulk_update(comments, ['created_at'])
+
+        ids, pages = self.walk('/api/comments/?page_size=7')
+
+        self.assertEqual(pages, 43)
+        self.assertEqual(ids, [comment.pk for comment in reversed(comments)])
+
+    def test_task_pages_with_equal_sort_keys(self):
+        tasks = [self.create_task('같은 제목', start=date(2025, 8, 1 + index % 3)) for index in range(20)]
+
+        ids, _ = self.walk('/api/tasks/?page_size=3')
+
+        expected = sorted(tasks, key=lambda task: (task.start_date, task.title, task.pk))
+        self.assertEqual(ids, [task.pk for task in expected])
+
+    def test_malformed_cursor(self):
+        self.create_task('작업')
+        positions = [
+            ['notadate', 'x', 1],
+            ['2025-08-01', 'x', 'notanumber'],
+            ['2025-08-01', None, 1],
+            [5, 'x', 1],
+            ['2025-08-01', 'x'],
+        ]
+        for position in positions:
+            with self.subTest(position=position):
+                cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+                for url in ['/api/tasks/', '/api/async/tasks/']:
+                    response = self.client.get(url, {'cursor': cursor})
+                    self.assertEqual(response.status_code, 404)
+
+        cursor = base64.urlsafe_b64encode(json.dumps(['notatime', 1]).encode()).decode()
+        self.assertEqual(self.client.get('/api/comments/', {'cursor': cursor}).status_code, 404)
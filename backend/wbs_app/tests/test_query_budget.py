@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.test import Client
+
+from wbs_app.middleware import QueryStats
+
+from .base import WBSTestCase
+
+# API별 최대 쿼리 수 (세션/사용자 인증 쿼리 포함).
+# 작업 수와 무관한 상수여야 하며, N+1이 생기면 표본 크기만큼 늘어나 실패합니다.
+QUERY_BUDGETS = [
+    # 전체 간트는 캐시가 빈 상태에서 가지 버전 확인 전후로 트리 구조를 두 번 읽습니다.
+    ('gantt_chart', '/api/tasks/gantt_chart/', 10),
+    ('gantt_chart (window)', '/api/tasks/gantt_chart/?start=2025-08-01&end=2025-08-14', 10),
+    ('critical_path', '/api/tasks/critical_path/', 5),
+    ('dashboard', '/api/dashboard/', 9),
+    ('workload', '/api/workload/', 5),
+    ('leveling', '/api/tasks/leveling/', 8),
+    ('timeline', '/api/timeline/', 5),
+    ('timeline (window)', '/api/timeline/?start=2025-08-01&end=2025-08-14', 6),
+    ('tasks list', '/api/tasks/', 8),
+    ('tasks list (page)', '/api/tasks/?page_size=10', 8),
+    ('task detail', '/api/tasks/{task_id}/', 7),
+    # 비동기 API는 테스트 트랜잭션 안에서는 요청의 연결에서 차례로 조회하므로 동기 API와 같은 예산입니다.
+    ('gantt_chart (async)', '/api/async/tasks/gantt_chart/', 10),
+    ('timeline (async)', '/api/async/timeline/?start=2025-08-01&end=2025-08-14', 6),
+    ('dashboard (async)', '/api/async/dashboard/', 9),
+    ('tasks list (async)', '/api/async/tasks/?page_size=10', 8),
+]
+
+# 같은 형태의 쿼리가 이만큼 반복되면 N+1로 봅니다.
+DUPLICATE_THRESHOLD = 3
+
+
+class QueryBudgetTests(WBSTestCase):
+    """주요 API의 쿼리 수가 고정된 상한 안에 있고, 표본 크기에 따라 늘지 않는지 확인합니다."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client(SERVER_NAME='localhost')
+        self.client.force_login(self.user)
+
+    def count_queries(self, url):
+        cache.clear()
+        with QueryStats() as stats:
+            response = self.client.get(url)
+            if hasattr(response, 'streaming_content'):
+                b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        return stats
+
+    def test_budgets(self):
+        urls = self.create_sample_wbs(children=10)
+        for name, url, budget in QUERY_BUDGETS:
+            with self.subTest(name):
+                stats = self.count_queries(url.format(**urls))
+                self.assertLessEqual(stats.count, budget)
+                self.assertEqual(stats.duplicates(DUPLICATE_THRESHOLD), [])
+
+    def test_counts_do_not_grow_with_tasks(self):
+        urls = self.create_sample_wbs(children=2)
+        small = {name: self.count_queries(url.format(**urls)).count for name, url, _ in QUERY_BUDGETS}
+        self.create_sample_wbs(children=8)
+        for name, url, _ in QUERY_BUDGETS:
+            with self.subTest(name):
+                self.assertEqual(self.count_queries(url.format(**urls)).count, small[name])
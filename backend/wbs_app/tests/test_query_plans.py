@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from .base import WBSTestCase
+
+# 점검할 API와 전체 스캔을 허용할 테이블 (목록 전체가 응답인 경우 등)
+ENDPOINTS = [
+    # 일정(주공정) 계산은 선후행 관계 그래프 전체를 읽습니다 (데이터 버전별 캐시).
+    ('gantt_chart', '/api/tasks/gantt_chart/', {'wbs_app_taskdependency'}),
+    ('gantt_chart (window)', '/api/tasks/gantt_chart/?start=2025-08-01&end=2025-08-14', {'wbs_app_taskdependency'}),
+    ('critical_path', '/api/tasks/critical_path/', {'wbs_app_taskdependency'}),
+    ('timeline', '/api/timeline/', set()),
+    ('timeline (window)', '/api/timeline/?start=2025-08-01&end=2025-08-14', set()),
+    ('dashboard', '/api/dashboard/', set()),
+    # 부하 행렬은 활성 사용자 전체를 행으로 가집니다.
+    ('workload', '/api/workload/', {'wbs_app_user'}),
+    # 자원 평준화는 작업 트리, 담당 배정, 선후행 관계 전체로 계산합니다.
+    ('leveling', '/api/tasks/leveling/', {'wbs_app_task', 'wbs_app_task_assigned_to', 'wbs_app_taskdependency'}),
+    ('tasks list', '/api/tasks/', set()),
+    ('tasks list (page)', '/api/tasks/?page_size=10', set()),
+    ('task detail', '/api/tasks/{task_id}/', set()),
+    ('subtasks', '/api/tasks/{task_id}/subtasks/', set()),
+    ('parent_tasks', '/api/tasks/parent_tasks/', set()),
+    ('task changes', '/api/tasks/changes/?since={sync_token}', set()),
+    ('comments list', '/api/comments/?page_size=10', set()),
+    ('task comments', '/api/comments/?task_id={task_id}', set()),
+    ('users list', '/api/users/', set()),
+    ('task dependencies', '/api/dependencies/?task={task_id}', set()),
+]
+
+
+def explain(sql):
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql)
+        rows = cursor.fetchall()
+    if connection.vendor == 'sqlite':
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def is_bounded_rowid_scan(sql, plan):
+    """
+    조건 없이 기본 키 순서로 LIMIT만큼 읽는 쿼리 (예: 최신 변경 ID 조회).
+    SQLite는 rowid 순서 탐색을 'SCAN 테이블'로 표시하지만 실제로는 LIMIT 행만 읽습니다.
+    """
+    upper = sql.upper()
+    return (
+        ' LIMIT ' in upper and ' WHERE ' not in upper and ' JOIN ' not in upper
+        and not any('TEMP B-TREE' in line for line in plan)
+    )
+
+
+def full_scans(sql, plan):
+    """실행 계획에서 인덱스 없이 전체를 읽는 테이블 이름"""
+    tables = set()
+    if connection.vendor == 'sqlite' and is_bounded_rowid_scan(sql, plan):
+        return tables
+    for line in plan:
+        words = line.strip().split()
+        if connection.vendor == 'sqlite':
+            # 'SCAN 테이블' (인덱스 사용 시 'SCAN 테이블 USING ... INDEX')
+            if len(words) >= 2 and words[0] == 'SCAN' and 'USING' not in words and words[1].startswith('wbs_app_'):
+                tables.add(words[1])
+        elif 'Seq Scan on' in line:
+            tables.add(line.split('Seq Scan on', 1)[1].split()[0])
+    return tables
+
+
+class QueryPlanTests(WBSTestCase):
+    """
+    주요 API가 실행하는 SELECT 쿼리마다 EXPLAIN을 실행해
+    인덱스 없이 테이블 전체를 읽는 쿼리가 없는지 확인합니다 (SQLite, PostgreSQL).
+    """
+
+    def setUp(self):
+        super().setUp()
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest(f'{connection.vendor} 데이터베이스의 실행 계획은 점검하지 않습니다.')
+        self.urls = self.create_sample_wbs()
+        if connection.vendor == 'postgresql':
+            # 작은 표본에서도 사용할 수 있는 인덱스가 있으면 인덱스를 쓰도록 합니다.
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+        self.client = Client(SERVER_NAME='localhost')
+        self.client.force_login(self.user)
+
+    def test_no_full_table_scans(self):
+        for name, url, allowed in ENDPOINTS:
+            with self.subTest(name):
+                cache.clear()
+                with CaptureQueriesContext(connection) as captured:
+                    response = self.client.get(url.format(**self.urls))
+                    if hasattr(response, 'streaming_content'):
+                        b''.join(response.streaming_content)
+                self.assertEqual(response.status_code, 200)
+
+                for query in captured.captured_queries:
+                    sql = query['sql']
+                    if not sql.lstrip().upper().startswith('SELECT'):
+                        continue
+                    plan = explain(sql)
+                    scans = full_scans(sql, plan) - allowed
+                    self.assertFalse(scans, f'{sql}\n  ' + '\n  '.join(plan))
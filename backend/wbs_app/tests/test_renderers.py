@@ -0,0 +1,132 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from wbs_app.models import TaskComment
+from wbs_app.parsers import ORJSONParser
+from wbs_app.renderers import FragmentJSONEncoder, ORJSONRenderer, RawJSON, orjson_dumps, render_json
+
+from .base import WBSTestCase
+
+
+class DRFRenderer(JSONRenderer):
+    """비교 기준: DRF JSONRenderer (미리 렌더링한 조각은 다시 읽어 직렬화)"""
+    encoder_class = FragmentJSONEncoder
+
+
+def drf_render(data):
+    return DRFRenderer().render(data)
+
+
+class RendererParityTests(SimpleTestCase):
+    """orjson 렌더러는 DRF JSONRenderer와 같은 바이트를 만들어야 합니다."""
+
+    def test_values(self):
+        kst = datetime.timezone(datetime.timedelta(hours=9))
+        data = {
+            'date': datetime.date(2025, 8, 1),
+            'datetime': datetime.datetime(2025, 8, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'datetime_kst': datetime.datetime(2025, 8, 1, 12, 30, 15, 123456, tzinfo=kst),
+            'naive': datetime.datetime(2025, 8, 1, 12, 30),
+            'time': datetime.time(9, 15, 30, 500000),
+            'decimal': Decimal('12.50'),
+            'decimals': [Decimal('0'), Decimal('-3.14159'), Decimal('1E+3')],
+            'title': '설계 — 화면 “초안” 🚀',
+            'separators': 'a b c',
+            'control': 'tab\tnewline\n\x00',
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('번역'),
+            'floats': [0.1, 1.5, -2.25, 1e16, 0.00001, 123456789.123],
+            'big': 2 ** 64,
+            'nested': [{'id': 1, 'subtasks': [{'id': 2, 'subtasks': []}]}],
+            'empty': {},
+            'none': None,
+            'bool': True,
+            1: 'int key',
+        }
+        for key, value in data.items():
+            with self.subTest(key=key):
+                self.assertEqual(render_json({key: value}), drf_render({key: value}))
+        self.assertEqual(render_json(data), drf_render(data))
+
+    def test_fragments_are_spliced(self):
+        fragment = render_json([{'id': 1, 'title': '루트', 'start_date': datetime.date(2025, 8, 1)}])
+        data = {'tasks': RawJSON(fragment), 'nested': [RawJSON(b'{"a":1}'), RawJSON(b'[]')]}
+
+        content = orjson_dumps(data)
+
+        self.assertIn(fragment, content)
+        self.assertEqual(content, drf_render(data))
+
+    def test_fragment_marks_need_the_render_nonce(self):
+        nonce = b'\x01' * 8
+        # 사용자 값이 다른 렌더링의 표식과 같은 모양이어도 조각으로 바뀌지 않습니다.
+        data = {
+            'fragment': RawJSON(b'{"a":1}'),
+            'title': '\x00' + '02' * 8 + ':0',
+            'other': '\x00' + nonce.hex() + ':9',
+            'quoted': 'a"\x00' + nonce.hex() + ':0',
+            '\x00' + nonce.hex() + ':0': 'key',
+        }
+
+        with mock.patch('wbs_app.renderers.os.urandom', return_value=nonce):
+            content = orjson_dumps(data)
+
+        self.assertEqual(content, drf_render(data))
+        # 이번 렌더링의 표식 모양이어도 없는 순번이거나 문자열 중간이면 그대로 둡니다.
+        self.assertIn(b'"\\u0000' + nonce.hex().encode() + b':9"', content)
+
+    def test_fallback_settings(self):
+        renderer = ORJSONRenderer()
+        data = {'title': '작업', 'date': datetime.date(2025, 8, 1)}
+        self.assertEqual(
+            renderer.render(data, 'application/json; indent=2', {}),
+            JSONRenderer().render(data, 'application/json; indent=2', {}),
+        )
+
+    def test_parser(self):
+        body = '{"title": "설계", "ids": [1, 2], "big": 18446744073709551616}'.encode()
+
+        data = ORJSONParser().parse(io.BytesIO(body))
+
+        self.assertEqual(data, {'title': '설계', 'ids': [1, 2], 'big': 2 ** 64})
+
+
+class EndpointParityTests(WBSTestCase):
+    """API 응답 바이트가 DRF JSONRenderer로 렌더링한 것과 같은지 확인합니다."""
+
+    def setUp(self):
+        super().setUp()
+        root = self.create_task('루트 “설계” — 🚀', description='줄 바꿈')
+        child = self.create_task('하위 작업', parent=root, progress=35)
+        child.assigned_to.add(self.user)
+        TaskComment.objects.create(task=child, author=self.user, content='댓글 ✅')
+
+    def test_read_endpoints(self):
+        urls = [
+            '/api/tasks/',
+            '/api/tasks/?page_size=1',
+            '/api/tasks/gantt_chart/',
+            '/api/tasks/gantt_chart/?start=2025-08-01&end=2025-08-04',
+            '/api/timeline/',
+            '/api/dashboard/',
+            '/api/comments/',
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, drf_render(response.data))
+
+    def test_cached_gantt_fragments(self):
+        first = self.client.get('/api/tasks/gantt_chart/')
+        # 두 번째 요청은 캐시된 가지 조각을 이어 붙입니다.
+        second = self.client.get('/api/tasks/gantt_chart/')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.content, drf_render(second.data))
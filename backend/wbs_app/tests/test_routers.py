@@ -0,0 +1,117 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase
+
+from wbs_app.middleware import ReplicaRoutingMiddleware
+from wbs_app.models import Task
+from wbs_app.routers import REPLICA_DB_ALIAS, PrimaryReplicaRouter, read_database, replica_caught_up
+
+router = PrimaryReplicaRouter()
+
+
+def route_during(request, atomic=False):
+    """미들웨어를 거친 요청 안에서 Task 조회가 갈 DB 별칭과 응답"""
+    seen = []
+
+    def view(request):
+        if atomic:
+            with transaction.atomic():
+                seen.append(router.db_for_read(Task))
+        else:
+            seen.append(router.db_for_read(Task))
+        return HttpResponse()
+
+    response = ReplicaRoutingMiddleware(view)(request)
+    return seen[0], response
+
+
+# 테스트 DB에는 복제본이 없으므로 설정된 것처럼 보이게 합니다 (실제 조회는 하지 않습니다).
+@mock.patch('wbs_app.middleware.replica_configured', return_value=True)
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    복제본 라우팅 (요청 단위 별칭, 트랜잭션 안 조회, 쓰기 후 고정 쿠키)
+    WBSTestCase는 테스트 전체를 트랜잭션으로 감싸 모든 조회가 주 DB로 가므로 트랜잭션 없이 실행합니다.
+    """
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_listed_read_views_go_to_the_replica(self, configured):
+        for path in ['/api/tasks/', '/api/tasks/gantt_chart/', '/api/timeline/', '/api/dashboard/', '/api/async/tasks/']:
+            with self.subTest(path=path):
+                alias, _ = route_during(self.factory.get(path))
+                self.assertEqual(alias, REPLICA_DB_ALIAS)
+        self.assertEqual(route_during(self.factory.head('/api/tasks/'))[0], REPLICA_DB_ALIAS)
+
+    def test_other_requests_read_the_primary(self, configured):
+        for request in [
+            self.factory.get('/api/tasks/1/'),           # 목록에 없는 읽기 API
+            self.factory.get('/api/workload/'),
+            self.factory.get('/api/unknown/'),           # URL 없음
+            self.factory.post('/api/tasks/'),
+            self.factory.patch('/api/tasks/1/'),
+        ]:
+            with self.subTest(method=request.method, path=request.path):
+                self.assertIsNone(route_during(request)[0])
+
+    def test_reads_inside_a_transaction_use_the_primary(self, configured):
+        alias, _ = route_during(self.factory.get('/api/tasks/'), atomic=True)
+        self.assertIsNone(alias)
+
+    def test_writes_pin_the_client_to_the_primary(self, configured):
+        _, response = route_during(self.factory.post('/api/tasks/'))
+        cookie = response.cookies[ReplicaRoutingMiddleware.pin_cookie_name]
+        self.assertTrue(cookie['httponly'])
+        self.assertEqual(int(cookie['max-age']), 10)
+
+        request = self.factory.get('/api/tasks/')
+        request.COOKIES[ReplicaRoutingMiddleware.pin_cookie_name] = cookie.value
+        alias, response = route_during(request)
+        self.assertIsNone(alias)
+        # 읽기 요청은 고정 시간을 늘리지 않습니다.
+        self.assertNotIn(ReplicaRoutingMiddleware.pin_cookie_name, response.cookies)
+
+    def test_without_a_replica_nothing_changes(self, configured):
+        configured.return_value = False
+        alias, response = route_during(self.factory.post('/api/tasks/'))
+        self.assertIsNone(alias)
+        self.assertFalse(response.cookies)
+        self.assertIsNone(route_during(self.factory.get('/api/tasks/'))[0])
+
+    def test_async_requests(self, configured):
+        seen = []
+
+        async def view(request):
+            seen.append(router.db_for_read(Task))
+            return HttpResponse()
+
+        middleware = ReplicaRoutingMiddleware(view)
+        async_to_sync(middleware)(self.factory.get('/api/async/dashboard/'))
+        async_to_sync(middleware)(self.factory.post('/api/tasks/'))
+        self.assertEqual(seen, [REPLICA_DB_ALIAS, None])
+        # 요청이 끝나면 별칭이 원래대로 돌아갑니다.
+        self.assertIsNone(read_database.get())
+
+    def test_caught_up_check_only_for_replica_reads(self, configured):
+        self.assertTrue(replica_caught_up(None))
+        token = read_database.set(REPLICA_DB_ALIAS)
+        try:
+            # 요청 시작 시 버전을 읽지 못했으면 캐시에 저장하지 않습니다.
+            self.assertFalse(replica_caught_up(None))
+            with transaction.atomic():
+                self.assertTrue(replica_caught_up(None))
+        finally:
+            read_database.reset(token)
+
+    def test_writes_and_migrations_use_the_primary(self, configured):
+        token = read_database.set(REPLICA_DB_ALIAS)
+        try:
+            self.assertEqual(router.db_for_read(Task), REPLICA_DB_ALIAS)
+            self.assertEqual(router.db_for_write(Task), 'default')
+        finally:
+            read_database.reset(token)
+        self.assertIs(router.allow_migrate(REPLICA_DB_ALIAS, 'wbs_app'), False)
+        self.assertIsNone(router.allow_migrate('default', 'wbs_app'))
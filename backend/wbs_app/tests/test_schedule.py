@@ -0,0 +1,79 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from wbs_app.models import TaskDependency
+from wbs_app.schedule import DependencyCycle, compute_schedule
+from wbs_app.workdays import WorkCalendar
+
+from .base import WBSTestCase
+
+# A(3일), B(2일) → C(1일) → D(1일, 1업무일 지연). 모두 2025-08-04(월)에 계획.
+TASKS = [
+    (1, date(2025, 8, 4), date(2025, 8, 6)),
+    (2, date(2025, 8, 4), date(2025, 8, 5)),
+    (3, date(2025, 8, 4), date(2025, 8, 4)),
+    (4, date(2025, 8, 4), date(2025, 8, 4)),
+]
+DEPENDENCIES = [
+    (10, 1, 3, 'FS', 0),
+    (11, 2, 3, 'FS', 0),
+    (12, 3, 4, 'FS', 1),
+]
+
+
+class ComputeScheduleTests(SimpleTestCase):
+    """CPM 전진/후진 계산"""
+
+    def test_float_and_critical_path(self):
+        schedule = compute_schedule(TASKS, DEPENDENCIES, WorkCalendar())
+        rows = {row['id']: row for row in schedule['tasks']}
+
+        self.assertEqual(schedule['critical_path'], [1, 3, 4])
+        self.assertEqual({task_id: row['total_float'] for task_id, row in rows.items()}, {1: 0, 2: 1, 3: 0, 4: 0})
+        self.assertEqual((rows[2]['latest_start'], rows[2]['latest_finish']), (date(2025, 8, 5), date(2025, 8, 6)))
+        self.assertEqual((rows[3]['earliest_start'], rows[3]['earliest_finish']), (date(2025, 8, 7), date(2025, 8, 7)))
+        # 지연 1업무일(금)을 두고 다음 월요일에 시작합니다.
+        self.assertEqual(rows[4]['earliest_start'], date(2025, 8, 11))
+        self.assertEqual((schedule['project_start'], schedule['project_finish']), (date(2025, 8, 4), date(2025, 8, 11)))
+        self.assertEqual(
+            {link['id']: link['is_critical'] for link in schedule['dependencies']},
+            {10: True, 11: False, 12: True},
+        )
+
+    def test_holidays_shift_schedule(self):
+        schedule = compute_schedule(TASKS, DEPENDENCIES, WorkCalendar(['2025-08-07']))
+        rows = {row['id']: row for row in schedule['tasks']}
+
+        self.assertEqual(rows[3]['earliest_start'], date(2025, 8, 8))
+        self.assertEqual(rows[4]['earliest_start'], date(2025, 8, 12))
+
+    def test_cycle(self):
+        with self.assertRaises(DependencyCycle) as context:
+            compute_schedule(TASKS, DEPENDENCIES + [(13, 4, 1, 'FS', 0)], WorkCalendar())
+        self.assertEqual(sorted(context.exception.task_ids), [1, 3, 4])
+
+
+class CriticalPathViewTests(WBSTestCase):
+    """GET /api/tasks/critical_path/"""
+
+    def setUp(self):
+        super().setUp()
+        self.first = self.create_task('설계', start=date(2025, 8, 4), end=date(2025, 8, 6))
+        self.second = self.create_task('구현', start=date(2025, 8, 4), end=date(2025, 8, 5))
+        TaskDependency.objects.create(predecessor=self.first, successor=self.second)
+
+    def test_schedule(self):
+        response = self.client.get('/api/tasks/critical_path/')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data['critical_path'], [self.first.pk, self.second.pk])
+        self.assertEqual(data['project_finish'], '2025-08-08')
+
+    def test_cycle_conflict(self):
+        TaskDependency.objects.create(predecessor=self.second, successor=self.first)
+
+        response = self.client.get('/api/tasks/critical_path/')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(sorted(response.json()['cycle']), [self.first.pk, self.second.pk])
@@ -0,0 +1,107 @@
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from wbs_app.models import ChangeLog, DataVersion, Task, TaskComment
+from wbs_app.sync import collect_changes, decode_token, encode_token, prune_changes
+
+from .base import WBSTestCase
+
+
+class SyncTests(WBSTestCase):
+    """tasks/changes/ 증분 동기화"""
+
+    def changes(self, token):
+        return self.client.get('/api/tasks/changes/', {'since': token})
+
+    def test_token_is_data_version(self):
+        self.create_task('작업')
+        response = self.client.get('/api/tasks/')
+
+        self.assertEqual(decode_token(response['X-Sync-Token']), DataVersion.current().version)
+        log = ChangeLog.objects.latest('id')
+        self.assertEqual(log.version, DataVersion.current().version)
+
+    def test_changes_since_token(self):
+        task = self.create_task('작업')
+        token = self.client.get('/api/tasks/changes/').data['next']
+
+        task.title = '수정'
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+            TaskComment.objects.create(task=task, author=self.user, content='댓글')
+        removed = self.create_task('삭제')
+        removed_id = removed.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            removed.delete()
+
+        data = self.changes(token).data
+        self.assertEqual([row['title'] for row in data['tasks']], ['수정'])
+        self.assertEqual(len(data['comments']), 1)
+        self.assertEqual(data['deleted']['tasks'], [removed_id])
+        self.assertFalse(data['has_more'])
+
+        data = self.changes(data['next']).data
+        self.assertEqual((data['tasks'], data['deleted']['tasks']), ([], []))
+
+    def test_one_version_per_transaction(self):
+        root = self.create_task('루트')
+        children = [self.create_task(f'하위 {index}', parent=root) for index in range(5)]
+        comment = TaskComment.objects.create(task=children[0], author=self.user, content='댓글')
+        expected = [('task', task.pk, 'delete') for task in [root, *children]] + [('comment', comment.pk, 'delete')]
+        version = DataVersion.current().version
+
+        with self.captureOnCommitCallbacks(execute=True):
+            # CASCADE로 하위 작업과 댓글이 함께 삭제됩니다.
+            root.delete()
+
+        self.assertEqual(DataVersion.current().version, version + 1)
+        logs = ChangeLog.objects.filter(version=version + 1)
+        self.assertEqual(sorted(logs.values_list('model', 'object_id', 'action')), sorted(expected))
+
+    def test_rolled_back_delete_is_not_logged(self):
+        task = self.create_task('작업')
+        try:
+            with transaction.atomic():
+                Task.objects.filter(pk=task.pk).delete()
+                raise RuntimeError
+        except RuntimeError:
+            pass
+        # 롤백으로 예약된 콜백은 사라졌지만 모인 변경은 다음 커밋에 함께 기록됩니다.
+        with self.captureOnCommitCallbacks(execute=True):
+            TaskComment.objects.create(task=task, author=self.user, content='댓글')
+
+        self.assertTrue(Task.objects.filter(pk=task.pk).exists())
+        self.assertFalse(ChangeLog.objects.filter(model='task', object_id=task.pk, action='delete').exists())
+
+    def test_pages_do_not_split_a_version(self):
+        first = self.create_task('첫 작업')
+        since = DataVersion.current().version - 1
+        # 한 트랜잭션(한 버전)에 기록된 여러 변경
+        tasks = [self.create_task(f'작업 {index}') for index in range(3)]
+        ChangeLog.objects.filter(object_id__in=[task.pk for task in tasks]).update(version=since + 2)
+
+        _, _, _, version, has_more = collect_changes(since, limit=2)
+        self.assertEqual((version, has_more), (since + 1, True))
+
+        page, _, _, version, has_more = collect_changes(since + 1, limit=2)
+        self.assertEqual({task.pk for task in page}, {task.pk for task in tasks})
+        self.assertNotIn(first.pk, {task.pk for task in page})
+
+    def test_expired_token_requires_full_resync(self):
+        self.create_task('작업')
+        token = self.client.get('/api/tasks/changes/').data['next']
+        old_version = decode_token(token) - 1
+        ChangeLog.objects.update(created_at=timezone.now() - timedelta(days=40))
+        self.create_task('새 작업')
+
+        self.assertEqual(prune_changes(30), 1)
+
+        response = self.changes(token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['title'] for row in response.data['tasks']], ['새 작업'])
+
+        response = self.changes(encode_token(old_version))
+        self.assertEqual(response.status_code, 410)
+        self.assertTrue(response.data['full_resync'])
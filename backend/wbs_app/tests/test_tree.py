@@ -0,0 +1,197 @@
+import json
+from datetime import date
+from importlib import import_module
+
+from django.apps import apps
+from rest_framework.renderers import JSONRenderer
+
+from wbs_app.models import Task, TaskComment, User
+from wbs_app.rollup import rebuild_all
+from wbs_app.serializers import TaskSerializer
+from wbs_app.tree import build_subtrees, build_task_tree
+
+from .base import WBSTestCase
+
+
+class TaskTreeTests(WBSTestCase):
+    """계층 경로와 롤업 값 (이동, 삭제, 전체 재계산)"""
+
+    def setUp(self):
+        super().setUp()
+        # 2025-08-04(월) ~ 08-08(금), 08-11(월) ~ 08-15(금): 각 5업무일
+        self.first = self.create_task('첫 묶음')
+        self.moved = self.create_task('옮길 작업', parent=self.first, start=date(2025, 8, 4), end=date(2025, 8, 8), progress=100)
+        self.leaf = self.create_task('말단', parent=self.moved, start=date(2025, 8, 4), end=date(2025, 8, 8), progress=100)
+        self.second = self.create_task('둘째 묶음')
+        self.stay = self.create_task('남는 작업', parent=self.second, start=date(2025, 8, 11), end=date(2025, 8, 15), progress=0)
+
+    def patch(self, task, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(f'/api/tasks/{task.pk}/', data, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def test_paths_on_create(self):
+        self.assertEqual(self.leaf.path, f'{self.first.pk}/{self.moved.pk}/{self.leaf.pk}/')
+        self.assertEqual(self.leaf.depth, 2)
+        self.reload(self.first)
+        self.assertEqual(self.first.subtask_count, 1)
+        self.assertEqual(self.first.rolled_up_progress, 100)
+
+    def test_move_updates_paths_and_rollups(self):
+        self.patch(self.moved, {'parent_task': self.second.pk})
+        self.reload(self.first, self.second, self.moved, self.leaf)
+
+        self.assertEqual(self.moved.path, f'{self.second.pk}/{self.moved.pk}/')
+        self.assertEqual(self.leaf.path, f'{self.second.pk}/{self.moved.pk}/{self.leaf.pk}/')
+        self.assertEqual((self.moved.depth, self.leaf.depth), (1, 2))
+
+        # 새 상위 작업: 같은 기간의 100%와 0% 하위 작업
+        self.assertEqual(self.second.subtask_count, 2)
+        self.assertEqual(self.second.rolled_up_progress, 50)
+        self.assertEqual(self.second.effective_start_date, date(2025, 8, 4))
+        self.assertEqual(self.second.effective_end_date, date(2025, 8, 15))
+
+        # 이전 상위 작업: 하위 작업이 없어져 자신의 값으로 돌아갑니다.
+        self.assertEqual(self.first.subtask_count, 0)
+        self.assertEqual(self.first.rolled_up_progress, self.first.progress)
+        self.assertEqual(self.first.effective_start_date, self.first.start_date)
+
+    def test_move_to_root(self):
+        self.patch(self.moved, {'parent_task': None})
+        self.reload(self.moved, self.leaf, self.first)
+
+        self.assertEqual(self.moved.path, f'{self.moved.pk}/')
+        self.assertEqual(self.leaf.path, f'{self.moved.pk}/{self.leaf.pk}/')
+        self.assertEqual((self.moved.depth, self.leaf.depth), (0, 1))
+        self.assertEqual(self.first.subtask_count, 0)
+
+    def test_progress_change_rolls_up_to_ancestors(self):
+        self.patch(self.leaf, {'progress': 40})
+        self.reload(self.moved, self.first)
+
+        self.assertEqual(self.moved.rolled_up_progress, 40)
+        self.assertEqual(self.first.rolled_up_progress, 40)
+
+    def test_date_change_rolls_up_to_ancestors(self):
+        self.patch(self.leaf, {'end_date': '2025-08-20'})
+        self.reload(self.moved, self.first)
+
+        self.assertEqual((self.moved.end_date, self.first.end_date), (date(2025, 8, 20), date(2025, 8, 20)))
+
+    def test_rejects_cycle(self):
+        response = self.client.patch(f'/api/tasks/{self.first.pk}/', {'parent_task': self.leaf.pk}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_delete_updates_rollups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'/api/tasks/{self.moved.pk}/')
+        self.assertEqual(response.status_code, 204)
+        self.reload(self.first)
+
+        self.assertFalse(Task.objects.filter(pk=self.leaf.pk).exists())
+        self.assertEqual(self.first.subtask_count, 0)
+        self.assertEqual(self.first.rolled_up_progress, self.first.progress)
+
+    def test_rebuild_all_repairs_paths_and_rollups(self):
+        Task.objects.filter(pk=self.leaf.pk).update(path='broken/', depth=9)
+        Task.objects.filter(pk=self.first.pk).update(subtask_count=0, rolled_up_progress=0)
+
+        rebuild_all()
+        self.reload(self.leaf, self.first)
+
+        self.assertEqual(self.leaf.path, f'{self.first.pk}/{self.moved.pk}/{self.leaf.pk}/')
+        self.assertEqual(self.leaf.depth, 2)
+        self.assertEqual(self.first.subtask_count, 1)
+        self.assertEqual(self.first.rolled_up_progress, 100)
+
+
+class TaskTreeParityTests(WBSTestCase):
+    """build_task_tree는 재귀 TaskSerializer와 같은 JSON을 만들어야 합니다."""
+
+    def setUp(self):
+        super().setUp()
+        other = User.objects.create_user(username='kim', name='김', password='password')
+        # 단계마다 하위 작업 수가 다르고 생성 순서와 ID 순서가 섞인 트리
+        first = self.create_task('첫 루트')
+        second = self.create_task('둘째 루트', start=date(2025, 8, 11), end=date(2025, 8, 15))
+        a = self.create_task('가', parent=second)
+        b = self.create_task('나', parent=first, progress=50, status='in_progress')
+        c = self.create_task('다', parent=a, start=date(2025, 8, 4), end=date(2025, 8, 6))
+        self.create_task('라', parent=b)
+        self.create_task('마', parent=a, description='설명 "따옴표"\n줄바꿈')
+        self.create_task('바', parent=first)
+        self.create_task('외톨이')
+        with self.captureOnCommitCallbacks(execute=True):
+            b.assigned_to.set([self.user, other])
+            c.assigned_to.set([other])
+            TaskComment.objects.create(task=c, author=other, content='댓글 하나')
+            TaskComment.objects.create(task=c, author=self.user, content='댓글 둘')
+            TaskComment.objects.create(task=first, author=self.user, content='루트 댓글')
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_whole_tree(self):
+        roots = Task.objects.filter(parent_task__isnull=True)
+        expected = self.render(TaskSerializer(roots, many=True).data)
+
+        self.assertEqual(self.render(build_task_tree()), expected)
+
+    def test_subtrees(self):
+        tasks = list(Task.objects.order_by('-id')[:4])
+        expected = self.render(TaskSerializer(tasks, many=True).data)
+
+        self.assertEqual(self.render(build_subtrees(tasks)), expected)
+
+    def test_gantt_chart_tasks(self):
+        roots = Task.objects.filter(parent_task__isnull=True)
+        expected = TaskSerializer(roots, many=True).data
+
+        # 가지별 캐시 조각으로 조립한 응답도 같아야 합니다 (두 번째 요청은 캐시 적중).
+        for _ in range(2):
+            response = self.client.get('/api/tasks/gantt_chart/')
+            self.assertEqual(response.json()['tasks'], json.loads(self.render(expected)))
+
+
+class BuildPathsMigrationTests(WBSTestCase):
+    """0003 마이그레이션의 경로 채우기"""
+
+    build_paths = staticmethod(import_module('wbs_app.migrations.0003_task_path').build_paths)
+
+    def test_fills_paths_from_parents(self):
+        root = self.create_task('루트')
+        child = self.create_task('하위', parent=root)
+        grandchild = self.create_task('손자', parent=child)
+        Task.objects.update(path='', depth=0)
+
+        self.build_paths(apps, None)
+
+        self.assertEqual(
+            dict(Task.objects.values_list('id', 'path')),
+            {root.pk: f'{root.pk}/', child.pk: f'{root.pk}/{child.pk}/', grandchild.pk: f'{root.pk}/{child.pk}/{grandchild.pk}/'},
+        )
+        self.assertEqual(Task.objects.get(pk=grandchild.pk).depth, 2)
+
+    def test_deep_chain_does_not_recurse(self):
+        # 재귀 한도(1000)보다 깊은 사슬. 경로 길이 제한은 SQLite에서 검사하지 않습니다.
+        tasks = Task.objects.bulk_create([
+            Task(title=str(index), start_date=date(2025, 8, 1), end_date=date(2025, 8, 1), created_by=self.user)
+            for index in range(1500)
+        ])
+        # ID가 작은 작업이 더 깊도록 이어, 먼저 처리하는 작업부터 사슬 끝까지 올라가게 합니다.
+        for task, parent in zip(tasks, tasks[1:]):
+            task.parent_task = parent
+        Task.objects.bulk_update(tasks, ['parent_task'])
+
+        self.build_paths(apps, None)
+        self.assertEqual(Task.objects.get(pk=tasks[0].pk).depth, 1499)
+
+    def test_reports_parent_cycles(self):
+        a = self.create_task('A')
+        b = self.create_task('B', parent=a)
+        c = self.create_task('C', parent=b)
+        Task.objects.filter(pk=a.pk).update(parent_task=c)
+
+        with self.assertRaisesMessage(RuntimeError, f'작업 ID {a.pk} -> {c.pk} -> {b.pk} -> {a.pk}'):
+            self.build_paths(apps, None)
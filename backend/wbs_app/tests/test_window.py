@@ -0,0 +1,117 @@
+from datetime import date
+
+from wbs_app.models import Task
+from wbs_app.tree import windowed_tasks
+
+from .base import WBSTestCase
+
+WINDOW = (date(2025, 8, 11), date(2025, 8, 15))
+
+
+def overlaps(task, start, end):
+    return (end is None or task.start_date <= end) and (start is None or task.end_date >= start)
+
+
+def tree_ids(rows):
+    ids = set()
+    for row in rows:
+        ids.add(row['id'])
+        ids |= tree_ids(row.get('subtasks') or [])
+    return ids
+
+
+class WindowedTasksTests(WBSTestCase):
+    """구간(?start=&end=&root=) 조회의 경계 포함 여부를 하나씩 확인한 결과와 비교"""
+
+    def setUp(self):
+        super().setUp()
+        project = self.create_task('프로젝트')
+        self.ends_on_start = self.create_task('시작일에 끝남', parent=project, start=date(2025, 8, 4), end=date(2025, 8, 11))
+        self.starts_on_end = self.create_task('종료일에 시작', parent=project, start=date(2025, 8, 15), end=date(2025, 8, 22))
+        self.before = self.create_task('하루 전에 끝남', parent=project, start=date(2025, 8, 1), end=date(2025, 8, 10))
+        self.after = self.create_task('하루 뒤에 시작', parent=project, start=date(2025, 8, 16), end=date(2025, 8, 22))
+        self.spans = self.create_task('구간을 덮음', parent=project, start=date(2025, 8, 1), end=date(2025, 8, 29))
+        self.inside = self.create_task('구간 안', parent=self.spans, start=date(2025, 8, 12), end=date(2025, 8, 12))
+        self.outside = self.create_task('구간 밖', parent=self.spans, start=date(2025, 8, 25), end=date(2025, 8, 29))
+        self.other = self.create_task('다른 프로젝트', start=date(2025, 8, 25), end=date(2025, 8, 29))
+        self.create_task('다른 하위 작업', parent=self.other, start=date(2025, 8, 25), end=date(2025, 8, 26))
+        self.project = Task.objects.get(pk=project.pk)
+
+    def expected_ids(self, start=None, end=None, root=None):
+        """겹치는 작업과 그 상위 작업 (root가 있으면 root 하위 트리 안에서만)"""
+        tasks = {task.id: task for task in Task.objects.all()}
+        if root is not None:
+            tasks = {task_id: task for task_id, task in tasks.items() if task.path.startswith(root.path)}
+        ids = set()
+        for task in tasks.values():
+            if overlaps(task, start, end):
+                while task is not None:
+                    ids.add(task.id)
+                    task = tasks.get(task.parent_task_id)
+        return ids
+
+    def windowed_ids(self, **window):
+        tasks, _ = windowed_tasks(**window)
+        return set(tasks.values_list('id', flat=True))
+
+    def test_boundaries_are_inclusive(self):
+        start, end = WINDOW
+        ids = self.windowed_ids(start=start, end=end)
+
+        self.assertEqual(ids, self.expected_ids(start, end))
+        self.assertTrue({self.ends_on_start.id, self.starts_on_end.id, self.inside.id} <= ids)
+        self.assertFalse({self.before.id, self.after.id, self.outside.id, self.other.id} & ids)
+
+    def test_matches_brute_force_for_many_windows(self):
+        windows = [
+            (date(2025, 8, 11), date(2025, 8, 11)),
+            (date(2025, 8, 10), date(2025, 8, 10)),
+            (date(2025, 8, 16), date(2025, 8, 24)),
+            (date(2025, 8, 25), date(2025, 9, 1)),
+            (date(2025, 9, 1), date(2025, 9, 30)),
+            (None, date(2025, 8, 10)),
+            (date(2025, 8, 23), None),
+        ]
+        for start, end in windows:
+            with self.subTest(start=start, end=end):
+                self.assertEqual(self.windowed_ids(start=start, end=end), self.expected_ids(start, end))
+
+    def test_root_limits_to_subtree(self):
+        start, end = WINDOW
+        tasks, root_ids = windowed_tasks(start=start, end=end, root=self.spans)
+
+        self.assertEqual(root_ids, [self.spans.id])
+        self.assertEqual(set(tasks.values_list('id', flat=True)), {self.spans.id, self.inside.id})
+        self.assertEqual(
+            self.windowed_ids(start=date(2025, 8, 25), root=self.spans),
+            self.expected_ids(date(2025, 8, 25), None, self.spans),
+        )
+
+    def test_includes_ancestors_outside_the_window(self):
+        # 롤업 전처럼 상위 작업 일정이 하위 작업을 덮지 않아도 맥락을 위해 상위 작업을 포함합니다.
+        Task.objects.filter(pk__in=[self.project.pk, self.spans.pk]).update(
+            start_date=date(2025, 7, 23), end_date=date(2025, 7, 31)
+        )
+        ids = self.windowed_ids(start=date(2025, 8, 12), end=date(2025, 8, 12))
+
+        self.assertEqual(ids, {self.project.id, self.spans.id, self.inside.id})
+
+    def test_gantt_and_timeline_windows(self):
+        start, end = WINDOW
+        params = {'start': start.isoformat(), 'end': end.isoformat()}
+
+        gantt = self.client.get('/api/tasks/gantt_chart/', params).json()
+        self.assertEqual(tree_ids(gantt['tasks']), self.expected_ids(start, end))
+        self.assertEqual([row['id'] for row in gantt['tasks']], [self.project.id])
+        self.assertEqual(gantt['work_days'][0], '2025-08-11')
+        self.assertEqual(gantt['work_days'][-1], '2025-08-15')
+
+        timeline = self.client.get('/api/timeline/', params).json()
+        self.assertEqual([row['id'] for row in timeline['timeline_data']], [self.project.id])
+        self.assertEqual(
+            {row['id'] for row in timeline['timeline_data'][0]['subtasks']},
+            {self.ends_on_start.id, self.starts_on_end.id, self.spans.id},
+        )
+
+        response = self.client.get('/api/tasks/gantt_chart/', {'start': '2025-08-15', 'end': '2025-08-11'})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase, override_settings
+
+from wbs_app.workdays import KR_HOLIDAYS, WorkCalendar, count_weekdays, get_calendar
+
+# 2025년 추석 연휴(10/3 금 ~ 10/9 목, 주말 포함)와 주말에 겹친 휴일(2025-03-01 토)
+HOLIDAYS = ['2025-03-01', *KR_HOLIDAYS]
+HOLIDAY_DATES = {date.fromisoformat(day) for day in HOLIDAYS}
+
+
+def brute_force_workdays(start_date, end_date):
+    """하루씩 세는 업무일 수"""
+    days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    return sum(1 for day in days if day.weekday() < 5 and day not in HOLIDAY_DATES)
+
+
+class WorkCalendarTests(SimpleTestCase):
+    """업무일 달력의 닫힌 식 계산을 하루씩 센 결과와 비교"""
+
+    def setUp(self):
+        self.calendar = WorkCalendar(HOLIDAYS)
+
+    def test_count_weekdays_for_every_start_day_and_span(self):
+        start = date(2025, 9, 1)  # 월요일
+        for first in range(7):
+            for days in range(22):
+                start_date = start + timedelta(days=first)
+                end_date = start_date + timedelta(days=days - 1)
+                expected = sum(1 for offset in range(days) if (start_date + timedelta(days=offset)).weekday() < 5)
+                self.assertEqual(count_weekdays(start_date, end_date), expected, (start_date, end_date))
+
+    def test_count_workdays_across_holidays_and_weekends(self):
+        spans = [
+            (date(2025, 10, 1), date(2025, 10, 12)),   # 추석 연휴 전체 (업무일 3일)
+            (date(2025, 10, 4), date(2025, 10, 5)),    # 주말만
+            (date(2025, 10, 6), date(2025, 10, 9)),    # 평일 연휴만
+            (date(2025, 2, 28), date(2025, 3, 3)),     # 주말 휴일(3/1)과 대체공휴일(3/3)
+            (date(2024, 12, 30), date(2026, 1, 2)),    # 휴일표 범위를 넘는 구간
+            (date(2025, 8, 8), date(2025, 8, 1)),      # 뒤집힌 구간
+        ]
+        for start_date, end_date in spans:
+            self.assertEqual(
+                self.calendar.count_workdays(start_date, end_date),
+                brute_force_workdays(start_date, end_date),
+                (start_date, end_date),
+            )
+        self.assertEqual(self.calendar.count_workdays(date(2025, 10, 1), date(2025, 10, 12)), 3)
+        self.assertEqual(self.calendar.count_workdays(date(2025, 10, 4), date(2025, 10, 9)), 0)
+
+    def test_every_window_in_a_year(self):
+        start = date(2025, 1, 1)
+        for offset in range(0, 365, 3):
+            start_date = start + timedelta(days=offset)
+            for length in (1, 6, 13, 40):
+                end_date = start_date + timedelta(days=length)
+                self.assertEqual(
+                    self.calendar.count_workdays(start_date, end_date),
+                    brute_force_workdays(start_date, end_date),
+                    (start_date, end_date),
+                )
+
+    def test_workday_index_round_trip(self):
+        day = date(2025, 9, 29)
+        for _ in range(30):
+            index = self.calendar.workday_index(day)
+            if self.calendar.is_workday(day):
+                self.assertEqual(self.calendar.workday_at(index), day)
+            else:
+                # 쉬는 날은 다음 업무일과 같은 번호입니다.
+                self.assertEqual(self.calendar.workday_at(index), self.calendar.work_days(day, day + timedelta(days=10))[0])
+            day += timedelta(days=1)
+        # 추석 연휴 전 마지막 업무일(10/2 목) 다음 업무일은 10/10(금)입니다.
+        index = self.calendar.workday_index(date(2025, 10, 2))
+        self.assertEqual(self.calendar.workday_at(index + 1), date(2025, 10, 10))
+
+    def test_weekend_holidays_are_not_counted_twice(self):
+        self.assertNotIn(date(2025, 3, 1), self.calendar.holidays)
+        self.assertEqual(self.calendar.count_workdays(date(2025, 3, 1), date(2025, 3, 2)), 0)
+
+    def test_settings_select_holiday_sets(self):
+        with override_settings(WBS_HOLIDAY_SETS=['KR'], WBS_HOLIDAYS=['2025-08-04']):
+            calendar = get_calendar()
+            self.assertFalse(calendar.is_workday(date(2025, 8, 4)))
+            self.assertFalse(calendar.is_workday(date(2025, 8, 15)))
+        with override_settings(WBS_HOLIDAY_SETS=[], WBS_HOLIDAYS=[]):
+            self.assertTrue(get_calendar().is_workday(date(2025, 8, 15)))
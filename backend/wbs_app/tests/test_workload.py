@@ -0,0 +1,118 @@
+import random
+from datetime import date, timedelta
+from unittest import mock
+
+from django.test import override_settings
+
+from wbs_app import workload
+from wbs_app.models import User
+from wbs_app.workdays import get_calendar
+
+from .base import WBSTestCase
+
+START, END = date(2025, 8, 1), date(2025, 8, 31)
+
+
+@override_settings(WBS_HOLIDAY_SETS=['KR'], WBS_HOLIDAYS=['2025-08-20'])
+class WorkloadTests(WBSTestCase):
+    """workload/ 부하 행렬을 사용자 × 날짜 × 작업 반복문으로 센 결과와 비교"""
+
+    def setUp(self):
+        super().setUp()
+        self.users = [self.user] + [
+            User.objects.create_user(username=f'user{index}', name=f'사용자 {index}', password='password')
+            for index in range(3)
+        ]
+        User.objects.create_user(username='inactive', name='비활성', password='password', is_active=False)
+
+        # 구간 밖, 경계에 걸친 작업, 주말/휴일을 포함하는 작업을 섞은 무작위 배치 (고정 시드)
+        generator = random.Random(20250801)
+        self.assignments = []
+        parent = self.create_task('상위 작업', start=date(2025, 7, 20), end=date(2025, 9, 10))
+        with self.captureOnCommitCallbacks(execute=True):
+            parent.assigned_to.set(self.users)
+        for index in range(25):
+            start = date(2025, 7, 20) + timedelta(days=generator.randrange(50))
+            end = start + timedelta(days=generator.randrange(12))
+            status = generator.choice(['not_started', 'in_progress', 'completed'])
+            task = self.create_task(f'작업 {index}', parent=parent, start=start, end=end, status=status)
+            assignees = generator.sample(self.users, generator.randrange(4))
+            with self.captureOnCommitCallbacks(execute=True):
+                task.assigned_to.set(assignees)
+            self.assignments.append((task, assignees))
+
+    def brute_force(self, start, end, include_completed=False):
+        """사용자별 업무일 부하 (하위 작업이 없는 작업만, 완료 작업은 선택)"""
+        calendar = get_calendar()
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        work_days = [day for day in days if calendar.is_workday(day)]
+        loads = {}
+        for user in self.users:
+            loads[user.id] = [
+                sum(
+                    1 for task, assignees in self.assignments
+                    if user in assignees and task.start_date <= day <= task.end_date
+                    and (include_completed or task.status != 'completed')
+                )
+                for day in work_days
+            ]
+        return work_days, loads
+
+    def assert_matches(self, data, start, end, capacity, include_completed=False):
+        work_days, loads = self.brute_force(start, end, include_completed)
+        self.assertEqual(data['work_days'], work_days)
+        self.assertEqual([row['user_id'] for row in data['users']], [user.id for user in self.users])
+        for row in data['users']:
+            load = loads[row['user_id']]
+            self.assertEqual(row['load'], load)
+            self.assertEqual(row['total'], sum(load))
+            self.assertEqual(row['peak'], max(load, default=0))
+            self.assertEqual(row['overallocated_days'], sum(1 for value in load if value > capacity))
+            self.assertEqual(
+                sum(span['days'] for span in row['overallocations']), row['overallocated_days']
+            )
+            for span in row['overallocations']:
+                first, last = work_days.index(span['start']), work_days.index(span['end'])
+                self.assertEqual(last - first + 1, span['days'])
+                self.assertTrue(all(value > capacity for value in load[first:last + 1]))
+                self.assertEqual(span['peak'], max(load[first:last + 1]))
+                # 구간은 초과가 끝나는 지점까지 이어집니다.
+                self.assertTrue(first == 0 or load[first - 1] <= capacity)
+                self.assertTrue(last == len(load) - 1 or load[last + 1] <= capacity)
+        self.assertEqual(data['totals']['load'], [sum(column) for column in zip(*loads.values())])
+
+    def test_matches_brute_force(self):
+        for capacity in (0, 1, 2):
+            for include_completed in (False, True):
+                with self.subTest(capacity=capacity, include_completed=include_completed):
+                    data = workload.build_workload(START, END, capacity=capacity, include_completed=include_completed)
+                    self.assert_matches(data, START, END, capacity, include_completed)
+                    self.assertTrue(data['totals']['overallocated_days'])
+
+    def test_pure_python_path_matches(self):
+        for capacity in (0, 1):
+            expected = workload.build_workload(START, END, capacity=capacity, include_completed=True)
+            with mock.patch.object(workload, 'numpy', None):
+                self.assertEqual(workload.build_workload(START, END, capacity=capacity, include_completed=True), expected)
+
+    def test_window_on_weekends_and_holidays(self):
+        # 8/15(광복절) ~ 8/17(일): 업무일이 없는 구간
+        data = workload.build_workload(date(2025, 8, 15), date(2025, 8, 17), capacity=1)
+        self.assertEqual(data['work_days'], [])
+        self.assertTrue(all(row['load'] == [] and row['peak'] == 0 for row in data['users']))
+
+        data = workload.build_workload(date(2025, 8, 18), date(2025, 8, 22), capacity=1)
+        self.assertNotIn(date(2025, 8, 20), data['work_days'])
+        self.assert_matches(data, date(2025, 8, 18), date(2025, 8, 22), 1)
+
+    def test_endpoint(self):
+        response = self.client.get('/api/workload/', {
+            'start': START.isoformat(), 'end': END.isoformat(), 'capacity': 1,
+            'users': [self.users[1].id, self.users[2].id],
+        })
+        self.assertEqual(response.status_code, 200)
+        _, loads = self.brute_force(START, END)
+        self.assertEqual(
+            [(row['user_id'], row['load']) for row in response.json()['users']],
+            [(user.id, loads[user.id]) for user in self.users[1:3]],
+        )
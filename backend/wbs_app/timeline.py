@@ -0,0 +1,96 @@
+"""
+프로젝트 타임라인 (상위 작업과 직속 하위 작업)
+
+상위 작업, 하위 작업, 구간과 겹치는 상위 작업 조회는 서로의 결과를 기다리지 않도록
+상위 작업 조건을 서브쿼리로 넘깁니다. 동기 뷰는 차례로, 비동기 뷰는 동시에 실행합니다.
+"""
+from .models import PROJECT_END, PROJECT_START, Task
+from .utils import read_concurrently
+from .workdays import get_calendar
+
+
+def in_window(tasks, start=None, end=None):
+    """[start, end] 구간과 일정이 겹치는 작업만 남깁니다."""
+    if end:
+        tasks = tasks.filter(start_date__lte=end)
+    if start:
+        tasks = tasks.filter(end_date__gte=start)
+    return tasks
+
+
+def timeline_readers(start=None, end=None, root=None):
+    """
+    타임라인에 필요한 조회 함수 (상위 작업, 상위 작업별 하위 작업, 구간과 겹치는 상위 작업 ID)
+    구간이 없으면 세 번째 조회는 None을 반환합니다.
+    """
+    parents = Task.objects.filter(pk=root.pk) if root else Task.objects.filter(parent_task__isnull=True)
+
+    def read_parents():
+        return [root] if root else list(parents)
+
+    def read_subtasks():
+        subtasks_by_parent = {}
+        for subtask in in_window(Task.objects.filter(parent_task__in=parents.values('pk')), start, end):
+            subtasks_by_parent.setdefault(subtask.parent_task_id, []).append(subtask)
+        return subtasks_by_parent
+
+    def read_visible():
+        if not (start or end):
+            return None
+        return set(in_window(parents, start, end).values_list('id', flat=True))
+
+    return read_parents, read_subtasks, read_visible
+
+
+def assemble_timeline(start, end, parent_tasks, subtasks_by_parent, visible_ids):
+    # 업무일 계산 (주말 및 휴일 제외)
+    work_days = [
+        day.strftime('%Y-%m-%d')
+        for day in get_calendar().work_days(max(PROJECT_START, start or PROJECT_START), min(PROJECT_END, end or PROJECT_END))
+    ]
+
+    # 구간이 있으면 자신이나 하위 작업이 구간과 겹치는 상위 작업만 표시
+    if visible_ids is not None:
+        visible_ids |= set(subtasks_by_parent)
+
+    timeline_data = []
+    for task in parent_tasks:
+        if visible_ids is not None and task.id not in visible_ids:
+            continue
+        timeline_data.append({
+            'id': task.id,
+            'title': task.title,
+            'color': task.color,
+            'start_date': task.start_date.strftime('%Y-%m-%d'),
+            'end_date': task.effective_end_date.strftime('%Y-%m-%d'),
+            'subtasks': [
+                {
+                    'id': subtask.id,
+                    'title': subtask.title,
+                    'start_date': subtask.start_date.strftime('%Y-%m-%d'),
+                    'end_date': subtask.end_date.strftime('%Y-%m-%d'),
+                    'status': subtask.status,
+                    'progress': subtask.progress
+                }
+                for subtask in subtasks_by_parent.get(task.id, [])
+            ]
+        })
+
+    return {
+        'project_start': PROJECT_START.strftime('%Y-%m-%d'),
+        'project_end': PROJECT_END.strftime('%Y-%m-%d'),
+        'work_days': work_days,
+        'timeline_data': timeline_data
+    }
+
+
+def build_timeline(start=None, end=None, root=None):
+    """타임라인 데이터 생성"""
+    results = [read() for read in timeline_readers(start, end, root)]
+    return assemble_timeline(start, end, *results)
+
+
+async def abuild_timeline(start=None, end=None, root=None):
+    """build_timeline()의 비동기 버전 (조회를 동시에 실행)"""
+    results = await read_concurrently(*timeline_readers(start, end, root))
+    return assemble_timeline(start, end, *results)
@@ -0,0 +1,204 @@
+"""
+작업 트리 조립기
+
+작업, 담당자, 댓글을 고정된 수의 쿼리로 한 번에 가져온 뒤
+메모리에서 O(n)으로 중첩 구조를 만듭니다.
+결과는 재귀 TaskSerializer의 출력과 동일합니다.
+
+시리얼라이저 context의 task_fields(출력 필드 집합)와 task_depth(하위 작업 단계 제한)를
+따르며, 요청되지 않은 필드에 필요한 관계는 불러오지 않습니다.
+
+build_task_tree_fragments는 같은 트리를 가지별로 캐시된 JSON 조각(cache.py)으로 만들어,
+바뀐 가지의 작업만 다시 불러와 직렬화합니다.
+"""
+from collections import defaultdict
+
+from django.db.models import Prefetch, Q
+
+from .cache import branch_versions, fragment_prefix, get_fragments, set_fragments
+from .models import Task, TaskComment
+from .renderers import RawJSON, render_json
+from .routers import replica_caught_up
+from .serializers import TaskSerializer
+
+
+def tree_queryset(queryset=None, fields=None):
+    """트리 직렬화에 필요한 관계만 미리 불러오는 쿼리셋을 반환합니다. fields가 None이면 전체 필드."""
+    if queryset is None:
+        queryset = Task.objects.all()
+
+    def wanted(*names):
+        return fields is None or not fields.isdisjoint(names)
+
+    related = [name for name, field in [('parent_task', 'parent_task_title'), ('created_by', 'created_by_name')] if wanted(field)]
+    if related:
+        queryset = queryset.select_related(*related)
+    if wanted('assigned_to', 'assigned_to_names'):
+        queryset = queryset.prefetch_related('assigned_to')
+    if wanted('comments'):
+        queryset = queryset.prefetch_related(
+            Prefetch('comments', queryset=TaskComment.objects.select_related('author'))
+        )
+    return queryset
+
+
+def build_task_tree(queryset=None, root_ids=None, context=None, parent_id=None):
+    """
+    작업들을 중첩 트리로 직렬화합니다.
+
+    queryset에는 루트 작업과 그 하위 작업 전체가 포함되어 있어야 합니다.
+    root_ids가 주어지면 해당 순서대로, 없으면 parent_id 작업의 하위 작업들
+    (기본값은 상위 작업이 없는 작업들)을 불러온 순서대로 루트로 반환합니다. 각 작업은 한 번만 직렬화되며, 단계 제한이 없으면
+    subtasks는 같은 결과 객체를 참조하도록 연결됩니다.
+    """
+    context = context or {}
+    fields = context.get('task_fields')
+    max_depth = context.get('task_depth')
+    with_subtasks = fields is None or 'subtasks' in fields
+
+    if queryset is None:
+        queryset = Task.objects.all()
+    if not with_subtasks:
+        # 하위 작업을 출력하지 않으면 루트 작업만 불러옵니다.
+        queryset = queryset.filter(pk__in=root_ids) if root_ids is not None else queryset.filter(parent_task_id=parent_id)
+    elif max_depth is not None and root_ids is None and parent_id is None:
+        queryset = queryset.filter(depth__lte=max_depth)
+    tasks = list(tree_queryset(queryset, fields))
+
+    # 상위 작업 ID -> 하위 작업 목록 (쿼리셋 정렬 순서 유지)
+    children = defaultdict(list)
+    for task in tasks:
+        children[task.parent_task_id].append(task.id)
+
+    serializer_context = dict(context, task_children=children)
+    rows = TaskSerializer(tasks, many=True, context=serializer_context).data
+    # ?fields=로 id를 빼고 요청할 수 있으므로 작업 객체의 ID로 연결합니다.
+    rows_by_id = {task.id: row for task, row in zip(tasks, rows)}
+
+    if root_ids is None:
+        root_ids = children.get(parent_id, ())
+    root_ids = [task_id for task_id in root_ids if task_id in rows_by_id]
+
+    if not with_subtasks:
+        return [rows_by_id[task_id] for task_id in root_ids]
+
+    if max_depth is None:
+        for task_id, row in rows_by_id.items():
+            row['subtasks'] = [rows_by_id[child_id] for child_id in children.get(task_id, ())]
+        return [rows_by_id[task_id] for task_id in root_ids]
+
+    # 단계 제한이 있으면 루트마다 기준 단계가 달라 복사본으로 조립합니다.
+    def nest(task_id, level):
+        row = dict(rows_by_id[task_id])
+        if level < max_depth:
+            row['subtasks'] = [nest(child_id, level + 1) for child_id in children.get(task_id, ())]
+        return row
+
+    return [nest(task_id, 0) for task_id in root_ids]
+
+
+def build_subtrees(tasks, context=None):
+    """주어진 작업들을 루트로, 그 순서대로 하위 트리를 조립합니다 (목록 페이지, 최근 작업)."""
+    subtree = Q(pk__in=[])
+    for task in tasks:
+        subtree |= Q(path__startswith=task.path)
+    return build_task_tree(Task.objects.filter(subtree), root_ids=[task.id for task in tasks], context=context)
+
+
+def _join(fragments):
+    return RawJSON(b'[' + b','.join(fragments) + b']')
+
+
+def _task_children(queryset):
+    """상위 작업 ID -> 하위 작업 ID 목록 (쿼리셋 정렬 순서, 쿼리 1회)"""
+    children = defaultdict(list)
+    for task_id, parent_id in queryset.values_list('id', 'parent_task_id'):
+        children[parent_id].append(task_id)
+    return children
+
+
+def build_task_tree_fragments(queryset=None, context=None):
+    """
+    전체 작업 트리를 build_task_tree 결과를 렌더링한 것과 같은 JSON 조각(RawJSON)으로 만듭니다.
+    단계 제한 없이 subtasks를 포함하는 경우에만 사용합니다.
+
+    루트부터 단계별로 가지 버전과 캐시된 조각을 확인해, 조각이 없는 작업의 하위 작업만 확인합니다.
+    조각이 없는 작업만 한 번에 불러와 직렬화하고, 아래 단계부터 하위 작업 조각을 이어 붙여
+    렌더링한 뒤 읽어 둔 가지 버전 키로 저장합니다 (캐시가 모두 적중하면 쿼리 1회).
+    """
+    context = context or {}
+    fields = context.get('task_fields')
+    if queryset is None:
+        queryset = Task.objects.all()
+
+    prefix = fragment_prefix(fields)
+    children = _task_children(queryset)
+    versions, fragments = {}, {}
+    level = children[None]
+    while level:
+        level_versions = branch_versions(level)
+        versions.update(level_versions)
+        fragments.update(get_fragments(prefix, level_versions))
+        level = [child_id for task_id in level if task_id not in fragments for child_id in children[task_id]]
+
+    if any(task_id not in fragments for task_id in children[None]):
+        # 구조와 작업 데이터는 가지 버전을 읽은 뒤에 다시 읽어, 그 사이의 변경이 이전 버전 키로만 저장되게 합니다.
+        # 그 사이 생긴 작업은 버전을 읽지 않았으므로 렌더링만 하고 저장하지 않습니다.
+        children = _task_children(queryset)
+        missed = [task_id for task_id in children[None] if task_id not in fragments]
+        for task_id in missed:
+            missed.extend(child_id for child_id in children[task_id] if child_id not in fragments)
+
+        total = sum(len(task_ids) for task_ids in children.values())
+        tasks = list(tree_queryset(queryset if len(missed) == total else queryset.filter(pk__in=missed), fields))
+        data = TaskSerializer(tasks, many=True, context=dict(context, task_children=children)).data
+        rows = {task.id: row for task, row in zip(tasks, data)}
+
+        rendered = {}
+        for task_id in reversed(missed):
+            row = rows.get(task_id)
+            if row is None:
+                continue  # 그 사이 삭제된 작업
+            row['subtasks'] = _join(fragments[child_id] for child_id in children[task_id] if child_id in fragments)
+            fragments[task_id] = render_json(row)
+            if task_id in versions:
+                rendered[task_id] = fragments[task_id]
+        if replica_caught_up(context.get('data_version')):
+            set_fragments(prefix, versions, rendered)
+
+    return _join(fragments[task_id] for task_id in children[None] if task_id in fragments)
+
+
+def windowed_tasks(queryset=None, start=None, end=None, root=None):
+    """
+    [start, end] 구간과 일정이 겹치는 작업과, 맥락을 위한 그 상위 작업들을 고릅니다.
+    root가 주어지면 root의 하위 트리로 한정합니다.
+
+    겹치는 작업은 (start_date, end_date, path) 복합 인덱스만으로 찾고,
+    상위 작업 ID는 경로에서 바로 얻습니다. 겹치는 작업 자체는 서브쿼리로 다시 고르므로
+    ID 목록에는 구간 밖의 상위 작업만 들어가 대량 조회에서도 쿼리 변수 수가 작게 유지됩니다.
+    반환: (작업 쿼리셋, build_task_tree에 넘길 루트 ID 목록 또는 None)
+    """
+    if queryset is None:
+        queryset = Task.objects.all()
+    if start is None and end is None and root is None:
+        return queryset, None
+
+    matches = queryset
+    if root is not None:
+        matches = matches.filter(path__startswith=root.path)
+    if end is not None:
+        matches = matches.filter(start_date__lte=end)
+    if start is not None:
+        matches = matches.filter(end_date__gte=start)
+
+    top = root.depth if root is not None else 0
+    match_ids, ancestor_ids = set(), set()
+    for path in matches.order_by().values_list('path', flat=True):
+        *ancestors, task_id = path.split('/')[top:-1]
+        match_ids.add(int(task_id))
+        ancestor_ids.update(int(ancestor_id) for ancestor_id in ancestors)
+
+    root_ids = [root.id] if root is not None else None
+    in_window = Q(pk__in=matches.order_by().values('pk')) | Q(pk__in=ancestor_ids - match_ids)
+    return queryset.filter(in_window), root_ids
@@ -1,11 +1,12 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, events, views
 
 router = DefaultRouter()
 router.register(r'users', views.UserViewSet)
 router.register(r'tasks', views.TaskViewSet)
 router.register(r'comments', views.TaskCommentViewSet)
+router.register(r'dependencies', views.TaskDependencyViewSet)
 
 urlpatterns = [
     # 인증
@@ -19,6 +20,18 @@ urlpatterns = [
     # 프로젝트 타임라인
     path('timeline/', views.ProjectTimelineView.as_view(), name='timeline'),
     
+    # 담당자별 작업 부하
+    path('workload/', views.WorkloadView.as_view(), name='workload'),
+    
+    # 읽기 전용 비동기 API (ASGI)
+    path('async/tasks/', async_views.task_list, name='async_task_list'),
+    path('async/tasks/gantt_chart/', async_views.gantt_chart, name='async_gantt_chart'),
+    path('async/timeline/', async_views.timeline, name='async_timeline'),
+    path('async/dashboard/', async_views.dashboard, name='async_dashboard'),
+    
+    # 실시간 변경 알림 (SSE)
+    path('events/', events.task_events, name='task_events'),
+    
     # 라우터 URL들
     path('', include(router.urls)),
 ]
@@ -1,3 +1,11 @@
+import asyncio
+from calendar import timegm
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections, connections
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from rest_framework.authentication import SessionAuthentication
 
 class CsrfExemptSessionAuthentication(SessionAuthentication):
@@ -7,3 +15,89 @@ class CsrfExemptSessionAuthentication(SessionAuthentication):
     """
     def enforce_csrf(self, request):
         return  # CSRF 검증을 건너뜁니다.
+
+
+def version_validators(data_version):
+    """데이터 버전으로 만든 (ETag, Last-Modified 타임스탬프)"""
+    return quote_etag(f'wbs-{data_version.version}'), timegm(data_version.updated_at.utctimetuple())
+
+
+def add_version_headers(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    # 브라우저가 매번 재검증하도록 합니다.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def data_version_condition(view_method):
+    """
+    데이터 버전 기반 조건부 GET 데코레이터입니다.
+    응답에 ETag/Last-Modified를 붙이고, 클라이언트의 If-None-Match가
+    현재 버전과 같으면 시리얼라이저를 거치지 않고 304를 반환합니다.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        from .models import DataVersion
+        
+        data_version = DataVersion.current()
+        # 뷰에서 버전별 캐시 키로 다시 쓸 수 있도록 보관합니다.
+        request.data_version = data_version.version
+        etag, last_modified = version_validators(data_version)
+        
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        return add_version_headers(response, etag, last_modified)
+    return wrapper
+
+
+def async_data_version_condition(view):
+    """data_version_condition의 비동기 함수 뷰용 버전입니다."""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        from .models import DataVersion
+        
+        data_version = await DataVersion.acurrent()
+        request.data_version = data_version.version
+        etag, last_modified = version_validators(data_version)
+        
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = await view(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        return add_version_headers(response, etag, last_modified)
+    return wrapper
+
+
+def _in_transaction():
+    return any(connection.in_atomic_block for connection in connections.all(initialized_only=True))
+
+
+def _read_on_own_connection(reader):
+    """작업 스레드의 DB 연결로 reader()를 실행합니다. 쿼리는 현재 요청의 통계에 더합니다."""
+    from .middleware import watch_queries
+    
+    try:
+        with watch_queries():
+            return reader()
+    finally:
+        # 요청 경계와 같은 규칙(CONN_MAX_AGE)으로 작업 스레드의 연결을 정리합니다.
+        close_old_connections()
+
+
+async def read_concurrently(*readers):
+    """
+    서로 독립적인 조회 함수(인자 없는 동기 함수)들을 동시에 실행하고 결과를 순서대로 반환합니다.
+    각 조회는 작업 스레드에서 자기 DB 연결로 실행되므로 DB 대기가 겹칩니다.
+    요청이 트랜잭션 안에 있으면 다른 연결에서는 커밋 전 변경이 보이지 않으므로
+    요청의 연결에서 차례로 실행합니다.
+    """
+    if await sync_to_async(_in_transaction)():
+        return [await sync_to_async(reader)() for reader in readers]
+    return await asyncio.gather(*(
+        sync_to_async(_read_on_own_connection, thread_sensitive=False)(reader) for reader in readers
+    ))
@@ -7,15 +7,32 @@ from django.shortcuts import get_object_or_404
 from django.db.models import Q
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import ensure_csrf_cookie
-from datetime import date, timedelta
 import json
 
-from .models import User, Task, TaskComment
+from .models import User, Task, TaskComment, TaskDependency
 from .serializers import (
     UserSerializer, UserCreateSerializer, TaskSerializer, 
     TaskCreateSerializer, TaskUpdateSerializer, TaskCommentSerializer,
-    GanttChartSerializer
+    GanttChartSerializer, TaskSyncSerializer, TaskCommentSyncSerializer,
+    TaskBulkOperationSerializer, TaskWindowSerializer, TaskImportSerializer,
+    TaskDependencySerializer, WorkloadQuerySerializer, LevelingSerializer
 )
+from .bulk import apply_operations
+from .cache import get_dashboard
+from .dashboard import build_dashboard
+from .export import export_response
+from .importer import import_file
+from .leveling import BeyondProjectEnd, StalePlan, apply_leveling, plan_leveling
+from .pagination import (
+    CommentKeysetPagination, TaskKeysetPagination, UserKeysetPagination,
+    streaming_list_response, wants_stream
+)
+from .schedule import DependencyCycle, get_project_schedule
+from .sync import InvalidSyncToken, SyncTokenExpired, collect_changes, current_token, decode_token, encode_token
+from .timeline import build_timeline
+from .tree import build_subtrees, build_task_tree
+from .utils import data_version_condition
+from .workload import build_workload
 
 
 class IsAdminUser(permissions.BasePermission):
@@ -77,6 +94,7 @@ class UserViewSet(viewsets.ModelViewSet):
     """사용자 관리 뷰셋"""
     queryset = User.objects.all()
     serializer_class = UserSerializer
+    pagination_class = UserKeysetPagination
     
     def get_permissions(self):
         """
@@ -97,7 +115,13 @@ class UserViewSet(viewsets.ModelViewSet):
     
     def list(self, request):
         """사용자 목록 조회"""
-        users = User.objects.all().order_by('username')
+        users = User.objects.all().order_by('username', 'id')
+        if wants_stream(request):
+            return streaming_list_response(users, UserSerializer, self.get_serializer_context())
+        
+        page = self.paginate_queryset(users)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
         serializer = self.get_serializer(users, many=True)
         return Response(serializer.data)
     
@@ -115,6 +139,7 @@ class TaskViewSet(viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TaskKeysetPagination
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -123,37 +148,226 @@ class TaskViewSet(viewsets.ModelViewSet):
             return TaskUpdateSerializer
         return TaskSerializer
     
+    def get_serializer_context(self):
+        """?fields= / ?expand= / ?depth= 옵션을 context에 담습니다."""
+        context = super().get_serializer_context()
+        if self.request is not None and self.request.method == 'GET':
+            context.update(TaskSerializer.field_options(self.request.query_params))
+        return context
+    
     def perform_create(self, serializer):
         """작업 생성 시 생성자 설정"""
         serializer.save(created_by=self.request.user)
     
+    @data_version_condition
     def list(self, request):
-        """작업 목록 조회"""
-        tasks = Task.objects.all().order_by('start_date', 'title')
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        """
+        작업 목록 조회
+        - ?page_size=N / ?cursor=... : 키셋 페이지네이션 (각 작업의 하위 작업 트리 포함)
+        - ?stream=1 : 하위 작업/댓글 없이 평면 목록을 스트리밍
+        """
+        # 목록보다 먼저 읽은 데이터 버전이 토큰이어야 조회 중 발생한 변경을 놓치지 않습니다.
+        sync_token = encode_token(request.data_version)
+        tasks = Task.objects.all().order_by('start_date', 'title', 'id')
+        
+        if wants_stream(request):
+            tasks = tasks.select_related('parent_task', 'created_by').prefetch_related('assigned_to')
+            response = streaming_list_response(tasks, TaskSyncSerializer, self.get_serializer_context())
+            response['X-Sync-Token'] = sync_token
+            return response
+        
+        page = self.paginate_queryset(tasks)
+        if page is not None:
+            data = build_subtrees(page, context=self.get_serializer_context())
+            response = self.get_paginated_response(data)
+            response['X-Sync-Token'] = sync_token
+            return response
+        
+        task_ids = list(tasks.values_list('id', flat=True))
+        data = build_task_tree(tasks, root_ids=task_ids, context=self.get_serializer_context())
+        return Response(data, headers={'X-Sync-Token': sync_token})
+    
+    @data_version_condition
+    def retrieve(self, request, pk=None):
+        """작업 상세 조회 (하위 작업 트리 포함)"""
+        task = self.get_object()
+        data = build_task_tree(task.get_descendants(include_self=True), root_ids=[task.id], context=self.get_serializer_context())
+        return Response(data[0])
     
     @action(detail=False, methods=['get'])
+    @data_version_condition
     def gantt_chart(self, request):
-        """간트 차트 데이터 조회"""
-        tasks = Task.objects.all()
-        serializer = GanttChartSerializer(tasks, many=False)
+        """
+        간트 차트 데이터 조회
+        ?start=YYYY-MM-DD&end=YYYY-MM-DD&root=<작업 ID>로 보이는 구간과 하위 트리만 조회할 수 있습니다.
+        """
+        window = TaskWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        context = dict(
+            self.get_serializer_context(), task_window=window.validated_data, data_version=request.data_version
+        )
+        serializer = GanttChartSerializer(Task.objects.all(), many=False, context=context)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @data_version_condition
+    def critical_path(self, request):
+        """
+        선후행 관계 기준 일정 계산 결과 (가장 빠른/늦은 시작·종료, 총 여유, 주공정)
+        관계에 순환이 있으면 순환을 이루는 작업 ID와 함께 409를 반환합니다.
+        """
+        schedule = get_project_schedule(request.data_version)
+        if schedule['cycle']:
+            return Response(
+                {'error': '선후행 관계에 순환이 있습니다.', 'cycle': schedule['cycle']},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(schedule)
+    
+    @action(detail=False, methods=['get'], url_path=r'export/(?P<file_format>csv|xlsx|ics)')
+    @data_version_condition
+    def export(self, request, file_format=None):
+        """
+        WBS 내보내기 (CSV, XLSX, iCalendar)
+        간트 차트와 같은 ?start=&end=&root= 조건을 따르며, 파일을 조각조각 스트리밍합니다.
+        """
+        window = TaskWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        return export_response(file_format, host=request.get_host(), **window.validated_data)
+    
+    @action(detail=False, methods=['get'])
+    @data_version_condition
+    def leveling(self, request):
+        """
+        자원 평준화 미리 보기: 담당자별 하루 작업 수(?capacity=)를 넘지 않도록 옮길 작업과 새 일정을 반환합니다.
+        ?root=<작업 ID>로 옮길 작업을 하위 트리로 한정할 수 있습니다. 저장하지 않습니다.
+        """
+        options = LevelingSerializer(data=request.query_params)
+        options.is_valid(raise_exception=True)
+        try:
+            plan = plan_leveling(
+                options.validated_data.get('capacity'), options.validated_data.get('root'), request.data_version
+            )
+        except DependencyCycle as error:
+            return Response(
+                {'error': '선후행 관계에 순환이 있습니다.', 'cycle': error.task_ids},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(plan)
+    
+    @action(detail=False, methods=['post'], url_path='leveling/apply')
+    def apply_leveling(self, request):
+        """
+        자원 평준화 적용: 미리 보기와 같은 조건으로 다시 계산해 일괄 저장합니다.
+        version을 보내면 미리 본 뒤 데이터가 바뀐 경우 저장하지 않고 409를 반환합니다.
+        프로젝트 종료일을 넘기는 작업이 생기면 allow_beyond_project_end=true가 아닌 한 저장하지 않고 409를 반환합니다.
+        """
+        options = LevelingSerializer(data=request.data)
+        options.is_valid(raise_exception=True)
+        try:
+            plan = apply_leveling(
+                options.validated_data.get('capacity'), options.validated_data.get('root'),
+                options.validated_data.get('version'), options.validated_data['allow_beyond_project_end']
+            )
+        except StalePlan as error:
+            return Response(
+                {'error': '미리 본 뒤 데이터가 변경되었습니다. 다시 미리 보기 하세요.', 'version': error.version},
+                status=status.HTTP_409_CONFLICT
+            )
+        except BeyondProjectEnd as error:
+            return Response(
+                {'error': '프로젝트 종료일을 넘기는 작업이 있어 적용하지 않았습니다.', 'tasks': error.task_ids},
+                status=status.HTTP_409_CONFLICT
+            )
+        except DependencyCycle as error:
+            return Response(
+                {'error': '선후행 관계에 순환이 있습니다.', 'cycle': error.task_ids},
+                status=status.HTTP_409_CONFLICT
+            )
+        return Response(plan)
+    
+    @action(detail=False, methods=['get'])
+    @data_version_condition
     def parent_tasks(self, request):
         """상위 작업만 조회"""
-        parent_tasks = Task.objects.filter(parent_task__isnull=True)
-        serializer = self.get_serializer(parent_tasks, many=True)
-        return Response(serializer.data)
+        data = build_task_tree(Task.objects.all(), context=self.get_serializer_context())
+        return Response(data)
     
     @action(detail=True, methods=['get'])
+    @data_version_condition
     def subtasks(self, request, pk=None):
         """하위 작업 조회"""
         task = self.get_object()
-        subtasks = task.subtasks.all()
-        serializer = self.get_serializer(subtasks, many=True)
-        return Response(serializer.data)
+        # 루트(직속 하위 작업)는 불러온 하위 작업들에서 골라 하위 작업을 한 번만 조회합니다.
+        data = build_task_tree(task.get_descendants(), parent_id=task.id, context=self.get_serializer_context())
+        return Response(data)
+    
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        증분 동기화: since 토큰 이후에 변경된 작업/댓글과 삭제된 ID를 반환합니다.
+        since가 없으면 현재 토큰만 반환합니다.
+        변경 로그가 정리된 오래된 토큰이면 410을 반환하며, 클라이언트는 목록을 다시 받아야 합니다.
+        """
+        since = request.query_params.get('since')
+        if not since:
+            return Response({'tasks': [], 'comments': [], 'deleted': {'tasks': [], 'comments': []},
+                             'next': current_token(), 'has_more': False})
+        try:
+            since_version = decode_token(since)
+        except InvalidSyncToken:
+            return Response({'error': '잘못된 동기화 토큰입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            tasks, comments, deleted, last_version, has_more = collect_changes(since_version)
+        except SyncTokenExpired:
+            return Response(
+                {'error': '동기화 토큰이 너무 오래되었습니다. 전체 목록을 다시 받아야 합니다.', 'full_resync': True},
+                status=status.HTTP_410_GONE
+            )
+        
+        return Response({
+            'tasks': TaskSyncSerializer(tasks, many=True, context=self.get_serializer_context()).data,
+            'comments': TaskCommentSyncSerializer(comments, many=True).data,
+            'deleted': {
+                'tasks': sorted(deleted['task']),
+                'comments': sorted(deleted['comment']),
+            },
+            'next': encode_token(last_version),
+            'has_more': has_more,
+        })
+    
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """
+        작업 일괄 생성/수정/삭제
+        {"operations": [{"op": "create", "data": {...}}, {"op": "update", "id": 1, "data": {...}}, {"op": "delete", "id": 2}]}
+        """
+        if not isinstance(request.data, dict):
+            return Response(
+                {'error': '요청 본문은 {"operations": [...]} 형식의 객체여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = TaskBulkOperationSerializer(data=request.data.get('operations'), many=True)
+        serializer.is_valid(raise_exception=True)
+        result = apply_operations(serializer.validated_data, request.user)
+        return Response(result)
+    
+    @action(detail=False, methods=['post'], url_path='import')
+    def import_tasks(self, request):
+        """
+        CSV/MS Project XML 파일로 작업 일괄 가져오기 (multipart: file, format=csv|xml, parent_task=<작업 ID>, encoding)
+        CSV 인코딩을 지정하지 않으면 UTF-8로 읽히는지 보고 아니면 CP949로 읽습니다.
+        모든 행을 먼저 검증하고, 하나라도 실패하면 행 번호별 오류와 함께 아무것도 저장하지 않습니다.
+        """
+        serializer = TaskImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = import_file(
+            serializer.validated_data['file'], serializer.validated_data['format'], request.user,
+            parent_task=serializer.validated_data.get('parent_task'),
+            encoding=serializer.validated_data.get('encoding')
+        )
+        return Response(result, status=status.HTTP_201_CREATED)
     
     @action(detail=True, methods=['post'])
     def add_comment(self, request, pk=None):
@@ -171,6 +385,7 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
     queryset = TaskComment.objects.all()
     serializer_class = TaskCommentSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CommentKeysetPagination
     
     def perform_create(self, serializer):
         """댓글 생성 시 작성자 설정"""
@@ -180,101 +395,78 @@ class TaskCommentViewSet(viewsets.ModelViewSet):
         """특정 작업의 댓글 조회"""
         task_id = request.query_params.get('task_id')
         if task_id:
-            comments = TaskComment.objects.filter(task_id=task_id).order_by('-created_at')
+            comments = TaskComment.objects.filter(task_id=task_id).order_by('-created_at', 'id')
         else:
-            comments = TaskComment.objects.all().order_by('-created_at')
+            comments = TaskComment.objects.all().order_by('-created_at', 'id')
+        comments = comments.select_related('author')
+        
+        if wants_stream(request):
+            return streaming_list_response(comments, TaskCommentSerializer, self.get_serializer_context())
         
+        page = self.paginate_queryset(comments)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
         serializer = self.get_serializer(comments, many=True)
         return Response(serializer.data)
 
 
+class TaskDependencyViewSet(viewsets.ModelViewSet):
+    """작업 선후행 관계 뷰셋"""
+    queryset = TaskDependency.objects.all()
+    serializer_class = TaskDependencySerializer
+    permission_classes = [permissions.IsAuthenticated]
+    
+    def get_queryset(self):
+        """?task=<작업 ID>로 해당 작업이 선행/후행인 관계만 조회할 수 있습니다."""
+        dependencies = TaskDependency.objects.order_by('id')
+        task_id = self.request.query_params.get('task')
+        if task_id:
+            dependencies = dependencies.filter(Q(predecessor_id=task_id) | Q(successor_id=task_id))
+        return dependencies
+
+
 class DashboardView(APIView):
     """대시보드 데이터 뷰"""
     permission_classes = [permissions.IsAuthenticated]
     
+    @data_version_condition
     def get(self, request):
         """대시보드 통계 데이터 조회"""
-        total_tasks = Task.objects.count()
-        completed_tasks = Task.objects.filter(status='completed').count()
-        in_progress_tasks = Task.objects.filter(status='in_progress').count()
-        not_started_tasks = Task.objects.filter(status='not_started').count()
-        
-        # 프로젝트 진행률 계산
-        project_progress = 0
-        if total_tasks > 0:
-            project_progress = (completed_tasks / total_tasks) * 100
-        
-        # 사용자별 작업 수
-        user_task_counts = []
-        for user in User.objects.all():
-            task_count = Task.objects.filter(assigned_to=user).count()
-            user_task_counts.append({
-                'user_id': user.id,
-                'username': user.username,
-                'name': user.name,
-                'task_count': task_count
-            })
-        
-        # 최근 작업
-        recent_tasks = Task.objects.order_by('-created_at')[:5]
-        recent_tasks_data = TaskSerializer(recent_tasks, many=True).data
-        
-        return Response({
-            'total_tasks': total_tasks,
-            'completed_tasks': completed_tasks,
-            'in_progress_tasks': in_progress_tasks,
-            'not_started_tasks': not_started_tasks,
-            'project_progress': round(project_progress, 1),
-            'user_task_counts': user_task_counts,
-            'recent_tasks': recent_tasks_data
-        })
+        return Response(get_dashboard(build_dashboard, request.data_version))
 
 
 class ProjectTimelineView(APIView):
     """프로젝트 타임라인 뷰"""
     permission_classes = [permissions.IsAuthenticated]
     
+    @data_version_condition
     def get(self, request):
-        """프로젝트 타임라인 데이터 조회"""
-        # 프로젝트 기간 설정
-        project_start = date(2025, 7, 23)
-        project_end = date(2025, 9, 15)
-        
-        # 업무일 계산 (주말 제외)
-        work_days = []
-        current_date = project_start
-        while current_date <= project_end:
-            if current_date.weekday() < 5:  # 월요일(0) ~ 금요일(4)
-                work_days.append(current_date.strftime('%Y-%m-%d'))
-            current_date += timedelta(days=1)
-        
-        # 상위 작업별 타임라인
-        parent_tasks = Task.objects.filter(parent_task__isnull=True)
-        timeline_data = []
-        
-        for task in parent_tasks:
-            timeline_data.append({
-                'id': task.id,
-                'title': task.title,
-                'color': task.color,
-                'start_date': task.start_date.strftime('%Y-%m-%d'),
-                'end_date': task.effective_end_date.strftime('%Y-%m-%d'),
-                'subtasks': [
-                    {
-                        'id': subtask.id,
-                        'title': subtask.title,
-                        'start_date': subtask.start_date.strftime('%Y-%m-%d'),
-                        'end_date': subtask.end_date.strftime('%Y-%m-%d'),
-                        'status': subtask.status,
-                        'progress': subtask.progress
-                    }
-                    for subtask in task.subtasks.all()
-                ]
-            })
-        
-        return Response({
-            'project_start': project_start.strftime('%Y-%m-%d'),
-            'project_end': project_end.strftime('%Y-%m-%d'),
-            'work_days': work_days,
-            'timeline_data': timeline_data
-        })
+        """
+        프로젝트 타임라인 데이터 조회
+        ?start=YYYY-MM-DD&end=YYYY-MM-DD로 구간과 겹치는 작업만,
+        ?root=<작업 ID>로 해당 작업과 그 하위 작업만 조회할 수 있습니다.
+        """
+        window = TaskWindowSerializer(data=request.query_params)
+        window.is_valid(raise_exception=True)
+        return Response(build_timeline(**window.validated_data))
+
+
+class WorkloadView(APIView):
+    """담당자별 작업 부하 뷰"""
+    permission_classes = [permissions.IsAuthenticated]
+    
+    @data_version_condition
+    def get(self, request):
+        """
+        담당자 × 업무일 부하 행렬, 초과 할당 구간, 합계 조회
+        ?start=&end= 구간(기본값: 프로젝트 기간), ?users=1&users=2 대상 사용자,
+        ?capacity= 하루 최대 작업 수(기본값: WBS_WORKLOAD_CAPACITY),
+        ?include_completed=true 완료된 작업 포함
+        """
+        query = WorkloadQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        options = query.validated_data
+        return Response(build_workload(
+            options['start'], options['end'], user_ids=options.get('users'),
+            capacity=options.get('capacity'), include_completed=options['include_completed']
+        ))
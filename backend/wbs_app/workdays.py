@@ -0,0 +1,145 @@
+"""
+업무일 계산 모듈
+
+주말(토/일)과 휴일표를 제외한 업무일 수를 반복문 없이 계산합니다.
+- 주말 제외 업무일 수는 주 단위 닫힌 식으로 O(1)에 계산합니다.
+- 휴일표는 달력 생성 시 일자별 비트맵과 누적합 배열로 미리 컴파일되어
+  구간 내 휴일 수도 O(1)에 구합니다.
+- 업무일 번호(workday_index/workday_at)로 날짜와 업무일 단위 정수를 오가며
+  일정 계산(schedule.py)을 정수 연산으로 처리합니다.
+
+휴일표는 settings의 WBS_HOLIDAY_SETS(내장 휴일표 이름 목록)와
+WBS_HOLIDAYS(팀 휴무일 'YYYY-MM-DD' 목록)로 설정합니다.
+"""
+from array import array
+from datetime import date, timedelta
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+# 대한민국 공휴일 (대체공휴일 포함)
+KR_HOLIDAYS = [
+    # 2025년
+    '2025-01-01', '2025-01-28', '2025-01-29', '2025-01-30', '2025-03-03',
+    '2025-05-05', '2025-05-06', '2025-06-03', '2025-06-06', '2025-08-15',
+    '2025-10-03', '2025-10-06', '2025-10-07', '2025-10-08', '2025-10-09',
+    '2025-12-25',
+    # 2026년
+    '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02',
+    '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17', '2026-09-24',
+    '2026-09-25', '2026-10-05', '2026-10-09', '2026-12-25',
+]
+
+HOLIDAY_SETS = {
+    'KR': KR_HOLIDAYS,
+}
+
+# _PARTIAL_WEEK[첫 요일][남은 일수] = 남은 일수 중 평일 수
+_PARTIAL_WEEK = [
+    [sum(1 for offset in range(rest) if (first + offset) % 7 < 5) for rest in range(7)]
+    for first in range(7)
+]
+
+
+def count_weekdays(start_date, end_date):
+    """start_date ~ end_date(포함) 사이의 평일 수 (닫힌 식)"""
+    days = (end_date - start_date).days + 1
+    if days <= 0:
+        return 0
+    weeks, rest = divmod(days, 7)
+    return weeks * 5 + _PARTIAL_WEEK[start_date.weekday()][rest]
+
+
+class WorkCalendar:
+    """휴일표가 컴파일된 업무일 달력"""
+
+    def __init__(self, holidays=()):
+        holiday_dates = sorted({
+            date.fromisoformat(day) if isinstance(day, str) else day
+            for day in holidays
+        })
+        # 주말과 겹치는 휴일은 이미 제외되므로 평일 휴일만 남깁니다.
+        weekday_holidays = [day for day in holiday_dates if day.weekday() < 5]
+        self.holidays = frozenset(weekday_holidays)
+
+        if weekday_holidays:
+            self._base = weekday_holidays[0].toordinal()
+            span = weekday_holidays[-1].toordinal() - self._base + 1
+        else:
+            self._base = 0
+            span = 0
+
+        # 일자별 휴일 비트맵과 누적 휴일 수 (_prefix[i] = base ~ base+i-1 사이 휴일 수)
+        self._bitmap = bytearray(span)
+        for day in weekday_holidays:
+            self._bitmap[day.toordinal() - self._base] = 1
+        self._prefix = array('l', [0]) * (span + 1)
+        for i in range(span):
+            self._prefix[i + 1] = self._prefix[i] + self._bitmap[i]
+
+    def count_holidays(self, start_date, end_date):
+        """구간 내 평일 휴일 수"""
+        span = len(self._bitmap)
+        lo = max(start_date.toordinal() - self._base, 0)
+        hi = min(end_date.toordinal() - self._base, span - 1)
+        if lo > hi:
+            return 0
+        return self._prefix[hi + 1] - self._prefix[lo]
+
+    def is_workday(self, day):
+        """업무일 여부"""
+        if day.weekday() >= 5:
+            return False
+        offset = day.toordinal() - self._base
+        return not (0 <= offset < len(self._bitmap) and self._bitmap[offset])
+
+    def count_workdays(self, start_date, end_date):
+        """start_date ~ end_date(포함) 사이의 업무일 수"""
+        if end_date < start_date:
+            return 0
+        return count_weekdays(start_date, end_date) - self.count_holidays(start_date, end_date)
+
+    def workday_index(self, day):
+        """
+        date.min(월요일)부터 day 직전까지의 업무일 수 (업무일 번호)
+        주말/휴일은 다음 업무일과 같은 번호가 됩니다.
+        """
+        return self.count_workdays(date.min, day) - self.is_workday(day)
+
+    def workday_at(self, index):
+        """index번째 업무일 (workday_index의 역함수)"""
+        # 평일 번호 → 날짜는 닫힌 식이고, 그 날짜까지의 휴일 수만큼 평일 번호를 밀어
+        # 더 이상 바뀌지 않을 때까지 반복합니다 (반복 횟수 ≤ 연속 휴일 묶음 수).
+        weekday = index
+        while True:
+            weeks, rest = divmod(weekday, 5)
+            day = date.fromordinal(1 + weeks * 7 + rest)
+            shifted = index + self.count_holidays(date.min, day)
+            if shifted == weekday:
+                return day
+            weekday = shifted
+
+    def work_days(self, start_date, end_date):
+        """start_date ~ end_date(포함) 사이의 업무일 목록"""
+        days = (end_date - start_date).days + 1
+        all_days = (start_date + timedelta(days=offset) for offset in range(max(days, 0)))
+        return [day for day in all_days if self.is_workday(day)]
+
+
+@lru_cache(maxsize=None)
+def get_calendar():
+    """설정된 휴일표로 컴파일된 달력을 반환합니다."""
+    holidays = list(getattr(settings, 'WBS_HOLIDAYS', []))
+    for name in getattr(settings, 'WBS_HOLIDAY_SETS', []):
+        holidays.extend(HOLIDAY_SETS[name])
+    return WorkCalendar(holidays)
+
+
+@receiver(setting_changed)
+def reset_calendar(setting, **kwargs):
+    """휴일 설정이 바뀌면 달력을 다시 컴파일합니다."""
+    if setting in ('WBS_HOLIDAYS', 'WBS_HOLIDAY_SETS'):
+        get_calendar.cache_clear()
@@ -0,0 +1,170 @@
+"""
+담당자별 작업 부하 (사용자 × 업무일 행렬)
+
+담당 작업의 일정 구간을 차분 배열에 시작 +1, 끝 -1로 찍은 뒤
+업무일 축으로 누적합해 하루 단위 부하를 구합니다 (구간 길이와 무관하게 작업당 O(1)).
+- 하위 작업이 없는 작업만 셉니다 (상위 작업 기간은 하위 작업과 겹칩니다).
+- 작업 하나는 담당자마다 업무일당 1만큼의 부하입니다.
+- 부하가 capacity를 넘는 연속 업무일을 초과 할당 구간으로 보고합니다.
+
+NumPy가 있으면 행렬 전체를 벡터 연산으로 계산하고,
+없으면 같은 결과를 순수 파이썬 차분 배열로 계산합니다.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+
+from .models import Task, User
+from .workdays import get_calendar
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def assignment_intervals(start, end, include_completed=False):
+    """
+    [start, end]와 겹치는 담당 작업의 (사용자 ID, 시작일, 종료일) 목록 (쿼리 1회)
+    """
+    Assignee = Task.assigned_to.through
+    assignments = Assignee.objects.filter(
+        task__subtask_count=0, task__start_date__lte=end, task__end_date__gte=start
+    )
+    if not include_completed:
+        assignments = assignments.exclude(task__status='completed')
+    return assignments.order_by().values_list('user_id', 'task__start_date', 'task__end_date')
+
+
+def _paint_numpy(rows, first, last, user_count, day_count, capacity):
+    """
+    NumPy 차분 배열로 부하 행렬을 만들고 사용자별 합계/최대/초과 일수와 초과 구간을 구합니다.
+    반환: (부하 행렬 목록, 사용자별 합계/최대/초과 일수, 일자별 합계, [(사용자 순번, 시작 열, 끝 열(배타))])
+    """
+    width = day_count + 1
+    rows = numpy.asarray(rows, dtype=numpy.int64)
+    first = numpy.asarray(first, dtype=numpy.int64)
+    last = numpy.asarray(last, dtype=numpy.int64)
+    # 사용자별 차분 행을 이어 붙인 1차원 배열에 시작 +1, 끝 -1을 한 번에 더합니다.
+    size = user_count * width
+    diff = (
+        numpy.bincount(rows * width + first, minlength=size)
+        - numpy.bincount(rows * width + last, minlength=size)
+    ).reshape(user_count, width)
+    load = numpy.cumsum(diff[:, :-1], axis=1)
+
+    over = load > capacity
+    # 초과 여부가 바뀌는 지점: +1 = 구간 시작, -1 = 구간 끝 (행 우선 순서라 시작/끝이 짝을 이룹니다)
+    edges = numpy.diff(numpy.pad(over.astype(numpy.int8), ((0, 0), (1, 1))), axis=1)
+    span_users, span_starts = numpy.nonzero(edges == 1)
+    _, span_ends = numpy.nonzero(edges == -1)
+    spans = list(zip(span_users.tolist(), span_starts.tolist(), span_ends.tolist()))
+
+    peaks = load.max(axis=1) if day_count else numpy.zeros(user_count, dtype=numpy.int64)
+    return (
+        load.tolist(), load.sum(axis=1).tolist(), peaks.tolist(), over.sum(axis=1).tolist(),
+        load.sum(axis=0).tolist(), spans,
+    )
+
+
+def _paint_python(rows, first, last, user_count, day_count, capacity):
+    """_paint_numpy와 같은 결과를 순수 파이썬 차분 배열로 계산합니다."""
+    diffs = [[0] * (day_count + 1) for _ in range(user_count)]
+    for row, start, end in zip(rows, first, last):
+        diffs[row][start] += 1
+        diffs[row][end] -= 1
+
+    matrix, totals, peaks, over_days, spans = [], [], [], [], []
+    for index, diff in enumerate(diffs):
+        load, running, span_start = [], 0, None
+        for column in range(day_count):
+            running += diff[column]
+            load.append(running)
+            if running > capacity and span_start is None:
+                span_start = column
+            elif running <= capacity and span_start is not None:
+                spans.append((index, span_start, column))
+                span_start = None
+        if span_start is not None:
+            spans.append((index, span_start, day_count))
+        matrix.append(load)
+        totals.append(sum(load))
+        peaks.append(max(load, default=0))
+        over_days.append(sum(1 for value in load if value > capacity))
+    daily = [sum(column) for column in zip(*matrix)] if matrix else [0] * day_count
+    return matrix, totals, peaks, over_days, daily, spans
+
+
+def build_workload(start, end, user_ids=None, capacity=None, include_completed=False):
+    """
+    [start, end] 업무일의 담당자별 부하와 초과 할당 구간, 합계를 계산합니다.
+    user_ids가 없으면 활성 사용자 전체를 ID 순으로 포함합니다.
+    """
+    if capacity is None:
+        capacity = getattr(settings, 'WBS_WORKLOAD_CAPACITY', 1)
+    calendar = get_calendar()
+    work_days = calendar.work_days(start, end)
+    day_count = len(work_days)
+    base = calendar.workday_index(start)
+
+    users = User.objects.filter(is_active=True).order_by('id')
+    if user_ids is not None:
+        users = users.filter(pk__in=user_ids)
+    users = list(users.values_list('id', 'username', 'name'))
+    position = {user_id: index for index, (user_id, _, _) in enumerate(users)}
+
+    # 작업 구간을 업무일 열 번호 [시작, 끝)으로 바꿉니다 (같은 날짜는 한 번만 계산).
+    columns = {}
+    def to_column(day):
+        if day not in columns:
+            columns[day] = min(max(calendar.workday_index(day) - base, 0), day_count)
+        return columns[day]
+
+    rows, first, last = [], [], []
+    for user_id, task_start, task_end in assignment_intervals(start, end, include_completed):
+        row = position.get(user_id)
+        if row is None:
+            continue
+        start_column, end_column = to_column(task_start), to_column(task_end + timedelta(days=1))
+        if start_column < end_column:
+            rows.append(row)
+            first.append(start_column)
+            last.append(end_column)
+
+    paint = _paint_numpy if numpy is not None else _paint_python
+    matrix, totals, peaks, over_days, daily, spans = paint(rows, first, last, len(users), day_count, capacity)
+
+    overallocations = [[] for _ in users]
+    for row, span_start, span_end in spans:
+        overallocations[row].append({
+            'start': work_days[span_start],
+            'end': work_days[span_end - 1],
+            'days': span_end - span_start,
+            'peak': max(matrix[row][span_start:span_end]),
+        })
+
+    return {
+        'start': start,
+        'end': end,
+        'capacity': capacity,
+        'work_days': work_days,
+        'users': [
+            {
+                'user_id': user_id,
+                'username': username,
+                'name': name,
+                'load': matrix[index],
+                'total': totals[index],
+                'peak': peaks[index],
+                'overallocated_days': over_days[index],
+                'overallocations': overallocations[index],
+            }
+            for index, (user_id, username, name) in enumerate(users)
+        ],
+        'totals': {
+            'load': daily,
+            'total': sum(totals),
+            'overallocated_users': sum(1 for days in over_days if days),
+            'overallocated_days': sum(over_days),
+        },
+    }
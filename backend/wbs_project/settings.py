@@ -5,6 +5,8 @@ Django settings for wbs_project project.
 import os
 from pathlib import Path
 
+from decouple import Csv, config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -40,6 +42,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'wbs_app.middleware.QueryBudgetMiddleware',
+    'wbs_app.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -71,13 +75,55 @@ WSGI_APPLICATION = 'wbs_project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
+# 환경 변수(또는 backend/.env)로 설정합니다.
+# - DB_ENGINE: sqlite3(기본값) 또는 postgresql (기본 접속 정보는 docker-compose.yml과 같습니다)
+# - DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT
+# - DB_CONN_MAX_AGE: 연결 재사용 시간(초). 요청이 끝나도 연결을 닫지 않고, 다음 요청 시작 시 상태를 확인해 다시 씁니다.
+#   ASGI에서는 요청마다 스레드가 달라 연결이 재사용되지 않으므로 0으로 두고 PgBouncer 같은 풀러를 쓰세요.
+# - DB_DISABLE_SERVER_SIDE_CURSORS: PgBouncer 트랜잭션 풀링을 쓸 때 True (스트리밍 목록의 서버 측 커서 비활성화)
+# - DB_REPLICA_NAME / DB_REPLICA_HOST / DB_REPLICA_PORT: 읽기 복제본. 하나라도 지정하면 replica 별칭이 생기며
+#   나머지 값은 주 DB 설정을 따릅니다. 로컬에서는 DB_REPLICA_NAME에 두 번째 SQLite 파일을 지정하고
+#   copy_sqlite_replica 명령으로 복제를 흉내 낼 수 있습니다.
+DB_ENGINE = config('DB_ENGINE', default='sqlite3')
+if DB_ENGINE == 'sqlite3':
+    DB_DEFAULTS = {'NAME': str(BASE_DIR / 'db.sqlite3'), 'USER': '', 'PASSWORD': '', 'HOST': '', 'PORT': ''}
+else:
+    DB_DEFAULTS = {'NAME': 'wbs_db', 'USER': 'wbs_user', 'PASSWORD': 'wbs_password', 'HOST': 'localhost', 'PORT': '5432'}
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'ENGINE': f'django.db.backends.{DB_ENGINE}',
+        'NAME': config('DB_NAME', default=DB_DEFAULTS['NAME']),
+        'USER': config('DB_USER', default=DB_DEFAULTS['USER']),
+        'PASSWORD': config('DB_PASSWORD', default=DB_DEFAULTS['PASSWORD']),
+        'HOST': config('DB_HOST', default=DB_DEFAULTS['HOST']),
+        'PORT': config('DB_PORT', default=DB_DEFAULTS['PORT']),
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
     }
 }
 
+if config('DB_REPLICA_NAME', default='') or config('DB_REPLICA_HOST', default=''):
+    DATABASES['replica'] = dict(
+        DATABASES['default'],
+        NAME=config('DB_REPLICA_NAME', default=DATABASES['default']['NAME']),
+        HOST=config('DB_REPLICA_HOST', default=DATABASES['default']['HOST']),
+        PORT=config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        # 테스트에서는 별도 DB를 만들지 않고 주 DB를 그대로 봅니다.
+        TEST={'MIRROR': 'default'},
+    )
+
+DATABASE_ROUTERS = ['wbs_app.routers.PrimaryReplicaRouter']
+
+# 복제본에서 읽을 읽기 API (URL 이름)
+WBS_REPLICA_VIEWS = config('WBS_REPLICA_VIEWS', default=','.join([
+    'task-list', 'task-gantt-chart', 'user-list', 'taskcomment-list', 'taskdependency-list', 'timeline', 'dashboard',
+    'async_task_list', 'async_gantt_chart', 'async_timeline', 'async_dashboard',
+]), cast=Csv())
+# 쓰기 요청 뒤 그 클라이언트의 조회를 주 DB에 고정하는 시간 (초, 복제 지연보다 길게)
+WBS_REPLICA_PIN_SECONDS = config('WBS_REPLICA_PIN_SECONDS', default=10, cast=int)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -120,6 +166,16 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson 기반 JSON 렌더러/파서 (orjson이 없으면 DRF 기본 구현으로 동작)
+    'DEFAULT_RENDERER_CLASSES': [
+        'wbs_app.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'wbs_app.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
 }
@@ -149,5 +205,66 @@ CSRF_COOKIE_SECURE = False
 CSRF_COOKIE_HTTPONLY = False
 SESSION_COOKIE_SECURE = False
 
+# 업무일 계산 설정 (wbs_app.workdays)
+# WBS_HOLIDAY_SETS: 내장 휴일표 이름 목록 (예: ['KR'])
+# WBS_HOLIDAYS: 팀 휴무일 목록 ('YYYY-MM-DD')
+WBS_HOLIDAY_SETS = []
+WBS_HOLIDAYS = []
+
+# 캐시 (wbs_app.cache)
+# 기본은 프로세스별 LocMem이며, 간트 조각을 작업 수만큼 저장하므로 항목 수 상한을 넉넉히 둡니다.
+# 여러 프로세스가 캐시를 공유하려면 WBS_CACHE_DIR에 디렉터리를 지정해 파일 캐시를 사용합니다.
+WBS_CACHE_DIR = config('WBS_CACHE_DIR', default='')
+if WBS_CACHE_DIR:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': WBS_CACHE_DIR,
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'wbs',
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        }
+    }
+
+# 대시보드 캐시 유지 시간 (초), 작업/댓글 변경 시 즉시 무효화됩니다.
+WBS_DASHBOARD_CACHE_TIMEOUT = 30
+
+# 일정(주공정) 계산 결과 캐시 유지 시간 (초), 데이터 버전별 키라 변경 시 자동으로 새로 계산됩니다.
+WBS_SCHEDULE_CACHE_TIMEOUT = 300
+
+# 간트 차트 가지별 JSON 조각 캐시 유지 시간 (초), 가지 버전별 키라 변경 시 해당 가지만 새로 렌더링됩니다.
+WBS_GANTT_CACHE_TIMEOUT = 3600
+# 간트 조각 캐시 사용 여부. 가지 버전도 캐시에 있으므로 모든 워커가 같은 캐시를 써야 하며,
+# 프로세스별 캐시(LocMem)로 켜면 시스템 검사(wbs_app.E001)가 실패합니다. 기본값은 공유 캐시일 때만 켜기입니다.
+WBS_GANTT_FRAGMENT_CACHE = config('WBS_GANTT_FRAGMENT_CACHE', default=bool(WBS_CACHE_DIR), cast=bool)
+
+# 증분 동기화 변경 로그 보관 기간 (일), prune_change_log 명령이 이보다 오래된 로그를 정리합니다.
+# 마지막 동기화가 이보다 오래된 클라이언트는 410 응답을 받고 전체 목록을 다시 받습니다.
+WBS_SYNC_RETENTION_DAYS = 30
+
+# 담당자 한 명이 하루에 맡을 수 있는 작업 수 (wbs_app.workload), 넘으면 초과 할당으로 표시합니다.
+WBS_WORKLOAD_CAPACITY = 1
+
+# 실시간 변경 알림 (wbs_app.events)
+# 기본 InMemoryEventLayer는 같은 프로세스에서 일어난 변경만 전달합니다.
+# 워커가 여럿이면 변경 로그를 WBS_EVENT_POLL_SECONDS마다 폴링하는 ChangeLogEventLayer로 바꿉니다.
+WBS_EVENT_LAYER = config('WBS_EVENT_LAYER', default='wbs_app.events.InMemoryEventLayer')
+WBS_EVENT_POLL_SECONDS = config('WBS_EVENT_POLL_SECONDS', default=1.0, cast=float)
+WBS_EVENT_COALESCE_SECONDS = 0.2
+WBS_EVENT_HEARTBEAT_SECONDS = 15
+
+# 요청별 쿼리 계측 (wbs_app.middleware.QueryBudgetMiddleware)
+# WBS_QUERY_HEADERS: Server-Timing/X-DB-Queries 헤더 노출 여부 (기본값: DEBUG)
+# WBS_QUERY_BUDGET: 이 개수를 넘는 요청은 경고 로그를 남깁니다.
+# WBS_QUERY_DUPLICATE_THRESHOLD: 같은 형태의 쿼리가 이만큼 반복되면 N+1로 보고 경고합니다.
+WBS_QUERY_BUDGET = 50
+WBS_QUERY_DUPLICATE_THRESHOLD = 5
+
 # Custom user model
 AUTH_USER_MODEL = 'wbs_app.User'